@@ -11,16 +11,35 @@ Features:
 import json
 import os
 import subprocess
+import signal
 import time
 import re
 import base64
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 import threading
+import queue
+from collections import OrderedDict, deque
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import sys
+import atexit
+import selectors
+import struct
+import traceback
+
+# Terminal control for single-key interrupts (POSIX only)
+try:
+    import termios
+    import tty
+    _HAS_TTY = True
+except ImportError:
+    _HAS_TTY = False
 
 # Core dependencies
 try:
@@ -28,13 +47,12 @@ try:
     from openai import OpenAI
 except ImportError:
     print("❌ Missing required packages. Installing...")
-    import sys
     try:
         # Try installing without pyaudio first (it requires system library portaudio)
         subprocess.check_call([sys.executable, "-m", "pip", "install", "openai", "speechrecognition", "pydub"], 
                             stderr=subprocess.DEVNULL)
         print("✅ Core packages installed")
-    except:
+    except subprocess.CalledProcessError:
         # If that fails, install everything
         subprocess.check_call([sys.executable, "-m", "pip", "install", "openai", "speechrecognition", "pydub"])
     try:
@@ -42,12 +60,21 @@ except ImportError:
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyaudio"], 
                             stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
         print("✅ pyaudio installed")
-    except:
+    except subprocess.CalledProcessError:
         print("⚠️  pyaudio not installed (requires portaudio). Voice input will use fallback method.")
         print("   To install: brew install portaudio, then: pip install pyaudio")
     import speech_recognition as sr
     from openai import OpenAI
 
+import httpx  # Installed with openai (and groq)
+
+# Explicit client timeouts with SDK retries disabled - retry/fallback logic lives in
+# get_llm_response/get_groq_response, so a hung call can't stall the assistant for minutes
+LLM_HTTP_TIMEOUT = httpx.Timeout(connect=3.0, read=20.0, write=10.0, pool=3.0)
+TTS_HTTP_TIMEOUT = httpx.Timeout(connect=3.0, read=10.0, write=10.0, pool=3.0)  # Interactive path
+# Keep idle API connections open for the whole session (turns can be minutes apart)
+LLM_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300)
+
 try:
     import pyaudio
     PYAUDIO_AVAILABLE = True
@@ -55,6 +82,51 @@ except ImportError:
     PYAUDIO_AVAILABLE = False
     # pyaudio not required - speech_recognition can work without it
 
+# NumPy computes VAD frame energy in vectorized C (audioop is gone in Python 3.13+)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# audioop is deprecated and removed in Python 3.13+ (NumPy or struct are used instead)
+try:
+    import audioop
+    AUDIOOP_AVAILABLE = True
+except ImportError:
+    audioop = None
+    AUDIOOP_AVAILABLE = False
+
+# Utterances up to this long ("stop", "yes", "thanks") are transcribed on-device
+LOCAL_ASR_MAX_SECONDS = 1.5
+LOCAL_ASR_MIN_LOGPROB = -1.0  # Less confident than this - ask cloud Whisper instead
+
+# Voice-interrupt detection input format (16-bit mono)
+VAD_FRAME = 512  # Detection granularity: 32ms frames
+VAD_FRAMES_PER_READ = 3  # One stream.read covers the 3 frames needed to confirm voice
+VAD_CHUNK = VAD_FRAME * VAD_FRAMES_PER_READ  # ~96ms per read
+VAD_RATE = 16000
+# Voice = frame energy well above the running noise floor (which includes Daisy's own echo)
+VAD_NOISE_FLOOR_INIT = 500.0
+VAD_NOISE_FLOOR_ALPHA = 0.05  # EWMA weight of each quiet frame
+VAD_SNR = 3.0  # rms must exceed noise_floor * VAD_SNR
+VAD_MIN_RMS = 1500  # Absolute minimum so near-silent rooms don't trigger on breathing
+VAD_WARMUP_FRAMES = 10  # First ~320ms only train the noise floor (Daisy's echo starts loud)
+
+# orjson serializes conversation logs (incl. dataclasses) much faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# On-device speech recognition for short utterances (optional)
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
 import io
 
 # Groq SDK import (PROVEN WORKING - matches Praiser)
@@ -65,6 +137,118 @@ except ImportError:
     GROQ_AVAILABLE = False
     Groq = None
 
+# ffplay can decode MP3 from stdin, so playback starts on the first TTS chunk.
+# afplay only plays files, so it is used as the fallback when ffplay is missing.
+FFPLAY_PATH = shutil.which("ffplay")
+
+# Persistent TTS audio cache (LRU by mtime, trimmed at startup)
+TTS_CACHE_DIR = Path.home() / ".daisy" / "audio" / "cache"
+TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 200 MB
+TTS_TMP_MAX_AGE = 600  # In-flight .tmp files older than this are leftovers, whoever wrote them
+
+# LLM response cache (in-memory LRU, persisted at exit)
+LLM_CACHE_PATH = Path.home() / ".daisy" / "llm_cache.json"
+LLM_CACHE_MAX_ENTRIES = 500
+LLM_CACHE_CONTEXT_MESSAGES = 6  # Key on the last few messages, not the whole history
+LLM_CACHE_TTL = 3600  # 1 hour - entries are persisted across sessions, so they must expire
+# Answers to these change from one minute to the next - never serve them from cache
+UNCACHEABLE_PROMPT_RE = re.compile(
+    r'\b(time|date|today|tonight|tomorrow|yesterday|now|current|latest|weather|news)\b', re.I)
+
+# Sentence splitting for streamed LLM output (speak each sentence as soon as it's complete)
+# Punctuation must be followed by whitespace, so decimals like "3.5" never split.
+SENTENCE_BOUNDARY_RE = re.compile(r'[.!?]+(?=\s)')
+ABBREVIATION_RE = re.compile(r'\b(?:Dr|Mr|Mrs|Ms|St|Sr|Jr|Prof|vs|etc)\.$', re.IGNORECASE)
+MIN_SENTENCE_CHARS = 10
+
+# Text cleanup for TTS (compiled once - runs on every spoken response)
+PUNCTUATION_RE = re.compile(r'([,.!?;:])')
+WHITESPACE_RE = re.compile(r'\s+')
+REPEATED_QUESTION_RE = re.compile(r'\?+')
+
+# Voice commands that stop Daisy mid-speech - one precompiled pass over the utterance
+INTERRUPT_RE = re.compile(r'\b(?:stop(?:\s+(?:speaking|talking))?|quiet|shush|enough)\b', re.IGNORECASE)
+
+# API error classification - one pass over the (possibly long) error text
+QUOTA_ERROR_RE = re.compile(r'429|quota', re.IGNORECASE)  # Also matches insufficient_quota
+AUTH_OR_QUOTA_ERROR_RE = re.compile(r'429|401|quota', re.IGNORECASE)
+MODEL_ERROR_RE = re.compile(r'404|model_not_found|decommissioned', re.IGNORECASE)
+RATE_LIMIT_ERROR_RE = re.compile(r'429|rate_limit|503|over capacity', re.IGNORECASE)
+
+# Groq model ranking: parameter count, Llama version and model type
+MODEL_SIZE_RE = re.compile(r'(\d+)\s*b\b')
+MODEL_VERSION_SCORES = (("3.3", 3), ("3.1", 2), ("3", 1))
+MODEL_TYPE_RE = re.compile(r'versatile|instant')
+MODEL_TYPE_SCORES = {"versatile": 2, "instant": 1}
+
+
+def groq_model_priority(model: str) -> tuple:
+    """Sort key for Groq models: larger, newer, versatile models first"""
+    m = model.lower()
+    # Size (larger = better) - parameter count like "70b" in one regex pass
+    size_match = MODEL_SIZE_RE.search(m)
+    size = int(size_match.group(1)) if size_match else 0
+    # Version (newer = better)
+    version = next((score for tag, score in MODEL_VERSION_SCORES if tag in m), 0)
+    # Type (versatile > instant > others)
+    type_match = MODEL_TYPE_RE.search(m)
+    type_score = MODEL_TYPE_SCORES[type_match.group(0)] if type_match else 0
+    return (-size, -version, -type_score)
+
+
+def split_complete_sentences(buffer: str) -> Tuple[List[str], str]:
+    """Split complete sentences off a streaming buffer, returning (sentences, remainder)"""
+    sentences = []
+    start = 0
+    for match in SENTENCE_BOUNDARY_RE.finditer(buffer):
+        candidate = buffer[start:match.end()].strip()
+        # Don't split after abbreviations, and merge very short fragments into the next sentence
+        if ABBREVIATION_RE.search(candidate) or len(candidate) < MIN_SENTENCE_CHARS:
+            continue
+        sentences.append(candidate)
+        start = match.end()
+    return sentences, buffer[start:]
+
+class _KeyListener(threading.Thread):
+    """Owns stdin for the whole session - any key press while Daisy speaks interrupts her"""
+    
+    def __init__(self, owner: "DaisyAssistant"):
+        super().__init__(daemon=True, name="KeyListener")
+        self.owner = owner
+    
+    def run(self):
+        # Block on stdin and the owner's wake pipe (written when speech ends) - no polling
+        try:
+            stdin_fd = sys.stdin.fileno()
+            sel = selectors.DefaultSelector()
+            sel.register(stdin_fd, selectors.EVENT_READ)
+            sel.register(self.owner._wake_r, selectors.EVENT_READ)
+        except (OSError, ValueError):
+            # stdin closed or not selectable - keyboard interrupt unavailable
+            return
+        
+        while True:
+            # Leave stdin alone while idle so typed input isn't swallowed
+            self.owner._speaking.wait()
+            if self.owner.reading_input:
+                time.sleep(0.05)
+                continue
+            try:
+                events = sel.select(timeout=None)
+            except (OSError, ValueError):
+                return
+            for key, _ in events:
+                if key.fd == stdin_fd:
+                    if self.owner.is_speaking:
+                        # Raw read of every pending key (cbreak: returns what's there, never
+                        # blocks) - nothing is left in sys.stdin's buffer for the next input()
+                        os.read(stdin_fd, 1024)
+                        print("\n⌨️  [KEY PRESSED! - Stopping immediately...]")
+                        self.owner.stop_speaking()
+                else:
+                    self.owner._drain_wake_pipe()
+
+
 @dataclass
 class ConversationMessage:
     """Represents a message in the conversation"""
@@ -77,15 +261,25 @@ class DaisyAssistant:
     
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or Path.home() / ".daisy" / "config.json"
+        # Config writes are batched: save_config() marks the config dirty and writes
+        # at most once per CONFIG_SAVE_INTERVAL; anything pending is flushed at exit
+        self._config_dirty = False
+        self._last_config_save = 0.0
+        self.CONFIG_SAVE_INTERVAL = 30
+        self._config_mtime = 0.0  # mtime of the config file we last read or wrote
         self.config = self.load_config()
+        self._apply_voice_settings()
+        atexit.register(self.flush_config)
         self.setup_directories()
+        self.evict_tts_cache()
         
         # Initialize OpenAI client
         openai_api_key = os.getenv("OPENAI_API_KEY") or self.config.get("openai_api_key")
         self.client = None
         if openai_api_key:
             try:
-                self.client = OpenAI(api_key=openai_api_key)
+                self.client = OpenAI(api_key=openai_api_key, timeout=LLM_HTTP_TIMEOUT, max_retries=0,
+                                     http_client=httpx.Client(limits=LLM_HTTP_LIMITS))
                 print("✅ OpenAI client initialized")
             except Exception as e:
                 print(f"⚠️  OpenAI client error: {e}")
@@ -97,6 +291,7 @@ class DaisyAssistant:
         self.groq_client = None
         self.groq_models_cache = None
         self.groq_models_cache_time = 0
+        self._groq_models_lock = threading.Lock()
         self.GROQ_CACHE_TTL = 3600  # 1 hour cache (same as Praiser)
         
         # Groq working model cache (remember which model works)
@@ -110,22 +305,54 @@ class DaisyAssistant:
         else:
             self.groq_model_check_time = 0
         self.GROQ_MODEL_CHECK_INTERVAL = 3600  # Re-check working model every hour
+        # Last few models that worked (most recent first) - tried before fetching the model list
+        self.groq_model_ring: List[str] = list(self.config.get("groq_model_ring", []))
+        self.GROQ_MODEL_RING_SIZE = 3
+        
+        # Shared HTTP session for direct Groq REST calls (keep-alive, no TLS handshake per call)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self._http.mount("https://", adapter)
+        if groq_api_key:
+            self._http.headers.update({
+                "Authorization": f"Bearer {groq_api_key}",
+                "Content-Type": "application/json",
+            })
         
         if GROQ_AVAILABLE and groq_api_key:
             try:
-                self.groq_client = Groq(api_key=groq_api_key)
+                self.groq_client = Groq(api_key=groq_api_key, timeout=LLM_HTTP_TIMEOUT, max_retries=0,
+                                        http_client=httpx.Client(limits=LLM_HTTP_LIMITS))
                 print("✅ Groq client initialized")
             except Exception as e:
                 print(f"⚠️  Groq client error: {e}")
         elif GROQ_AVAILABLE and not groq_api_key:
             print("⚠️  Groq API key not found (optional fallback)")
         
+        # Open the API connections now so the first turn doesn't pay the TLS handshake
+        if self.client or self.groq_client:
+            threading.Thread(target=self._warm_api_connections, daemon=True,
+                             name="APIWarmup").start()
+        
         # Conversation history
-        self.conversation_history: List[ConversationMessage] = []
+        # System prompt is pinned separately so the bounded deque only holds the rolling turns
         self.max_history = 50  # Keep last 50 messages
+        self.CONTEXT_WINDOW = 24  # Only the last 12 user/assistant pairs are sent to the LLM
+        self.system_message: Optional[ConversationMessage] = None
+        self.conversation_history: Deque[ConversationMessage] = deque(maxlen=self.max_history)
         
         # Voice recognition
         self.recognizer = sr.Recognizer()
+        # Keep adapting the threshold on real audio between (rare) full calibrations
+        self.recognizer.dynamic_energy_threshold = True
+        self._mic_lock = threading.Lock()  # sr.Microphone can't be entered twice
+        self._ambient_calibrated_at = 0.0
+        self.AMBIENT_RECALIBRATE_INTERVAL = 60  # seconds
+        self._last_activity = time.time()
         try:
             self.microphone = sr.Microphone()
             print("✅ Microphone available")
@@ -136,20 +363,87 @@ class DaisyAssistant:
                 print("   Note: Install portaudio for full voice support: brew install portaudio")
         self.is_listening = False
         
+        # Local ASR model loads in the background (first run downloads ~40MB)
+        self._local_asr = None
+        if FASTER_WHISPER_AVAILABLE and self.microphone:
+            threading.Thread(target=self._load_local_asr, daemon=True, name="LocalASRLoader").start()
+        if self.microphone:
+            threading.Thread(target=self._recalibrate_ambient_noise, daemon=True,
+                             name="AmbientCalibrator").start()
+        
+        # Voice-interrupt (VAD) input stream: opened once, started/stopped per response
+        # (PyAudio init enumerates every device - far too slow to redo on each turn)
+        self._pa = None
+        self._vad_stream = None
+        if PYAUDIO_AVAILABLE:
+            self._open_vad_stream()
+        
         # Audio playback control (for interruption)
+        # Playback thread blocks in wait() while interrupt threads terminate the process
         self.current_audio_process = None
+        self._audio_lock = threading.Lock()
+        # is_speaking is backed by an Event so waiters block instead of polling;
+        # the self-pipe wakes selector-based waiters when speech ends
+        self._speaking = threading.Event()
+        self._idle = threading.Event()  # Inverse of _speaking (Event can't wait for clear)
+        self._idle.set()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
         self.is_speaking = False
+        # (processed text, time) of the last utterance - back-to-back duplicates are skipped
+        self._last_spoken: Tuple[str, float] = ("", 0.0)
+        self.DUPLICATE_SPEECH_WINDOW = 5  # seconds
         
         # Interrupt handling (event-based for better responsiveness)
         self.interrupt_event = threading.Event()
         self.interrupt_detected = False
         
+        # Keyboard interrupts: cbreak mode is set once for the session (restored at exit)
+        # and a single listener thread watches stdin while Daisy speaks
+        self.reading_input = False
+        self._saved_term_attrs = None
+        if _HAS_TTY and sys.stdin.isatty():
+            try:
+                self._saved_term_attrs = termios.tcgetattr(sys.stdin)
+                tty.setcbreak(sys.stdin.fileno())
+                atexit.register(self._restore_terminal)
+                _KeyListener(self).start()
+            except (termios.error, OSError) as e:
+                print(f"⚠️  [Keyboard interrupt unavailable: {str(e)[:50]}]")
+                self._saved_term_attrs = None
+        
+        # Voice interrupts: one session-wide VAD thread that wakes whenever Daisy speaks
+        if self._vad_stream is not None:
+            threading.Thread(target=self._voice_interrupt_monitor, daemon=True,
+                             name="VoiceInterruptListener").start()
+        elif not PYAUDIO_AVAILABLE:
+            print("⚠️  [VAD: pyaudio not available - use keyboard to interrupt]")
+        else:
+            print("⚠️  [VAD: no input stream - use keyboard to interrupt]")
+        
+        # Notification poster (not waited on - the loop doesn't block on osascript)
+        self._notification_process: Optional[subprocess.Popen] = None
+        
+        # Conversation logs are written by a background thread (off the conversation loop)
+        self._save_queue: "queue.Queue[Optional[Tuple[Path, Dict]]]" = queue.Queue()
+        self._save_worker = threading.Thread(target=self._conversation_writer, daemon=True,
+                                             name="ConversationWriter")
+        self._save_worker.start()
+        atexit.register(self._stop_conversation_writer)
+        
+        # LLM response cache: repeated prompts (same recent context) skip the API round-trip
+        self._llm_cache: "OrderedDict[str, Tuple[float, str]]" = self.load_llm_cache()
+        atexit.register(self.save_llm_cache)
+        self._partial_reply = False  # Last reply was cut off by an error - don't cache it
+        self._reply_model: Optional[str] = None  # "provider:model" that produced the last reply
+        
         # Quota check caching (avoid checking every request)
         self.openai_quota_exceeded = False
         self.quota_check_time = 0
         self.QUOTA_CHECK_INTERVAL = 3600  # Check once per hour (3600 seconds)
         
-        # Initialize system prompt
+        # Initialize system prompt (set once - it is the cached prompt prefix, never edit per turn)
         self.system_prompt = self.config.get(
             "system_prompt",
             """You are Daisy, a friendly and helpful personal AI assistant. 
@@ -162,24 +456,95 @@ Keep responses concise but friendly. Use natural speech patterns."""
         self.add_system_message(self.system_prompt)
         
         print("🌟 Daisy is ready!")
-        voice = self.config.get('voice', 'shimmer')
-        print(f"🎤 Voice: {voice} (human-like)")
+        print(f"🎤 Voice: {self.voice} (human-like)")
         print(f"🧠 Model: {self.config.get('llm_model', 'gpt-3.5-turbo')}")
-        tts_model = self.config.get('tts_model', 'tts-1-hd')
-        print(f"🔊 TTS: {tts_model} (high quality)")
+        print(f"🔊 TTS: {self.tts_model} (high quality)")
         print(f"💬 Fallback: macOS Samantha (natural female voice)")
         if self.groq_client:
             print(f"🔄 Groq fallback: Available")
             if self.groq_working_model:
                 print(f"   Working model: {self.groq_working_model} (cached)")
     
+    @property
+    def is_speaking(self) -> bool:
+        return self._speaking.is_set()
+    
+    @is_speaking.setter
+    def is_speaking(self, value: bool):
+        if value:
+            self._idle.clear()
+            self._speaking.set()
+        elif self._speaking.is_set():
+            self._speaking.clear()
+            self._idle.set()
+            self._wake()
+    
+    def _wake(self):
+        """Wake anything blocked in a selector on the wake pipe"""
+        try:
+            os.write(self._wake_w, b"x")
+        except BlockingIOError:
+            pass  # Pipe already full - a wake-up is pending anyway
+    
+    def _drain_wake_pipe(self):
+        """Consume pending wake-ups"""
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except BlockingIOError:
+            pass
+    
+    def _restore_terminal(self):
+        """Restore the terminal mode saved at startup"""
+        if self._saved_term_attrs is not None:
+            try:
+                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._saved_term_attrs)
+            except (termios.error, OSError):
+                pass
+    
+    def read_input(self, prompt: str) -> str:
+        """Read a typed line (temporarily back in normal line mode with echo)"""
+        self.reading_input = True
+        self._restore_terminal()
+        try:
+            return input(prompt)
+        finally:
+            if self._saved_term_attrs is not None:
+                try:
+                    tty.setcbreak(sys.stdin.fileno())
+                except (termios.error, OSError):
+                    pass
+            self.reading_input = False
+    
     def load_config(self) -> Dict:
         """Load configuration"""
         if self.config_path.exists():
+            self._config_mtime = self.config_path.stat().st_mtime
             with open(self.config_path, 'r') as f:
                 return json.load(f)
         return self.create_default_config()
     
+    def reload_config(self) -> bool:
+        """Re-read the config file if it changed on disk; returns True if it was reloaded"""
+        try:
+            mtime = self.config_path.stat().st_mtime
+        except OSError:
+            return False
+        if mtime == self._config_mtime:
+            return False  # Unchanged - skip the re-parse
+        self.config = self.load_config()
+        self._apply_voice_settings()
+        return True
+    
+    def _apply_voice_settings(self):
+        """Snapshot hot TTS settings from config (read on every spoken response)"""
+        # shimmer is more expressive/natural
+        self.voice = self.config.get("voice", "shimmer")
+        # Slightly slower speed for more natural speech (0.95-1.0)
+        self.voice_speed = float(self.config.get("voice_speed", 0.95))
+        # HD model for more human-like quality
+        self.tts_model = self.config.get("tts_model", "tts-1-hd")
+    
     def create_default_config(self) -> Dict:
         """Create default configuration"""
         config = {
@@ -200,16 +565,40 @@ with natural rhythm and emphasis.""",
             "auto_listen": True,
             "save_conversations": True,
         }
-        self.save_config(config)
+        self.save_config(config, force=True)
         return config
     
-    def save_config(self, config: Optional[Dict] = None):
-        """Save configuration"""
+    def save_config(self, config: Optional[Dict] = None, force: bool = False):
+        """Save configuration (batched - written at most once per CONFIG_SAVE_INTERVAL unless force=True)"""
         if config:
             self.config = config
+        # Callers mutate self.config and then call save_config()
+        self._config_dirty = True
+        if force or time.time() - self._last_config_save >= self.CONFIG_SAVE_INTERVAL:
+            self.flush_config()
+    
+    def flush_config(self):
+        """Write pending config changes to disk (atomic - never leaves a truncated file)"""
+        if not self._config_dirty:
+            return
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, 'w') as f:
+        tmp_path = self.config_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w') as f:
             json.dump(self.config, f, indent=2)
+        os.replace(tmp_path, self.config_path)
+        self._config_mtime = self.config_path.stat().st_mtime  # Our own write - no reload needed
+        self._config_dirty = False
+        self._last_config_save = time.time()
+    
+    def _warm_api_connections(self):
+        """Background thread: make one cheap request per client to prime its connection pool"""
+        for client in (self.client, self.groq_client):
+            if client is None:
+                continue
+            try:
+                client.models.list()
+            except Exception:
+                pass  # Warm-up only - real requests report their own errors
     
     def setup_directories(self):
         """Create necessary directories"""
@@ -217,11 +606,65 @@ with natural rhythm and emphasis.""",
             Path.home() / ".daisy",
             Path.home() / ".daisy" / "conversations",
             Path.home() / ".daisy" / "audio",
+            TTS_CACHE_DIR,
             Path.home() / ".daisy" / "logs",
         ]
         for d in dirs:
             d.mkdir(parents=True, exist_ok=True)
     
+    def _tts_tmp_is_stale(self, entry: os.DirEntry) -> bool:
+        """True if a cache .tmp file's writer has exited, or it is older than TTS_TMP_MAX_AGE"""
+        try:
+            if time.time() - entry.stat().st_mtime > TTS_TMP_MAX_AGE:
+                return True
+            pid = int(entry.name.rsplit(".", 2)[-2])
+        except (OSError, ValueError, IndexError):
+            return False
+        try:
+            os.kill(pid, 0)  # Signal 0 only checks that the process exists
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass  # Exists, owned by someone else
+        return False
+    
+    def evict_tts_cache(self, max_bytes: int = TTS_CACHE_MAX_BYTES):
+        """Delete least-recently-used cached TTS audio once the cache grows past max_bytes"""
+        try:
+            entries = []
+            for entry in os.scandir(TTS_CACHE_DIR):
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith(".tmp"):
+                    # <key>.<pid>.tmp - only remove leftovers, never another running
+                    # Daisy's in-flight synthesis
+                    if self._tts_tmp_is_stale(entry):
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            print(f"⚠️  TTS cache scan failed: {e}")
+            return
+        
+        total = sum(size for _, size, _ in entries)
+        if total <= max_bytes:
+            return
+        
+        # Oldest (least recently played) first
+        entries.sort()
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+    
     def add_message(self, role: str, content: str):
         """Add a message to conversation history"""
         message = ConversationMessage(
@@ -229,216 +672,317 @@ with natural rhythm and emphasis.""",
             content=content,
             timestamp=datetime.now().isoformat()
         )
-        self.conversation_history.append(message)
-        
-        # Keep history within limit
-        if len(self.conversation_history) > self.max_history:
-            # Keep system message, remove oldest non-system messages
-            system_msgs = [m for m in self.conversation_history if m.role == 'system']
-            other_msgs = [m for m in self.conversation_history if m.role != 'system']
-            self.conversation_history = system_msgs + other_msgs[-self.max_history+1:]
+        if role == 'system':
+            # Only one system prompt - a new one replaces the old
+            self.system_message = message
+        else:
+            # deque(maxlen=...) drops the oldest message automatically
+            self.conversation_history.append(message)
     
     def add_system_message(self, content: str):
         """Add system message"""
         self.add_message('system', content)
     
+    def _all_messages(self) -> List[ConversationMessage]:
+        """System message (if any) followed by the rolling history"""
+        messages = [self.system_message] if self.system_message else []
+        messages.extend(self.conversation_history)
+        return messages
+    
     def get_conversation_context(self) -> List[Dict]:
         """Get conversation context for LLM"""
-        return [
+        # Provider prompt caching (Groq/OpenAI) matches on an exact message prefix.
+        # Always start with exactly one system message built from the fixed
+        # self.system_prompt, then the rolling turns - reordering these, or putting
+        # anything time-varying into the system prompt, breaks the cache.
+        # Put per-turn context (time, user info) in the user message instead.
+        context = [{"role": "system", "content": self.system_prompt}]
+        # Bounded window - input tokens per request stay flat instead of growing every turn
+        context.extend(
             {"role": msg.role, "content": msg.content}
-            for msg in self.conversation_history
-        ]
+            for msg in list(self.conversation_history)[-self.CONTEXT_WINDOW:]
+        )
+        return context
+    
+    def _cached_groq_models(self) -> Optional[List[str]]:
+        """Cached Groq model list if still fresh, else None"""
+        if (self.groq_models_cache and
+            time.time() - self.groq_models_cache_time < self.GROQ_CACHE_TTL):
+            return self.groq_models_cache
+        return None
     
     def fetch_groq_models(self) -> List[str]:
         """
         Fetch models dynamically from Groq API (PROVEN - matches Praiser implementation)
         No hardcoded models - API key determines what's available
         """
-        # Check cache first (1 hour TTL like Praiser)
-        now = time.time()
-        if (self.groq_models_cache and 
-            now - self.groq_models_cache_time < self.GROQ_CACHE_TTL):
-            return self.groq_models_cache
-        
-        groq_api_key = os.getenv("GROQ_API_KEY") or self.config.get("groq_api_key")
-        if not groq_api_key:
-            return []
+        # Check cache first (1 hour TTL like Praiser) - lock-free fast path
+        cached = self._cached_groq_models()
+        if cached is not None:
+            return cached
         
-        try:
-            # PROVEN WORKING: Direct HTTP call (same as Praiser)
-            response = requests.get(
-                "https://api.groq.com/openai/v1/models",
-                headers={
-                    "Authorization": f"Bearer {groq_api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=10
-            )
+        # One fetch at a time - concurrent callers wait and reuse its result
+        with self._groq_models_lock:
+            cached = self._cached_groq_models()
+            if cached is not None:
+                return cached
             
-            if not response.ok:
-                raise Exception(f"Groq API error: {response.status_code}")
+            now = time.time()
+            groq_api_key = os.getenv("GROQ_API_KEY") or self.config.get("groq_api_key")
+            if not groq_api_key:
+                return []
             
-            data = response.json()
-            all_models = [model["id"] for model in data.get("data", [])]
+            try:
+                # PROVEN WORKING: Direct HTTP call (same as Praiser)
+                # Auth headers are set once on the shared session in __init__
+                response = self._http.get(
+                    "https://api.groq.com/openai/v1/models",
+                    timeout=10
+                )
             
-            # Filter out non-conversation models (TTS, guard, whisper, compound)
-            exclude_patterns = ["tts", "whisper", "guard", "compound", "decommissioned"]
-            conversation_models = [
-                m for m in all_models
-                if not any(pattern in m.lower() for pattern in exclude_patterns)
-            ]
+                if not response.ok:
+                    raise Exception(f"Groq API error: {response.status_code}")
             
-            # Smart sorting: Larger/newer models first (no hardcoded list)
-            def model_priority(model: str) -> tuple:
-                """Sort by size, version, type - dynamically"""
-                m = model.lower()
-                # Size (larger = better)
-                size = 0
-                for val in [120, 70, 32, 20, 17, 8]:
-                    if str(val) in m or f"{val}b" in m:
-                        size = val
-                        break
-                # Version (newer = better)
-                version = 3 if "3.3" in m else (2 if "3.1" in m else (1 if "3" in m else 0))
-                # Type (versatile > instant > others)
-                type_score = 2 if "versatile" in m else (1 if "instant" in m else 0)
-                return (-size, -version, -type_score)
+                data = response.json()
+                all_models = [model["id"] for model in data.get("data", [])]
             
-            sorted_models = sorted(conversation_models, key=model_priority)
+                # Filter out non-conversation models (TTS, guard, whisper, compound)
+                exclude_patterns = ["tts", "whisper", "guard", "compound", "decommissioned"]
+                conversation_models = [
+                    m for m in all_models
+                    if not any(pattern in m.lower() for pattern in exclude_patterns)
+                ]
             
-            # Cache result
-            self.groq_models_cache = sorted_models
-            self.groq_models_cache_time = now
+                # Smart sorting: Larger/newer models first (no hardcoded list)
+                sorted_models = sorted(conversation_models, key=groq_model_priority)
             
-            print(f"✅ Fetched {len(sorted_models)} Groq models dynamically")
-            if sorted_models:
-                print(f"   Top model: {sorted_models[0]}")
-            return sorted_models
+                # Cache result
+                self.groq_models_cache = sorted_models
+                self.groq_models_cache_time = now
             
-        except Exception as e:
-            print(f"⚠️  Failed to fetch Groq models: {e}")
-            return []
+                print(f"✅ Fetched {len(sorted_models)} Groq models dynamically")
+                if sorted_models:
+                    print(f"   Top model: {sorted_models[0]}")
+                return sorted_models
+            
+            except Exception as e:
+                print(f"⚠️  Failed to fetch Groq models: {e}")
+                return []
+    
+    
+    def _chat_complete(self, client, model: str, messages: List[Dict],
+                       on_sentence: Optional[Callable[[str], None]] = None) -> str:
+        """Run one chat completion on an OpenAI-compatible client
+        
+        Streamed sentence-by-sentence if on_sentence is given, so speech can start
+        on the first sentence while the rest is still being generated.
+        """
+        if on_sentence is None:
+            response = client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=500
+            )
+            return response.choices[0].message.content
+        
+        # Stream tokens and hand off each complete sentence while generation continues
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=500,
+            stream=True
+        )
+        parts = []
+        buffer = ""
+        for chunk in stream:
+            if self.interrupt_event.is_set():
+                # User interrupted - drop the rest of the generation
+                stream.close()
+                return "".join(parts)
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            if not delta:
+                continue
+            parts.append(delta)
+            buffer += delta
+            sentences, buffer = split_complete_sentences(buffer)
+            for sentence in sentences:
+                on_sentence(sentence)
+        # Flush whatever is left when the stream ends
+        if buffer.strip():
+            on_sentence(buffer.strip())
+        return "".join(parts)
+    
+    def _track_sentences(self, on_sentence: Optional[Callable[[str], None]]):
+        """Wrap on_sentence so the sentences already handed off for speaking are recorded
+        
+        Returns (callback, spoken). Once anything is spoken, a failed request must not
+        be retried with a fresh stream - the user would hear the reply start over.
+        """
+        spoken = []
+        if on_sentence is None:
+            return None, spoken
+        
+        def emit(sentence: str):
+            spoken.append(sentence)
+            on_sentence(sentence)
+        return emit, spoken
+    
+    def _keep_partial_reply(self, spoken: List[str], error: Exception) -> str:
+        """Keep the sentences already spoken as the reply after a mid-stream failure"""
+        print(f"⚠️  Reply cut off by error: {str(error)[:100]}")
+        self._partial_reply = True
+        partial = " ".join(spoken)
+        self.add_message('assistant', partial)
+        return partial
+    
+    def _groq_complete(self, model: str, messages: List[Dict],
+                       on_sentence: Optional[Callable[[str], None]] = None) -> str:
+        """Run one Groq chat completion (streamed sentence-by-sentence if on_sentence is given)"""
+        return self._chat_complete(self.groq_client, model, messages, on_sentence)
+    
+    def _groq_complete_interruptible(self, model: str, messages: List[Dict],
+                                     on_sentence: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """Run _groq_complete; returns None if interrupted
+        
+        A streamed call stops at the next chunk after an interrupt (the stream is closed).
+        A plain call can't be cancelled once sent, so it runs on its own thread and is
+        abandoned - it ends within LLM_HTTP_TIMEOUT without holding up the next turn.
+        """
+        if on_sentence is not None:
+            message = self._groq_complete(model, messages, on_sentence)
+            return None if self.interrupt_event.is_set() else message
+        
+        result = {}
+        
+        def request():
+            try:
+                result["message"] = self._groq_complete(model, messages)
+            except Exception as e:
+                result["error"] = e
+        
+        worker = threading.Thread(target=request, daemon=True, name="GroqRequest")
+        worker.start()
+        while worker.is_alive():
+            worker.join(timeout=0.02)
+            if self.interrupt_event.is_set():
+                return None
+        if "error" in result:
+            raise result["error"]
+        return result["message"]
     
-    def get_groq_response(self, messages: List[Dict]) -> str:
-        """Get response from Groq - use cached working model (re-check every hour)"""
+    def _remember_groq_model(self, model: str):
+        """Record a model that just worked (working model + recent-success ring, saved to config)"""
+        self.groq_working_model = model
+        self.groq_model_check_time = time.time()
+        self.groq_model_ring = ([model] + [m for m in self.groq_model_ring if m != model])[:self.GROQ_MODEL_RING_SIZE]
+        self.config["groq_working_model"] = model
+        self.config["groq_model_check_time"] = self.groq_model_check_time
+        self.config["groq_model_ring"] = self.groq_model_ring
+        self.save_config()
+    
+    def _groq_model_candidates(self):
+        """Models to try in order: last working model, recent successes, then the full list
+        
+        The model list is only fetched if every known-good model fails.
+        """
+        if self.groq_working_model:
+            yield self.groq_working_model
+        yield from list(self.groq_model_ring)
+        yield from self.fetch_groq_models()
+    
+    def get_groq_response(self, messages: List[Dict],
+                          on_sentence: Optional[Callable[[str], None]] = None) -> str:
+        """Get response from Groq - try known-good models first, fetch the model list only if they fail"""
         if not self.groq_client:
             return "I'm sorry, Groq is not available."
         
-        # Check if we have a cached working model
-        now = time.time()
-        use_cached_model = False
+        on_sentence, spoken = self._track_sentences(on_sentence)
+        tried = set()
+        last_error = None
         
-        if self.groq_working_model:
-            # Check if cache is still valid (1 hour)
-            # Handle case where check_time might be 0 or None
-            check_time = self.groq_model_check_time or 0
-            if check_time > 0 and (now - check_time < self.GROQ_MODEL_CHECK_INTERVAL):
-                # Use cached working model directly - no searching!
-                use_cached_model = True
-                print(f"💡 Using cached Groq model: {self.groq_working_model}")
-                
-                # Try the cached model first
-                try:
-                    response = self.groq_client.chat.completions.create(
-                        model=self.groq_working_model,
-                        messages=messages,
-                        temperature=0.7,
-                        max_tokens=500
-                    )
-                    
-                    assistant_message = response.choices[0].message.content
-                    # Handle None or empty response
-                    if not assistant_message or assistant_message.strip() == "":
-                        assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
-                    elif not isinstance(assistant_message, str):
-                        assistant_message = str(assistant_message)
-                    
-                    # Update cache time
-                    self.groq_model_check_time = time.time()
-                    self.config["groq_model_check_time"] = self.groq_model_check_time
-                    self.save_config()
-                    
-                    self.add_message('assistant', assistant_message)
-                    print(f"✅ Response from Groq ({self.groq_working_model})")
-                    return assistant_message
-                except Exception as e:
-                    # Cached model failed - clear cache and search for new one
-                    error_str = str(e)
-                    if any(x in error_str.lower() for x in ["404", "model_not_found", "decommissioned"]):
-                        print(f"⚠️  Cached model {self.groq_working_model} no longer available - searching for new one...")
-                    else:
-                        print(f"⚠️  Cached model {self.groq_working_model} failed - searching for new one...")
-                    self.groq_working_model = None
-                    use_cached_model = False
-        
-        # No cached model or cache expired - fetch and try models
-        if not use_cached_model:
-            # Fetch models dynamically (no hardcoding)
-            models = self.fetch_groq_models()
-            if not models:
-                return "I'm sorry, no Groq models are available."
+        for model in self._groq_model_candidates():
+            if model in tried:
+                continue
+            tried.add(model)
             
-            last_error = None
+            if model == self.groq_working_model:
+                # Even after the hourly check expires, a real request is the cheapest
+                # way to confirm the cached model still works
+                check_time = self.groq_model_check_time or 0
+                if check_time > 0 and (time.time() - check_time < self.GROQ_MODEL_CHECK_INTERVAL):
+                    print(f"💡 Using cached Groq model: {model}")
+                else:
+                    print(f"🔄 Re-checking cached Groq model: {model}")
+            else:
+                print(f"🔄 Trying Groq model: {model}")
             
-            # Try each model until one works
-            for model in models:
-                try:
-                    print(f"🔄 Trying Groq model: {model}")
-                    
-                    # PROVEN WORKING: Use Groq SDK for chat (same as Praiser)
-                    response = self.groq_client.chat.completions.create(
-                        model=model,
-                        messages=messages,
-                        temperature=0.7,
-                        max_tokens=500
-                    )
-                    
-                    assistant_message = response.choices[0].message.content
-                    # Handle None or empty response
-                    if not assistant_message or assistant_message.strip() == "":
-                        assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
-                    elif not isinstance(assistant_message, str):
-                        assistant_message = str(assistant_message)
-                    
-                    # Cache this working model for 1 hour (save to config)
-                    self.groq_working_model = model
-                    self.groq_model_check_time = time.time()
-                    self.config["groq_working_model"] = model
-                    self.config["groq_model_check_time"] = self.groq_model_check_time
-                    self.save_config()
-                    
-                    self.add_message('assistant', assistant_message)
-                    print(f"✅ Response from Groq ({model}) - cached for 1 hour")
-                    return assistant_message
-                        
-                except Exception as e:
-                    last_error = e
-                    error_str = str(e)
+            try:
+                # PROVEN WORKING: Use Groq SDK for chat (same as Praiser)
+                assistant_message = self._groq_complete_interruptible(model, messages, on_sentence)
+                if assistant_message is None:
+                    print("🔇 [Response interrupted]")
+                    # Keep what was already spoken, like the OpenAI path does
+                    partial = " ".join(spoken)
+                    if partial:
+                        self.add_message('assistant', partial)
+                    return partial
+                # Handle None or empty response
+                if not assistant_message or assistant_message.strip() == "":
+                    assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
+                elif not isinstance(assistant_message, str):
+                    assistant_message = str(assistant_message)
+                
+                # Cache this working model for 1 hour (save to config)
+                self._remember_groq_model(model)
+                
+                self.add_message('assistant', assistant_message)
+                self._reply_model = "groq:" + model
+                print(f"✅ Response from Groq ({model}) - cached for 1 hour")
+                return assistant_message
                     
-                    # Skip model if not found or decommissioned
-                    if any(x in error_str.lower() for x in ["404", "model_not_found", "decommissioned"]):
-                        print(f"⚠️  Model {model} not available, trying next...")
-                        continue
-                    # Try next on rate limit
-                    if any(x in error_str.lower() for x in ["429", "rate_limit", "503", "over capacity"]):
-                        print(f"⚠️  Model {model} rate limited, trying next...")
-                        continue
-                    # Other errors - still try next
-                    print(f"⚠️  Model {model} error, trying next...")
+            except Exception as e:
+                if spoken:
+                    # Part of the reply is already being spoken - the next model would repeat it
+                    return self._keep_partial_reply(spoken, e)
+                last_error = e
+                error_str = str(e)
+                if model == self.groq_working_model:
+                    # Cached model failed - search for a new one
+                    self.groq_working_model = None
+                
+                # Skip model if not found or decommissioned
+                if MODEL_ERROR_RE.search(error_str):
+                    print(f"⚠️  Model {model} not available, trying next...")
+                    self.groq_model_ring = [m for m in self.groq_model_ring if m != model]
                     continue
-            
-            # All models failed - clear working model cache
-            self.groq_working_model = None
-            self.groq_model_check_time = 0
-            if "groq_working_model" in self.config:
-                del self.config["groq_working_model"]
-            if "groq_model_check_time" in self.config:
-                del self.config["groq_model_check_time"]
-            self.save_config()
-            
-            error_msg = f"I'm sorry, all Groq models failed. Last error: {str(last_error)[:100] if last_error else 'Unknown'}"
-            self.add_message('assistant', error_msg)
-            return error_msg
+                # Try next on rate limit
+                if RATE_LIMIT_ERROR_RE.search(error_str):
+                    print(f"⚠️  Model {model} rate limited, trying next...")
+                    continue
+                # Other errors - still try next
+                print(f"⚠️  Model {model} error, trying next...")
+                continue
+        
+        if not tried:
+            return "I'm sorry, no Groq models are available."
+        
+        # All models failed - clear working model cache
+        self.groq_working_model = None
+        self.groq_model_check_time = 0
+        if "groq_working_model" in self.config:
+            del self.config["groq_working_model"]
+        if "groq_model_check_time" in self.config:
+            del self.config["groq_model_check_time"]
+        self.config["groq_model_ring"] = self.groq_model_ring
+        self.save_config()
+        
+        error_msg = f"I'm sorry, all Groq models failed. Last error: {str(last_error)[:100] if last_error else 'Unknown'}"
+        self.add_message('assistant', error_msg)
+        return error_msg
     
     def stop_speaking(self):
         """Immediately stop Daisy from speaking (interrupt)"""
@@ -451,44 +995,26 @@ with natural rhythm and emphasis.""",
         print("\n🔇 [Stopping speech...]")
         
         # Kill the current audio process FIRST (most important)
-        if self.current_audio_process and self.current_audio_process.poll() is None:
+        # Terminating it wakes the playback thread blocked in wait() immediately
+        with self._audio_lock:
+            proc = self.current_audio_process
+        if proc and proc.poll() is None:
+            # Players run in their own process group, so signal the whole group
             try:
-                # Terminate the process
-                self.current_audio_process.terminate()
-                try:
-                    self.current_audio_process.wait(timeout=0.2)
-                except:
-                    pass
-            except:
-                pass
-                
-            # Force kill if still running
-            if self.current_audio_process and self.current_audio_process.poll() is None:
+                os.killpg(proc.pid, signal.SIGTERM)
+                proc.wait(timeout=0.05)
+            except subprocess.TimeoutExpired:
+                # Didn't exit on SIGTERM - force kill (can't be ignored; the wait just reaps it)
                 try:
-                    self.current_audio_process.kill()
-                    self.current_audio_process.wait(timeout=0.1)
-                except:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                    proc.wait(timeout=0.1)
+                except (ProcessLookupError, PermissionError, subprocess.TimeoutExpired):
                     pass
-        
-        # Kill ALL say processes (force kill with -9 signal) - do this multiple times
-        for _ in range(2):  # Try twice to make sure
-            try:
-                subprocess.run(["pkill", "-9", "say"], check=False,
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except:
-                pass
-            time.sleep(0.1)  # Small delay between attempts
-        
-        # Kill afplay processes too (force kill) - try multiple times
-        for _ in range(2):
-            try:
-                subprocess.run(["pkill", "-9", "afplay"], check=False, 
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except:
+            except (ProcessLookupError, PermissionError):
                 pass
-            time.sleep(0.1)
         
-        self.current_audio_process = None
+        with self._audio_lock:
+            self.current_audio_process = None
         print("✅ [Speech stopped - ready to listen]")
     
     def _process_text_for_natural_speech(self, text: str) -> str:
@@ -502,41 +1028,39 @@ with natural rhythm and emphasis.""",
             return "I'm sorry, I couldn't understand that."
         
         # Add natural pauses after commas, periods, questions
-        text = re.sub(r'([,.!?;:])', r'\1 ', text)  # Space after punctuation
-        text = re.sub(r'\s+', ' ', text)  # Clean up multiple spaces
-        
-        # Add slight pauses for natural flow (use SSML-like pauses with commas)
-        # Break up long sentences with natural pauses
-        sentences = re.split(r'([.!?])', text)
-        processed = []
-        for i, part in enumerate(sentences):
-            if part.strip():
-                processed.append(part.strip())
-                # Add pause after sentence endings
-                if i < len(sentences) - 1 and sentences[i+1] in ['.', '!', '?']:
-                    pass  # Natural pause will come from punctuation
-        text = ' '.join(processed)
+        text = PUNCTUATION_RE.sub(r'\1 ', text)  # Space after punctuation
+        text = WHITESPACE_RE.sub(' ', text)  # Clean up multiple spaces
         
         # Make questions sound more natural
-        text = re.sub(r'\?+', '?', text)  # Multiple ? to single
+        text = REPEATED_QUESTION_RE.sub('?', text)  # Multiple ? to single
         
         return text.strip()
     
     def text_to_speech(self, text: str) -> Optional[bytes]:
         """Convert text to speech using OpenAI TTS with human-like female voice (interruptible)"""
+        # Nothing audible to say (empty / whitespace / punctuation only) - skip synthesis
+        if isinstance(text, str) and sum(c.isalnum() for c in text) < 2:
+            return None
+        
+        # Process text for more natural speech patterns
+        processed_text = self._process_text_for_natural_speech(text)
+        
+        # Same text was just spoken (retry / duplicate fallback message) - don't repeat it
+        now = time.time()
+        last_text, last_time = self._last_spoken
+        if processed_text == last_text and now - last_time < self.DUPLICATE_SPEECH_WINDOW:
+            return None
+        self._last_spoken = (processed_text, now)
+        self._last_activity = now
+        
         # Stop any currently playing audio
         self.stop_speaking()
         
         try:
-            # Use shimmer voice for more natural, expressive sound (more human-like)
-            voice = self.config.get("voice", "shimmer")  # shimmer is more expressive/natural
-            # Slightly slower speed for more natural speech (0.95-1.0)
-            speed = self.config.get("voice_speed", 0.95)
-            # Use HD model for more human-like quality
-            tts_model = self.config.get("tts_model", "tts-1-hd")
-            
-            # Process text for more natural speech patterns
-            processed_text = self._process_text_for_natural_speech(text)
+            # Voice settings are snapshotted from config (see _apply_voice_settings)
+            voice = self.voice
+            speed = self.voice_speed
+            tts_model = self.tts_model
             
             # Check if we've cached quota exceeded for TTS
             now = time.time()
@@ -548,57 +1072,121 @@ with natural rhythm and emphasis.""",
                 self.interrupt_detected = False
                 raise Exception("Quota exceeded (cached)")
             
-            # Use tts-1-hd for higher quality, more human-like voice
-            response = self.client.audio.speech.create(
-                model=tts_model,  # Higher quality for more natural, human-like voice
-                voice=voice,
-                input=processed_text,
-                speed=speed
-            )
-            
-            # Save audio file
-            audio_dir = Path.home() / ".daisy" / "audio"
-            audio_file = audio_dir / f"daisy_{int(time.time())}.mp3"
+            # Cache key covers everything that changes the synthesized audio
+            cache_key = hashlib.sha256(
+                f"{voice}|{tts_model}|{speed}|{processed_text}".encode("utf-8")
+            ).hexdigest()
+            audio_file = TTS_CACHE_DIR / f"{cache_key}.mp3"
             
-            # Write audio to file
-            audio_data = b""
-            for chunk in response.iter_bytes():
-                audio_data += chunk
-            
-            with open(audio_file, 'wb') as f:
-                f.write(audio_data)
-            
-            # Play audio using macOS afplay (interruptible)
-            self.is_speaking = True
-            # Reset interrupt flags before starting
-            self.interrupt_event.clear()
-            self.interrupt_detected = False
-            self.current_audio_process = subprocess.Popen(
-                ["afplay", str(audio_file)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE
-            )
+            if audio_file.exists():
+                # Cache hit - skip the OpenAI call and play the stored audio
+                os.utime(audio_file)  # Mark as recently used (LRU by mtime)
+                audio_data = b""  # Callers don't use the audio bytes - don't read the file back
+                self.is_speaking = True
+                self.interrupt_event.clear()
+                self.interrupt_detected = False
+                # Same player as the cache-miss path
+                if FFPLAY_PATH:
+                    cmd = [FFPLAY_PATH, "-nodisp", "-autoexit", "-loglevel", "quiet", str(audio_file)]
+                else:
+                    cmd = ["afplay", str(audio_file)]
+                self.current_audio_process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    start_new_session=True  # Own process group - stop_speaking() signals the group
+                )
+            else:
+                # Cache miss - stream from OpenAI, writing to a temp file that is
+                # only moved into the cache once the full audio has arrived
+                tmp_file = audio_file.with_name(f"{cache_key}.{os.getpid()}.tmp")
+                completed = False
+                
+                # Stream TTS audio as it is synthesized (don't wait for the full MP3)
+                with self.client.with_options(timeout=TTS_HTTP_TIMEOUT).audio.speech.with_streaming_response.create(
+                    model=tts_model,  # Higher quality for more natural, human-like voice
+                    voice=voice,
+                    input=processed_text,
+                    speed=speed
+                ) as response:
+                    # Reset interrupt flags before starting
+                    self.is_speaking = True
+                    self.interrupt_event.clear()
+                    self.interrupt_detected = False
+                    audio_data = bytearray()  # Grows in place (bytes += would copy every chunk)
+                    
+                    player = None
+                    if FFPLAY_PATH:
+                        # Pipe chunks straight into ffplay - playback starts on the first chunk
+                        self.current_audio_process = subprocess.Popen(
+                            [FFPLAY_PATH, "-nodisp", "-autoexit", "-loglevel", "quiet", "-i", "pipe:0"],
+                            stdin=subprocess.PIPE,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE,
+                            start_new_session=True
+                        )
+                        player = self.current_audio_process
+                    
+                    try:
+                        with open(tmp_file, 'wb') as f:
+                            for chunk in response.iter_bytes(chunk_size=4096):
+                                if not self.is_speaking:
+                                    # Interrupted while still streaming
+                                    break
+                                audio_data.extend(chunk)
+                                f.write(chunk)
+                                if player:
+                                    player.stdin.write(chunk)
+                            else:
+                                completed = True
+                    except (BrokenPipeError, OSError):
+                        # Player was killed (interrupt) - stop streaming
+                        pass
+                    finally:
+                        if player:
+                            try:
+                                player.stdin.close()
+                            except (BrokenPipeError, OSError):
+                                pass
+                
+                if completed:
+                    # Atomic rename - a partially written file never appears in the cache
+                    try:
+                        os.replace(tmp_file, audio_file)
+                    except OSError as e:
+                        if player is None:
+                            raise  # Nothing played yet - the say fallback speaks it instead
+                        # Already played through ffplay - just leave it out of the cache
+                        print(f"⚠️  Could not cache TTS audio: {e}")
+                else:
+                    tmp_file.unlink(missing_ok=True)
+                
+                if player is None and completed:
+                    # No ffplay - play the finished file with macOS afplay (interruptible)
+                    self.current_audio_process = subprocess.Popen(
+                        ["afplay", str(audio_file)],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        start_new_session=True
+                    )
             
-            # Poll while playing (so we can interrupt)
-            while self.current_audio_process.poll() is None:
-                if not self.is_speaking:
-                    # Was interrupted - already stopped
-                    break
-                time.sleep(0.1)  # Check every 100ms
+            # Block until playback ends - stop_speaking() terminates the process to interrupt
+            with self._audio_lock:
+                player = self.current_audio_process
+            if player:
+                player.wait()
             
             self.is_speaking = False
-            if self.current_audio_process:
-                self.current_audio_process = None
-            
-            # Clean up after a delay (optional)
-            threading.Timer(10.0, lambda: audio_file.unlink() if audio_file.exists() else None).start()
+            with self._audio_lock:
+                if self.current_audio_process is player:
+                    self.current_audio_process = None
             
-            return audio_data
+            return bytes(audio_data)
             
         except Exception as e:
             error_str = str(e)
             # Check for quota errors
-            if "429" in error_str or "quota" in error_str.lower() or "insufficient_quota" in error_str:
+            if QUOTA_ERROR_RE.search(error_str):
                 self.openai_quota_exceeded = True
                 self.quota_check_time = time.time()
                 print("⚠️  OpenAI TTS quota exceeded - using macOS voice fallback")
@@ -612,8 +1200,6 @@ with natural rhythm and emphasis.""",
             self.interrupt_event.clear()
             self.interrupt_detected = False
             
-            processed_text = self._process_text_for_natural_speech(text)
-            
             # Use the most natural female voice on macOS
             # Samantha is the most natural-sounding, Karen is more expressive
             # Try Samantha first (most human-like), fallback to Karen
@@ -624,11 +1210,23 @@ with natural rhythm and emphasis.""",
             # Pitch 52: natural female pitch (slightly higher = more expressive)
             # These settings create a more human-like, conversational tone
             # IMPORTANT: Don't redirect stderr - let errors show, and don't use DEVNULL for say command
+            # Pre-rendered say audio is cached too - repeats play with afplay, no synthesis
+            # (say has no persistent/streaming mode - it only speaks stdin at EOF - so a
+            # process per utterance is unavoidable; the cache is what removes repeat cost)
+            say_key = hashlib.sha256(f"say|{fallback_voice}|165|{processed_text}".encode("utf-8")).hexdigest()
+            say_file = TTS_CACHE_DIR / f"{say_key}.aiff"
             try:
+                if say_file.exists():
+                    os.utime(say_file)  # Mark as recently used (LRU by mtime)
+                    say_args = ["afplay", str(say_file)]
+                else:
+                    say_args = ["say", "-v", fallback_voice, "-r", "165", processed_text]
+                    self._render_say_to_cache(say_args, say_file)
                 self.current_audio_process = subprocess.Popen(
-                    ["say", "-v", fallback_voice, "-r", "165", processed_text],
+                    say_args,
                     stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
+                    stderr=subprocess.PIPE,
+                    start_new_session=True
                 )
             except Exception as say_error:
                 print(f"⚠️  Error with say command: {say_error}")
@@ -637,7 +1235,8 @@ with natural rhythm and emphasis.""",
                     self.current_audio_process = subprocess.Popen(
                         ["say", "-v", fallback_voice, processed_text],
                         stdout=subprocess.DEVNULL,
-                        stderr=subprocess.PIPE
+                        stderr=subprocess.PIPE,
+                        start_new_session=True
                     )
                 except Exception as say_error2:
                     print(f"❌ Cannot use macOS say command: {say_error2}")
@@ -646,98 +1245,55 @@ with natural rhythm and emphasis.""",
                     return None
             
             # Wait for audio to finish playing (interruptible)
-            # Poll instead of blocking wait, so we can check for interrupts
-            start_time = time.time()
+            # Blocking wait - stop_speaking() terminates the process to interrupt
+            # (keyboard and voice interrupts come from the listener threads)
             max_duration = 300  # Max 5 minutes per response
-            
-            # Also check for keyboard input in this loop (most reliable place)
-            import sys
-            import select
-            
-            # Set stdin to non-blocking mode for keyboard detection
-            old_settings = None
-            import termios
-            import tty
-            try:
-                if sys.stdin.isatty():
-                    old_settings = termios.tcgetattr(sys.stdin)
-                    # Set to non-blocking raw mode for single character input
-                    tty.setcbreak(sys.stdin.fileno())
-            except:
-                old_settings = None
-            
-            try:
-                while self.current_audio_process.poll() is None:
-                    # Check for keyboard interrupt FIRST (works while audio is playing)
-                    try:
-                        if sys.stdin.isatty() and old_settings is not None:
-                            # Check if any key was pressed (non-blocking, 50ms timeout)
-                            ready, _, _ = select.select([sys.stdin], [], [], 0.05)
-                            if ready:
-                                # Key pressed - interrupt immediately
-                                char = sys.stdin.read(1)
-                                print(f"\n⌨️  [KEY PRESSED! - Stopping immediately...]")
-                                self.stop_speaking()
-                                break
-                    except (OSError, ValueError, KeyboardInterrupt):
-                        # Terminal errors - just use flags instead
-                        pass
-                    except Exception:
-                        pass  # Ignore other errors
-                    
-                    # Check for interrupt event or flags
-                    if self.interrupt_event.is_set() or not self.is_speaking or self.interrupt_detected:
-                        # Was interrupted - stop audio process immediately
-                        print("🔇 [Audio playback interrupted - stopping now]")
-                        # Force kill the audio process
-                        if self.current_audio_process and self.current_audio_process.poll() is None:
-                            try:
-                                self.current_audio_process.terminate()
-                                time.sleep(0.05)  # Very short wait
-                                if self.current_audio_process.poll() is None:
-                                    self.current_audio_process.kill()
-                                    time.sleep(0.05)
-                            except:
-                                pass
-                        # Also kill all say/afplay processes immediately
-                        try:
-                            subprocess.run(["pkill", "-9", "say"], check=False,
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                            subprocess.run(["pkill", "-9", "afplay"], check=False,
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        except:
-                            pass
-                        break
-                    
-                    # Check if audio is taking too long (might be stuck)
-                    if time.time() - start_time > max_duration:
-                        print("⚠️  [Audio playback taking too long - stopping]")
-                        self.stop_speaking()
-                        break
-            finally:
-                # Restore terminal settings
-                if old_settings:
+            with self._audio_lock:
+                player = self.current_audio_process
+            if player:
+                try:
+                    player.wait(timeout=max_duration)
+                except subprocess.TimeoutExpired:
+                    # Audio is taking too long (might be stuck)
+                    print("⚠️  [Audio playback taking too long - stopping]")
+                    self.stop_speaking()
+                
+                # Check if process completed successfully (not killed by an interrupt)
+                if player.returncode not in (0, None) and not self.interrupt_detected:
+                    # Process failed - check stderr for errors
                     try:
-                        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-                    except:
+                        stderr_output = player.stderr.read().decode() if player.stderr else ""
+                        if stderr_output:
+                            print(f"⚠️  Audio playback error: {stderr_output[:100]}")
+                    except (OSError, ValueError):
                         pass
             
-            # Check if process completed successfully
-            if self.current_audio_process and self.current_audio_process.returncode != 0:
-                # Process failed - check stderr for errors
-                try:
-                    stderr_output = self.current_audio_process.stderr.read().decode() if self.current_audio_process.stderr else ""
-                    if stderr_output:
-                        print(f"⚠️  Audio playback error: {stderr_output[:100]}")
-                except:
-                    pass
-            
             self.is_speaking = False
             self.interrupt_event.clear()  # Reset interrupt event for next time
-            if self.current_audio_process:
-                self.current_audio_process = None
+            with self._audio_lock:
+                if self.current_audio_process is player:
+                    self.current_audio_process = None
             return None
     
+    def _render_say_to_cache(self, say_args: List[str], say_file: Path):
+        """Render a say utterance to an .aiff in the TTS cache in the background"""
+        def render():
+            tmp_file = say_file.with_name(f"{say_file.stem}.{os.getpid()}.tmp")
+            try:
+                # "say -o" writes to a file instead of the speakers
+                result = subprocess.run(
+                    say_args[:-1] + ["-o", str(tmp_file), "--file-format=AIFF", say_args[-1]],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+                if result.returncode == 0:
+                    os.replace(tmp_file, say_file)
+            except OSError:
+                pass
+            finally:
+                tmp_file.unlink(missing_ok=True)
+        
+        threading.Thread(target=render, daemon=True, name="SayCacheRender").start()
+    
     def listen_for_voice(self, timeout: int = 5, interruptible: bool = True) -> Optional[str]:
         """Listen for voice input and convert to text (can interrupt while Daisy is speaking)"""
         if not self.microphone:
@@ -749,29 +1305,41 @@ with natural rhythm and emphasis.""",
             return None
             
         try:
-            with self.microphone as source:
+            with self._mic_lock, self.microphone as source:
                 print("🎤 Listening...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                # Calibration costs 0.5s of dead air - only redo it when stale
+                # (normally the idle-time calibrator thread has already done it)
+                if time.time() - self._ambient_calibrated_at > self.AMBIENT_RECALIBRATE_INTERVAL:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                    self._ambient_calibrated_at = time.time()
                 audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=10)
+            self._last_activity = time.time()
             
             print("🔄 Processing speech...")
+            # Encode once at 16kHz/16-bit - Whisper's native rate (mics often capture 44.1/48kHz),
+            # so uploads are ~3x smaller
+            wav_bytes = audio.get_wav_data(convert_rate=16000, convert_width=2)
+            # Short utterances (commands) skip the network round-trip entirely
+            text = self._transcribe_short_locally(audio, wav_bytes)
             # Check if we've cached quota exceeded for Whisper
             now = time.time()
-            if self.openai_quota_exceeded and (now - self.quota_check_time < self.QUOTA_CHECK_INTERVAL):
+            if text:
+                print("⚡ Transcribed on-device")
+            elif self.openai_quota_exceeded and (now - self.quota_check_time < self.QUOTA_CHECK_INTERVAL):
                 # Skip OpenAI Whisper, use Google directly
                 print("💡 Using Google Speech (OpenAI quota exceeded - cached)")
                 text = self.recognizer.recognize_google(audio)
             else:
                 # Try OpenAI Whisper first (more accurate)
                 try:
-                    audio_data = io.BytesIO(audio.get_wav_data())
-                    audio_data.name = "audio.wav"
+                    # (name, bytes, mime) upload - no BytesIO copy; plain-text response, no JSON
                     transcript = self.client.audio.transcriptions.create(
                         model="whisper-1",
-                        file=audio_data,
-                        language="en"
+                        file=("audio.wav", wav_bytes, "audio/wav"),
+                        language="en",
+                        response_format="text"
                     )
-                    text = transcript.text
+                    text = (transcript if isinstance(transcript, str) else transcript.text).strip()
                     # Reset quota status if Whisper works
                     if self.openai_quota_exceeded:
                         self.openai_quota_exceeded = False
@@ -779,7 +1347,7 @@ with natural rhythm and emphasis.""",
                 except Exception as e:
                     error_str = str(e)
                     # Check for quota errors
-                    if "429" in error_str or "quota" in error_str.lower() or "insufficient_quota" in error_str:
+                    if QUOTA_ERROR_RE.search(error_str):
                         # Cache quota exceeded
                         self.openai_quota_exceeded = True
                         self.quota_check_time = time.time()
@@ -790,10 +1358,7 @@ with natural rhythm and emphasis.""",
                     text = self.recognizer.recognize_google(audio)
             
             # Check if user wants to interrupt/stop Daisy
-            text_lower = text.lower().strip()
-            interrupt_commands = ["stop", "stop speaking", "stop talking", "quiet", "shush", "enough"]
-            
-            if interruptible and any(cmd in text_lower for cmd in interrupt_commands):
+            if interruptible and INTERRUPT_RE.search(text):
                 # User wants to interrupt - stop speaking immediately
                 self.stop_speaking()
                 print("🔇 [Interrupted]")
@@ -820,7 +1385,7 @@ with natural rhythm and emphasis.""",
         
         try:
             # Quick listen for interrupt commands while speaking
-            with self.microphone as source:
+            with self._mic_lock, self.microphone as source:
                 try:
                     # Short timeout, just checking for "stop"
                     audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=2)
@@ -828,32 +1393,152 @@ with natural rhythm and emphasis.""",
                     # Try to recognize quickly
                     try:
                         text = self.recognizer.recognize_google(audio)
-                        text_lower = text.lower().strip()
                         
                         # Check for interrupt commands
-                        interrupt_commands = ["stop", "stop speaking", "stop talking", "quiet", "shush", "enough"]
-                        if any(cmd in text_lower for cmd in interrupt_commands):
+                        if INTERRUPT_RE.search(text):
                             self.stop_speaking()
                             print("\n🔇 [Interrupted by voice command]")
                             return None
-                    except:
+                    except (sr.UnknownValueError, sr.RequestError):
                         # Didn't understand, that's ok
                         pass
                 except sr.WaitTimeoutError:
                     # No voice detected, that's ok
                     pass
-        except:
+        except Exception:
             # Error listening, that's ok - Daisy keeps speaking
             pass
         
         return None
     
-    def get_llm_response(self, user_input: str) -> str:
-        """Get response from LLM - try OpenAI first, then Groq fallback"""
+    def _load_local_asr(self):
+        """Background thread: load the on-device Whisper model"""
+        try:
+            self._local_asr = WhisperModel("tiny.en", device="cpu", compute_type="int8")
+        except Exception as e:
+            print(f"⚠️  Local speech model unavailable: {str(e)[:80]}")
+    
+    def _transcribe_short_locally(self, audio, wav_bytes: bytes) -> Optional[str]:
+        """Transcribe short utterances on-device; None if too long, unsure or unavailable"""
+        if self._local_asr is None:
+            return None
+        duration = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        if duration > LOCAL_ASR_MAX_SECONDS:
+            return None
+        try:
+            segments, _ = self._local_asr.transcribe(io.BytesIO(wav_bytes), language="en")
+            segments = list(segments)
+        except Exception:
+            return None
+        if not segments or min(seg.avg_logprob for seg in segments) < LOCAL_ASR_MIN_LOGPROB:
+            return None
+        return " ".join(seg.text.strip() for seg in segments).strip() or None
+    
+    def _recalibrate_ambient_noise(self):
+        """Background thread: refresh the ambient noise calibration during idle periods"""
+        while True:
+            time.sleep(5)
+            stale = time.time() - self._ambient_calibrated_at > self.AMBIENT_RECALIBRATE_INTERVAL
+            idle = not self.is_speaking and time.time() - self._last_activity > 5
+            # Never wait for the mic - if a listen is in progress, try again later
+            if not (stale and idle) or not self._mic_lock.acquire(blocking=False):
+                continue
+            try:
+                with self.microphone as source:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                self._ambient_calibrated_at = time.time()
+            except Exception:
+                pass
+            finally:
+                self._mic_lock.release()
+    
+    def load_llm_cache(self) -> "OrderedDict[str, Tuple[float, str]]":
+        """Load persisted LLM responses (oldest first), dropping expired ones"""
+        try:
+            with open(LLM_CACHE_PATH, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return OrderedDict()
+        now = time.time()
+        # Entries without a timestamp come from older versions - drop them too
+        cache = OrderedDict((key, tuple(entry)) for key, entry in entries
+                            if isinstance(entry, list) and now - entry[0] < LLM_CACHE_TTL)
+        while len(cache) > LLM_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        return cache
+    
+    def save_llm_cache(self):
+        """Persist the LLM response cache (atomic write)"""
+        try:
+            tmp_path = LLM_CACHE_PATH.with_suffix(".json.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(list(self._llm_cache.items()), f)
+            os.replace(tmp_path, LLM_CACHE_PATH)
+        except OSError as e:
+            print(f"⚠️  Could not save LLM cache: {e}")
+    
+    def _expected_llm_model(self) -> Optional[str]:
+        """"provider:model" the next request will be sent to first (None if unknown)"""
+        quota_cached = (self.openai_quota_exceeded
+                        and time.time() - self.quota_check_time < self.QUOTA_CHECK_INTERVAL)
+        if self.client and not quota_cached:
+            return "openai:" + self.config.get("llm_model", "gpt-3.5-turbo")
+        if self.groq_client and self.groq_working_model:
+            return "groq:" + self.groq_working_model
+        return None
+    
+    def _llm_cache_key(self, messages: List[Dict], model: str) -> str:
+        """Hash of provider:model + temperature + the recent messages"""
+        payload = json.dumps({
+            "m": model,
+            "t": 0.7,
+            "msgs": messages[-LLM_CACHE_CONTEXT_MESSAGES:],
+        }, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def get_llm_response(self, user_input: str,
+                         on_sentence: Optional[Callable[[str], None]] = None) -> str:
+        """Get response from LLM - cached response if available, else OpenAI with Groq fallback
+        
+        If on_sentence is given, Groq responses are streamed and each complete
+        sentence is passed to it while the rest is still being generated.
+        """
         # Add user message
         self.add_message('user', user_input)
         messages = self.get_conversation_context()
         
+        cacheable = not UNCACHEABLE_PROMPT_RE.search(user_input)
+        expected_model = self._expected_llm_model()
+        if cacheable and expected_model:
+            cache_key = self._llm_cache_key(messages, expected_model)
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None and time.time() - cached[0] < LLM_CACHE_TTL:
+                self._llm_cache.move_to_end(cache_key)
+                self.add_message('assistant', cached[1])
+                print("⚡ Response from cache")
+                return cached[1]
+        
+        self._partial_reply = False
+        self._reply_model = None
+        response = self._request_llm_response(messages, on_sentence)
+        
+        # Don't cache errors / quota messages / interrupted (partial or empty) responses.
+        # Keyed on the model that actually answered - a Groq reply isn't replayed for OpenAI.
+        if (cacheable and self._reply_model and response and not self.interrupt_event.is_set()
+                and not self._partial_reply
+                and not response.startswith("I'm sorry") and "quota" not in response.lower()):
+            cache_key = self._llm_cache_key(messages, self._reply_model)
+            self._llm_cache[cache_key] = (time.time(), response)
+            self._llm_cache.move_to_end(cache_key)
+            if len(self._llm_cache) > LLM_CACHE_MAX_ENTRIES:
+                self._llm_cache.popitem(last=False)  # Evict least recently used
+        return response
+    
+    def _request_llm_response(self, messages: List[Dict],
+                              on_sentence: Optional[Callable[[str], None]] = None) -> str:
+        """Request a response from the APIs - try OpenAI first, then Groq fallback"""
+        on_sentence, spoken = self._track_sentences(on_sentence)
+        
         # Check if we've cached a quota exceeded status
         now = time.time()
         if self.openai_quota_exceeded:
@@ -862,7 +1547,7 @@ with natural rhythm and emphasis.""",
                 # Use cached status - skip OpenAI, go straight to Groq
                 if self.groq_client:
                     print("💡 Using Groq (OpenAI quota exceeded - cached)")
-                    return self.get_groq_response(messages)
+                    return self.get_groq_response(messages, on_sentence)
                 else:
                     error_msg = "I'm sorry, I've exceeded my API quota. Please check your OpenAI account billing and usage limits."
                     self.add_message('assistant', error_msg)
@@ -876,10 +1561,14 @@ with natural rhythm and emphasis.""",
         if self.client:
             try:
                 model = self.config.get("llm_model", "gpt-3.5-turbo")
-                response = self.client.chat.completions.create(
-                    model=model, messages=messages, temperature=0.7, max_tokens=500
-                )
-                assistant_message = response.choices[0].message.content
+                # Streamed when on_sentence is given - first sentence is spoken while generating
+                assistant_message = self._chat_complete(self.client, model, messages, on_sentence)
+                
+                if self.interrupt_event.is_set():
+                    # User interrupted mid-generation - keep only what was produced
+                    if assistant_message:
+                        self.add_message('assistant', assistant_message)
+                    return assistant_message or ""
                 
                 # Handle None or empty response
                 if not assistant_message or assistant_message.strip() == "":
@@ -888,15 +1577,19 @@ with natural rhythm and emphasis.""",
                     assistant_message = str(assistant_message)
                 
                 self.add_message('assistant', assistant_message)
+                self._reply_model = "openai:" + model
                 print(f"✅ Response from OpenAI ({model})")
                 return assistant_message
                 
             except Exception as e:
+                if spoken:
+                    # Part of the reply is already being spoken - a fallback would repeat it
+                    return self._keep_partial_reply(spoken, e)
                 error_str = str(e)
                 print(f"⚠️  OpenAI error: {error_str[:100]}")
                 
                 # Handle specific error cases
-                if "404" in error_str or "model_not_found" in error_str:
+                if MODEL_ERROR_RE.search(error_str):
                     print(f"❌ Model not found: {model}")
                     print(f"💡 Trying fallback model: gpt-3.5-turbo")
                     # Try with gpt-3.5-turbo as fallback
@@ -915,32 +1608,33 @@ with natural rhythm and emphasis.""",
                             assistant_message = str(assistant_message)
                         
                         self.add_message('assistant', assistant_message)
+                        self._reply_model = "openai:gpt-3.5-turbo"
                         self.config['llm_model'] = 'gpt-3.5-turbo'
-                        self.save_config()
+                        self.save_config(force=True)
                         print(f"✅ Response from OpenAI (gpt-3.5-turbo fallback)")
                         return assistant_message
                     except Exception as e2:
                         # Still failed, try Groq if available
                         if self.groq_client:
                             print("🔄 Falling back to Groq...")
-                            return self.get_groq_response(messages)
+                            return self.get_groq_response(messages, on_sentence)
                         error_msg = "I'm sorry, I'm having trouble connecting to the AI service. Please check your API key and account status."
                 # Fallback to Groq on quota/401 errors
-                elif any(x in error_str for x in ["429", "401", "quota", "insufficient_quota"]):
+                elif AUTH_OR_QUOTA_ERROR_RE.search(error_str):
                     # Cache the quota exceeded status (don't check again for 1 hour)
                     self.openai_quota_exceeded = True
                     self.quota_check_time = time.time()
                     
                     if self.groq_client:
                         print("🔄 Falling back to Groq (quota/API key error - cached for 1 hour)")
-                        return self.get_groq_response(messages)
+                        return self.get_groq_response(messages, on_sentence)
                     error_msg = "I'm sorry, I've exceeded my API quota. Please check your OpenAI account billing and usage limits."
                     print(f"❌ Quota exceeded - check your OpenAI account (cached for 1 hour)")
                 else:
                     # Other errors - try Groq if available
                     if self.groq_client:
                         print("🔄 Falling back to Groq...")
-                        return self.get_groq_response(messages)
+                        return self.get_groq_response(messages, on_sentence)
                     error_msg = f"I'm sorry, I encountered an error: {str(e)}"
                 
                 print(f"❌ LLM Error: {e}")
@@ -950,7 +1644,7 @@ with natural rhythm and emphasis.""",
         # Use Groq if OpenAI not available
         if self.groq_client:
             print("🔄 Using Groq (OpenAI not available)...")
-            return self.get_groq_response(messages)
+            return self.get_groq_response(messages, on_sentence)
         
         error_msg = "I'm sorry, no AI service is available. Please check your API keys."
         self.add_message('assistant', error_msg)
@@ -958,10 +1652,18 @@ with natural rhythm and emphasis.""",
     
     def show_notification(self, title: str, message: str):
         """Show macOS notification"""
-        script = f'''
-        display notification "{message}" with title "{title}"
-        '''
-        subprocess.run(["osascript", "-e", script], check=False)
+        # Previous notification still being posted - coalesce instead of stacking osascripts
+        if self._notification_process and self._notification_process.poll() is None:
+            return
+        # Text goes in as argv, never into the script source (quotes/backslashes are safe)
+        self._notification_process = subprocess.Popen(
+            ["osascript",
+             "-e", "on run argv",
+             "-e", "display notification (item 1 of argv) with title (item 2 of argv)",
+             "-e", "end run",
+             message[:200], title],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
     
     def save_conversation(self):
         """Save conversation to file"""
@@ -971,13 +1673,37 @@ with natural rhythm and emphasis.""",
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         conv_file = Path.home() / ".daisy" / "conversations" / f"conversation_{timestamp}.json"
         
+        # Snapshot the messages here; serialization and disk I/O happen on the writer thread
         conversation_data = {
             "timestamp": timestamp,
-            "messages": [asdict(msg) for msg in self.conversation_history]
+            "messages": self._all_messages()
         }
-        
-        with open(conv_file, 'w') as f:
-            json.dump(conversation_data, f, indent=2)
+        self._save_queue.put_nowait((conv_file, conversation_data))
+    
+    def _conversation_writer(self):
+        """Background thread: write queued conversation logs (None = stop)"""
+        while True:
+            item = self._save_queue.get()
+            if item is None:
+                return
+            conv_file, conversation_data = item
+            try:
+                if ORJSON_AVAILABLE:
+                    conv_file.write_bytes(orjson.dumps(
+                        conversation_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS
+                    ))
+                else:
+                    conversation_data["messages"] = [asdict(msg) for msg in conversation_data["messages"]]
+                    with open(conv_file, 'w') as f:
+                        json.dump(conversation_data, f, indent=2)
+            except (OSError, TypeError) as e:
+                print(f"⚠️  Could not save conversation: {e}")
+    
+    def _stop_conversation_writer(self):
+        """Let pending conversation writes finish before exit"""
+        self._save_queue.put(None)
+        self._save_worker.join(timeout=5)
     
     def speak_and_listen_loop(self):
         """Main conversation loop: speak, listen, respond"""
@@ -1003,7 +1729,7 @@ with natural rhythm and emphasis.""",
                         continue
                 else:
                     # Fallback to text input
-                    user_input = input("\n👤 You (or 'quit'): ").strip()
+                    user_input = self.read_input("\n👤 You (or 'quit'): ").strip()
                 
                 if not user_input:
                     continue
@@ -1017,75 +1743,38 @@ with natural rhythm and emphasis.""",
                     break
                 
                 
-                # Get LLM response
-                print("\n🔄 Thinking...")
-                response = self.get_llm_response(user_input)
-                
-                # Speak response (interruptible - say "stop" to interrupt)
-                print(f"🤖 Daisy: {response}")
-                print("💡 (Say 'STOP' loudly OR press ANY KEY to interrupt)")
-                
                 # Reset interrupt flags BEFORE starting audio
                 self.interrupt_event.clear()
                 self.interrupt_detected = False
                 self.is_speaking = False  # Will be set to True in text_to_speech
                 
-                # Start listening for voice interrupt BEFORE starting to speak
-                interrupt_voice = threading.Thread(
-                    target=self._listen_for_interrupt,
-                    daemon=True,
-                    name="VoiceInterruptListener"
-                )
-                interrupt_voice.start()
-                
-                # Start keyboard interrupt listener (non-blocking backup)
-                keyboard_interrupt = threading.Thread(
-                    target=self._keyboard_interrupt_listener,
+                # Speak streamed sentences while the LLM is still generating
+                sentence_queue = queue.Queue()
+                streamed_sentences = []
+                sentence_speaker = threading.Thread(
+                    target=self._speak_sentences,
+                    args=(sentence_queue,),
                     daemon=True,
-                    name="KeyboardInterruptListener"
+                    name="SentenceSpeaker"
                 )
-                keyboard_interrupt.start()
+                sentence_speaker.start()
                 
-                # Also set up a simple stdin monitor in main thread as backup
-                # This will work even if the thread doesn't
-                import sys
-                import select
+                def on_sentence(sentence: str):
+                    streamed_sentences.append(sentence)
+                    sentence_queue.put(sentence)
                 
-                # Small delay to let interrupt listeners start properly
-                time.sleep(0.3)
-                
-                # Start speaking (can be interrupted by voice or keyboard)
-                # Start audio in a separate checkable way
-                self.text_to_speech(response)
-                
-                # While speaking, check for keyboard input in main thread (most reliable)
-                if self.is_speaking:
-                    print("⌨️  [Press ANY KEY to interrupt while speaking...]")
-                    start_speak_time = time.time()
-                    while self.is_speaking and (time.time() - start_speak_time < 300):  # Max 5 min
-                        # Check if stdin has input (non-blocking)
-                        if sys.stdin.isatty():
-                            if select.select([sys.stdin], [], [], 0.1)[0]:
-                                # User pressed a key - interrupt immediately
-                                print(f"\n⌨️  [KEY DETECTED - Stopping immediately!]")
-                                self.stop_speaking()
-                                break
-                        
-                        # Also check interrupt flags
-                        if self.interrupt_event.is_set() or self.interrupt_detected:
-                            break
-                        
-                        # Check if audio process finished
-                        if self.current_audio_process and self.current_audio_process.poll() is not None:
-                            break
-                        
-                        time.sleep(0.05)  # Check every 50ms
+                # Get LLM response
+                print("\n🔄 Thinking...")
+                response = self.get_llm_response(user_input, on_sentence=on_sentence)
+                sentence_queue.put(None)  # No more sentences
                 
-                # Wait for interrupt listeners to finish
-                if interrupt_voice.is_alive():
-                    interrupt_voice.join(timeout=0.5)
-                if keyboard_interrupt.is_alive():
-                    keyboard_interrupt.join(timeout=0.5)
+                print(f"🤖 Daisy: {response}")
+                if streamed_sentences:
+                    # Already being spoken sentence-by-sentence - wait for it to finish
+                    sentence_speaker.join()
+                elif response:
+                    # Speak response (interruptible - say "stop" to interrupt)
+                    self._speak_response(response)
                 
                 self.show_notification("Daisy", response[:100])
                 
@@ -1099,138 +1788,102 @@ with natural rhythm and emphasis.""",
                 break
             except Exception as e:
                 print(f"❌ Error in conversation loop: {e}")
-                import traceback
                 traceback.print_exc()
                 time.sleep(1)
     
-    def _keyboard_interrupt_listener(self):
-        """Background thread that listens for keyboard input to interrupt (Spacebar/Enter)"""
-        import sys
-        import select
-        import tty
-        import termios
-        
-        if not sys.stdin.isatty():
-            # Not a terminal - can't listen for keyboard
-            return
+    def _speak_response(self, response: str):
+        """Speak a full response with voice + keyboard interrupt monitoring"""
+        print("💡 (Say 'STOP' loudly OR press ANY KEY to interrupt)")
         
-        # Try to monitor stdin for spacebar or Enter key presses
-        old_settings = None
+        # Start speaking (can be interrupted by voice or keyboard)
+        # (the session-wide voice and keyboard listeners wake as soon as is_speaking is set)
+        self.text_to_speech(response)
+    
+    def _voice_interrupt_monitor(self):
+        """Session-wide thread: run the VAD for every stretch of speech"""
+        while True:
+            self._speaking.wait()
+            self._listen_for_interrupt()
+            # Don't restart until this utterance is over
+            self._idle.wait()
+    
+    def _speak_sentences(self, sentence_queue: "queue.Queue[Optional[str]]"):
+        """Background thread that speaks streamed sentences in order (None = end of response)"""
+        while True:
+            sentence = sentence_queue.get()
+            if sentence is None:
+                break
+            if self.interrupt_detected:
+                # User interrupted - drop the rest of this response
+                continue
+            self.text_to_speech(sentence)
+    
+    def _open_vad_stream(self):
+        """Open the persistent (stopped) VAD input stream"""
         try:
-            old_settings = termios.tcgetattr(sys.stdin)
-            tty.setcbreak(sys.stdin.fileno())
-            
-            print("⌨️  [Keyboard listener active - press Spacebar or Enter to interrupt]")
-            
-            while self.is_speaking and not self.interrupt_event.is_set():
-                try:
-                    # Check if there's input waiting (non-blocking with short timeout)
-                    ready, _, _ = select.select([sys.stdin], [], [], 0.1)
-                    if ready:
-                        char = sys.stdin.read(1)
-                        # Spacebar (32) or Enter (10/13) triggers interrupt
-                        if char in [' ', '\n', '\r', '\x03']:  # Space, Enter, or Ctrl+C
-                            print(f"\n⌨️  [Keyboard interrupt detected! Stopping...]")
-                            self.stop_speaking()
-                            break
-                except (OSError, ValueError, KeyboardInterrupt) as e:
-                    # Handle terminal errors gracefully
-                    break
-                except Exception as e:
-                    # Other errors - continue trying
-                    pass
+            self._pa = pyaudio.PyAudio()
+            try:
+                device_index = self._pa.get_default_input_device_info()['index']
+            except (IOError, OSError):
+                device_index = None
+            self._vad_stream = self._pa.open(
+                format=pyaudio.paInt16,
+                channels=1,
+                rate=VAD_RATE,
+                input=True,
+                input_device_index=device_index,
+                frames_per_buffer=VAD_CHUNK,
+                start=False
+            )
+            atexit.register(self._close_vad_stream)
         except Exception as e:
-            # Can't set terminal mode - keyboard interrupt won't work
-            print(f"⚠️  [Keyboard interrupt unavailable: {str(e)[:50]}]")
-            pass
-        finally:
-            if old_settings:
-                try:
-                    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-                except:
-                    pass
+            print(f"⚠️  [VAD setup error: {str(e)[:100]}]")
+            self._close_vad_stream()
+    
+    def _close_vad_stream(self):
+        """Release the VAD stream and PortAudio"""
+        if self._vad_stream:
+            try:
+                self._vad_stream.close()
+            except Exception:
+                pass
+            self._vad_stream = None
+        if self._pa:
+            try:
+                self._pa.terminate()
+            except Exception:
+                pass
+            self._pa = None
     
     def _listen_for_interrupt(self):
-        """Background thread that uses direct pyaudio VAD to detect ANY user speech while Daisy is speaking"""
+        """Use direct pyaudio VAD to detect ANY user speech until Daisy stops speaking"""
         # Use pyaudio directly for VAD - more reliable than speech_recognition during audio playback
-        if not PYAUDIO_AVAILABLE:
-            print("⚠️  [VAD: pyaudio not available - use keyboard to interrupt]")
-            return
-        
         print("🎤 [VAD active - start speaking anytime to interrupt]")
         
-        import pyaudio
-        
-        # Try to import audioop (deprecated in Python 3.13+, but still works)
-        try:
-            import audioop
-            USE_AUDIOOP = True
-        except ImportError:
-            # Fallback to manual RMS calculation if audioop not available
-            USE_AUDIOOP = False
-            import struct
-        
-        # Audio settings
-        CHUNK = 512  # Small chunks for fast response
-        FORMAT = pyaudio.paInt16
-        CHANNELS = 1
-        RATE = 16000
-        
-        audio = None
-        stream = None
+        stream = self._vad_stream
         
         try:
-            # Open audio stream ONCE at the start
-            audio = pyaudio.PyAudio()
-            
-            # Find available input device (might help with conflicts)
-            try:
-                default_input = audio.get_default_input_device_info()
-                device_index = default_input['index']
-            except:
-                device_index = None
-            
-            stream = audio.open(
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RATE,
-                input=True,
-                input_device_index=device_index,
-                frames_per_buffer=CHUNK
-            )
-            
-            # Skip initial frames to avoid startup noise
-            for _ in range(5):
-                try:
-                    stream.read(CHUNK, exception_on_overflow=False)
-                except:
-                    pass
+            # Persistent stream - just resume it (no device setup or warm-up reads)
+            stream.start_stream()
             
             print("🎤 [VAD listener ready - monitoring for voice...]")
             
             # VAD state
             frame_count = 0
-            energy_threshold = 6000  # Start higher to avoid false positives from Daisy's audio
+            noise_floor = VAD_NOISE_FLOOR_INIT
             consecutive_voice = 0
             frames_needed = 3  # Need 3 consecutive frames (~96ms) to confirm voice
             
             # Main VAD loop - keep reading while Daisy is speaking
-            # Wait a moment for is_speaking to be set
-            wait_count = 0
-            while wait_count < 10 and not self.is_speaking:
-                time.sleep(0.05)
-                wait_count += 1
-            
             while self.is_speaking and not self.interrupt_event.is_set():
                 try:
-                    frame_count += 1
-                    
                     # Check if audio process finished (only if it exists)
-                    if self.current_audio_process is None:
-                        # No audio process yet - wait a bit
-                        time.sleep(0.05)
+                    proc = self.current_audio_process
+                    if proc is None:
+                        # No audio process yet - wait a bit (returns at once on interrupt)
+                        self.interrupt_event.wait(0.05)
                         continue
-                    elif self.current_audio_process.poll() is not None:
+                    elif proc.poll() is not None:
                         # Audio finished - exit
                         break
                     
@@ -1238,47 +1891,64 @@ with natural rhythm and emphasis.""",
                     if self.interrupt_detected:
                         break
                     
-                    # Read audio chunk (non-blocking)
+                    # Read audio chunk (blocks for one read; overflow doesn't raise)
                     try:
-                        audio_data = stream.read(CHUNK, exception_on_overflow=False)
-                    except Exception as e:
+                        audio_data = stream.read(VAD_CHUNK, exception_on_overflow=False)
+                    except OSError:
                         # Stream error - retry with small delay
                         time.sleep(0.05)
                         continue
                     
-                    # Calculate RMS energy for voice activity detection
-                    if USE_AUDIOOP:
-                        rms = audioop.rms(audio_data, 2)  # 2 = 16-bit samples
+                    # Calculate RMS energy per 32ms frame for voice activity detection
+                    # (one read, but detection granularity stays at one frame)
+                    if NUMPY_AVAILABLE:
+                        samples = np.frombuffer(audio_data, dtype=np.int16)
+                        samples = samples[:len(samples) - len(samples) % VAD_FRAME].reshape(-1, VAD_FRAME)
+                        frame_rms = np.sqrt(np.mean(np.square(samples, dtype=np.int32), axis=1)).astype(int).tolist()
+                    elif AUDIOOP_AVAILABLE:
+                        frame_rms = [audioop.rms(audio_data[i:i + VAD_FRAME * 2], 2)  # 2 = 16-bit samples
+                                     for i in range(0, len(audio_data), VAD_FRAME * 2)]
                     else:
-                        # Manual RMS calculation if audioop not available
+                        # Manual RMS calculation if neither NumPy nor audioop is available
                         samples = struct.unpack('<' + ('h' * (len(audio_data) // 2)), audio_data)
-                        rms = int((sum(x*x for x in samples) / len(samples)) ** 0.5)
+                        frame_rms = [int((sum(x*x for x in frame) / len(frame)) ** 0.5)
+                                     for frame in (samples[i:i + VAD_FRAME] for i in range(0, len(samples), VAD_FRAME))
+                                     if frame]
                     
-                    # Adaptive threshold: lower over time to detect user voice even with echo
-                    if frame_count > 30:  # After ~960ms, lower threshold
-                        energy_threshold = max(6000 * 0.5, 3500)
-                    elif frame_count > 10:  # After ~320ms, start lowering
-                        energy_threshold = max(6000 * 0.7, 4500)
-                    
-                    # Check for voice activity
-                    if rms > energy_threshold:
-                        consecutive_voice += 1
-                        # Debug: show when voice detected
-                        if consecutive_voice == 1:
-                            print(f"🎤 [Voice activity detected (RMS: {rms}, threshold: {int(energy_threshold)})]")
+                    voice_confirmed = False
+                    for rms in frame_rms:
+                        frame_count += 1
+                        if frame_count <= VAD_WARMUP_FRAMES:
+                            # Learn faster during warm-up so the floor catches up with the echo
+                            noise_floor += 0.3 * (rms - noise_floor)
+                            continue
                         
-                        # If multiple consecutive frames with voice, interrupt immediately
-                        if consecutive_voice >= frames_needed:
-                            print(f"🔇 [User speaking detected! (RMS: {rms}) - Stopping immediately...]")
-                            self.stop_speaking()
-                            break
-                    else:
-                        # Reset counter if no voice detected
-                        if consecutive_voice > 0:
+                        # Adaptive threshold: tracks the room + echo level instead of fixed steps
+                        energy_threshold = max(noise_floor * VAD_SNR, VAD_MIN_RMS)
+                        
+                        # Check for voice activity
+                        if rms > energy_threshold:
+                            consecutive_voice += 1
+                            # Debug: show when voice detected
+                            if consecutive_voice == 1:
+                                print(f"🎤 [Voice activity detected (RMS: {rms}, threshold: {int(energy_threshold)})]")
+                            
+                            # If multiple consecutive frames with voice, interrupt immediately
+                            if consecutive_voice >= frames_needed:
+                                print(f"🔇 [User speaking detected! (RMS: {rms}) - Stopping immediately...]")
+                                voice_confirmed = True
+                                break
+                        else:
+                            # Reset counter if no voice detected, and learn the noise floor
+                            # from quiet frames only (so speech doesn't raise it)
                             consecutive_voice = 0
+                            noise_floor += VAD_NOISE_FLOOR_ALPHA * (rms - noise_floor)
+                    
+                    if voice_confirmed:
+                        self.stop_speaking()
+                        break
                     
-                    # Small delay to avoid CPU spinning (VAD is fast enough)
-                    time.sleep(0.01)  # 10ms = ~100 checks per second
+                    # No sleep needed: stream.read(VAD_CHUNK) blocks for the whole read (~96ms)
                     
                 except Exception as e:
                     # Error in VAD loop - log and continue
@@ -1290,18 +1960,11 @@ with natural rhythm and emphasis.""",
         except Exception as e:
             print(f"⚠️  [VAD setup error: {str(e)[:100]}]")
         finally:
-            # Clean up audio stream
-            if stream:
-                try:
-                    stream.stop_stream()
-                    stream.close()
-                except:
-                    pass
-            if audio:
-                try:
-                    audio.terminate()
-                except:
-                    pass
+            # Pause (don't close) the stream - it is reused on the next response
+            try:
+                stream.stop_stream()
+            except Exception:
+                pass
         
         print("🎤 [VAD listener stopped]")
     
@@ -1314,8 +1977,6 @@ with natural rhythm and emphasis.""",
 
 def main():
     """Main entry point"""
-    import sys
-    
     try:
         assistant = DaisyAssistant()
         
@@ -1333,7 +1994,7 @@ def main():
                 assistant.text_to_speech(greeting)
                 
                 while True:
-                    user_input = input("\n👤 You: ").strip()
+                    user_input = assistant.read_input("\n👤 You: ").strip()
                     if user_input.lower() in ['quit', 'exit']:
                         farewell = "Goodbye!"
                         print(f"🤖 Daisy: {farewell}")
@@ -1356,7 +2017,6 @@ def main():
         print('  {"openai_api_key": "your-api-key-here"}')
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()
 
 
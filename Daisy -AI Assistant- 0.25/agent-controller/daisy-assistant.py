@@ -9,24 +9,34 @@ Features:
 """
 
 import json
+import importlib.util
 import os
 import subprocess
+import signal
+import tempfile
 import time
 import re
 import base64
-import requests
+import hashlib
+import shutil
+import wave
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+from collections import OrderedDict, deque
+from itertools import chain
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import sys
+import atexit
+from functools import lru_cache
 
-# Core dependencies
-try:
-    import speech_recognition as sr
-    from openai import OpenAI
-except ImportError:
+# Core dependencies - only located here; they are imported on first use so that
+# startup (and text mode) doesn't pay for speech_recognition, openai, groq and requests
+if (importlib.util.find_spec("speech_recognition") is None
+        or importlib.util.find_spec("openai") is None):
     print("❌ Missing required packages. Installing...")
     import sys
     try:
@@ -45,39 +55,113 @@ except ImportError:
     except:
         print("⚠️  pyaudio not installed (requires portaudio). Voice input will use fallback method.")
         print("   To install: brew install portaudio, then: pip install pyaudio")
-    import speech_recognition as sr
-    from openai import OpenAI
+    importlib.invalidate_caches()
 
-try:
-    import pyaudio
-    PYAUDIO_AVAILABLE = True
-except ImportError:
-    PYAUDIO_AVAILABLE = False
-    # pyaudio not required - speech_recognition can work without it
+# pyaudio not required - speech_recognition can work without it
+PYAUDIO_AVAILABLE = importlib.util.find_spec("pyaudio") is not None
 
 import io
 
-# Groq SDK import (PROVEN WORKING - matches Praiser)
-try:
-    from groq import Groq
-    GROQ_AVAILABLE = True
-except ImportError:
-    GROQ_AVAILABLE = False
-    Groq = None
+# Groq SDK (PROVEN WORKING - matches Praiser), imported when a Groq key is configured
+GROQ_AVAILABLE = importlib.util.find_spec("groq") is not None
+
+def _lazy_sr():
+    """speech_recognition, imported on first use (only voice input needs it)"""
+    import speech_recognition
+    return speech_recognition
+
+def _lazy_pyaudio():
+    """pyaudio, imported on first use (None if it is missing or can't be loaded)"""
+    global PYAUDIO_AVAILABLE
+    if not PYAUDIO_AVAILABLE:
+        return None
+    try:
+        import pyaudio
+    except Exception:
+        # find_spec only shows it is installed - the import still fails without libportaudio
+        PYAUDIO_AVAILABLE = False
+        return None
+    return pyaudio
+
+# Raw PCM players - Piper audio is played chunk-by-chunk as it is synthesized.
+# afplay only plays files, so without one of these Piper falls back to a WAV file.
+FFPLAY_PATH = shutil.which("ffplay")
+APLAY_PATH = shutil.which("aplay")
+
+def pcm_player_command(sample_rate: int) -> Optional[List[str]]:
+    """Command that plays 16-bit mono PCM from stdin, or None if no player is installed"""
+    if FFPLAY_PATH:
+        return [FFPLAY_PATH, "-nodisp", "-autoexit", "-loglevel", "error",
+                "-f", "s16le", "-ar", str(sample_rate), "-i", "-"]
+    if APLAY_PATH:
+        return [APLAY_PATH, "-q", "-t", "raw", "-f", "S16_LE", "-r", str(sample_rate), "-c", "1"]
+    return None
+
+# Streamed LLM replies are spoken sentence-by-sentence while the rest is generated
+SENTENCE_BOUNDARY_RE = re.compile(r'[.!?]+(?=\s)|\n')
+
+def split_complete_sentences(buffer: str) -> Tuple[List[str], str]:
+    """Split off complete sentences from streamed text - returns (sentences, remainder)"""
+    sentences = []
+    start = 0
+    for match in SENTENCE_BOUNDARY_RE.finditer(buffer):
+        sentence = buffer[start:match.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    return sentences, buffer[start:]
+
+# Cached replies are keyed on the prompt plus the last few messages, so follow-ups
+# like "why?" only hit the cache in the same conversational context
+RESPONSE_CACHE_CONTEXT_MESSAGES = 6
+# Answers to these change from one minute to the next - never serve them from cache
+UNCACHEABLE_PROMPT_RE = re.compile(
+    r'\b(time|date|today|tonight|tomorrow|yesterday|now|current|latest|weather|news)\b', re.I)
+
+# Groq model ids that aren't chat models (TTS, guard, whisper, compound)
+GROQ_EXCLUDE_RE = re.compile(r'tts|whisper|guard|compound|decommissioned', re.I)
+# Groq error classification for the model fallback loop
+MODEL_GONE_RE = re.compile(r'404|model_not_found|decommissioned', re.I)
+RATE_LIMIT_RE = re.compile(r'429|rate_limit|503|over capacity', re.I)
+
+# Groq model ranking: larger/newer models first (no hardcoded list)
+MODEL_SIZE_RE = re.compile(r'(?<!\d)(120|70|32|20|17|8)(?:b\b|(?!\d))', re.I)
+MODEL_VERSION_RE = re.compile(r'3\.([31])|3')
+
+@lru_cache(maxsize=256)
+def model_priority(model: str) -> tuple:
+    """Sort key for a Groq model id by size, version, type - dynamically"""
+    m = model.lower()
+    # Size (larger = better)
+    size = max((int(val) for val in MODEL_SIZE_RE.findall(m)), default=0)
+    # Version (newer = better)
+    match = MODEL_VERSION_RE.search(m)
+    version = 0 if not match else {"3": 3, "1": 2}.get(match.group(1), 1)
+    # Type (versatile > instant > others)
+    type_score = 2 if "versatile" in m else (1 if "instant" in m else 0)
+    return (-size, -version, -type_score)
+
+class ModelRaceLost(Exception):
+    """Raised in a Groq model attempt once another model in the race has answered"""
 
 @dataclass
 class ConversationMessage:
     """Represents a message in the conversation"""
     role: str  # 'user', 'assistant', 'system'
     content: str
-    timestamp: str
+    timestamp: float  # time.time() - formatted only when the conversation is saved
 
 class DaisyAssistant:
     """Personal AI Assistant with voice and conversation capabilities"""
     
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or Path.home() / ".daisy" / "config.json"
+        # Routine config updates are debounced (written at most every 60s, flushed at exit)
+        self._config_dirty = False
+        self._last_config_save = 0.0
+        self.CONFIG_SAVE_INTERVAL = 60  # seconds
         self.config = self.load_config()
+        atexit.register(self.flush_config)
         self.setup_directories()
         
         # Initialize OpenAI client
@@ -85,6 +169,7 @@ class DaisyAssistant:
         self.client = None
         if openai_api_key:
             try:
+                from openai import OpenAI
                 self.client = OpenAI(api_key=openai_api_key)
                 print("✅ OpenAI client initialized")
             except Exception as e:
@@ -95,9 +180,10 @@ class DaisyAssistant:
         # Initialize Groq client (PROVEN WORKING APPROACH - same as Praiser)
         groq_api_key = os.getenv("GROQ_API_KEY") or self.config.get("groq_api_key")
         self.groq_client = None
-        self.groq_models_cache = None
-        self.groq_models_cache_time = 0
         self.GROQ_CACHE_TTL = 3600  # 1 hour cache (same as Praiser)
+        # Model list is persisted in config so restarts within the TTL skip the fetch
+        self.groq_models_cache = self.config.get("groq_models_cache")
+        self.groq_models_cache_time = self.config.get("groq_models_cache_time", 0)
         
         # Groq working model cache (remember which model works)
         # Try to load from config if available (persists across restarts)
@@ -110,9 +196,11 @@ class DaisyAssistant:
         else:
             self.groq_model_check_time = 0
         self.GROQ_MODEL_CHECK_INTERVAL = 3600  # Re-check working model every hour
+        self.GROQ_RACE_WIDTH = 3  # Models tried concurrently when searching for a working one
         
         if GROQ_AVAILABLE and groq_api_key:
             try:
+                from groq import Groq
                 self.groq_client = Groq(api_key=groq_api_key)
                 print("✅ Groq client initialized")
             except Exception as e:
@@ -120,20 +208,24 @@ class DaisyAssistant:
         elif GROQ_AVAILABLE and not groq_api_key:
             print("⚠️  Groq API key not found (optional fallback)")
         
-        # Conversation history
-        self.conversation_history: List[ConversationMessage] = []
+        # Pooled HTTP session for Groq REST calls (created by the first model fetch)
+        self._http = None
+        
+        # Conversation history - the static system prompt is pinned at the front,
+        # everything else (including later system notes) is kept in order after it.
+        # Old messages are dropped HISTORY_TRIM_BATCH at a time so the prompt prefix
+        # stays identical for several turns and provider-side prompt caching applies.
         self.max_history = 50  # Keep last 50 messages
+        self.HISTORY_TRIM_BATCH = 10
+        self._system_msgs: List[ConversationMessage] = []
+        self._chat_msgs = deque()
+        # The same history as LLM API messages, kept in step so no turn has to rebuild it
+        self._llm_messages: List[Dict] = []
         
-        # Voice recognition
-        self.recognizer = sr.Recognizer()
-        try:
-            self.microphone = sr.Microphone()
-            print("✅ Microphone available")
-        except Exception as e:
-            print(f"⚠️  Microphone not available: {e}")
-            self.microphone = None
-            if not PYAUDIO_AVAILABLE:
-                print("   Note: Install portaudio for full voice support: brew install portaudio")
+        # Voice recognition (recognizer and microphone are created on first use)
+        self._recognizer = None
+        self._microphone = None
+        self._microphone_checked = False
         self.is_listening = False
         
         # Audio playback control (for interruption)
@@ -143,6 +235,10 @@ class DaisyAssistant:
         # Interrupt handling (event-based for better responsiveness)
         self.interrupt_event = threading.Event()
         self.interrupt_detected = False
+        # Set when the user interrupts a streamed reply - stops receiving the rest of it
+        self._stream_cancelled = threading.Event()
+        # Set while a streamed reply is being spoken - listeners stay up between its sentences
+        self._reply_speaking = threading.Event()
         
         # Quota check caching (avoid checking every request)
         self.openai_quota_exceeded = False
@@ -152,8 +248,13 @@ class DaisyAssistant:
         # TTS engine selection
         self.tts_engine = self.config.get("tts_engine", "piper")  # piper, openai, say
         self.piper_available = self._check_piper_available()
-        self._audio_file_counter = 0  # Counter for unique audio filenames
-        self._audio_file_lock = threading.Lock()  # Lock for thread-safe counter
+        # Loaded Piper voices and resolved model paths, keyed by model name -
+        # loading the ONNX model takes far longer than synthesizing a sentence
+        self._piper_voices = {}
+        self._piper_paths = {}
+        # Recently detected languages keyed by text (FIFO, LANG_CACHE_SIZE entries)
+        self._lang_cache: "OrderedDict[str, str]" = OrderedDict()
+        self.LANG_CACHE_SIZE = 128
         self.greek_piper_model = self.config.get("greek_piper_model", "el_GR-rapunzelina-low")
         
         # Initialize system prompt
@@ -168,6 +269,12 @@ Keep responses concise but friendly. Use natural speech patterns."""
         # Initialize conversation
         self.add_system_message(self.system_prompt)
         
+        # Replies to recently asked prompts: sha256(system prompt + recent messages + prompt) -> (time, reply)
+        self._response_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.RESPONSE_CACHE_SIZE = 256
+        self.RESPONSE_CACHE_TTL = 3600  # 1 hour
+        self._partial_reply = False  # Last reply was cut off by an error - don't cache it
+        
         print("🌟 Daisy is ready!")
         print(f"🧠 LLM Model: {self.config.get('llm_model', 'gpt-3.5-turbo')}")
         
@@ -226,8 +333,24 @@ with natural rhythm and emphasis.""",
         if config:
             self.config = config
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, 'w') as f:
+        # Write to a temp file and swap it in - a crash mid-write can't corrupt the config
+        tmp_path = self.config_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w') as f:
             json.dump(self.config, f, indent=2)
+        os.replace(tmp_path, self.config_path)
+        self._config_dirty = False
+        self._last_config_save = time.time()
+    
+    def save_config_debounced(self):
+        """Mark config as changed; write it only if the last save was over CONFIG_SAVE_INTERVAL ago"""
+        self._config_dirty = True
+        if time.time() - self._last_config_save >= self.CONFIG_SAVE_INTERVAL:
+            self.save_config()
+    
+    def flush_config(self):
+        """Write pending debounced config changes (called at exit)"""
+        if self._config_dirty:
+            self.save_config()
     
     def setup_directories(self):
         """Create necessary directories"""
@@ -240,32 +363,70 @@ with natural rhythm and emphasis.""",
         for d in dirs:
             d.mkdir(parents=True, exist_ok=True)
     
+    @property
+    def recognizer(self):
+        """speech_recognition Recognizer, created on first use"""
+        if self._recognizer is None:
+            self._recognizer = _lazy_sr().Recognizer()
+        return self._recognizer
+    
+    @property
+    def microphone(self):
+        """Default microphone, opened on first use (None if not available)"""
+        if not self._microphone_checked:
+            self._microphone_checked = True
+            try:
+                self._microphone = _lazy_sr().Microphone()
+                print("✅ Microphone available")
+            except Exception as e:
+                print(f"⚠️  Microphone not available: {e}")
+                if not PYAUDIO_AVAILABLE:
+                    print("   Note: Install portaudio for full voice support: brew install portaudio")
+        return self._microphone
+    
     def add_message(self, role: str, content: str):
         """Add a message to conversation history"""
         message = ConversationMessage(
             role=role,
             content=content,
-            timestamp=datetime.now().isoformat()
+            timestamp=time.time()
         )
-        self.conversation_history.append(message)
+        self._chat_msgs.append(message)
+        self._llm_messages.append({"role": role, "content": content})
         
         # Keep history within limit
-        if len(self.conversation_history) > self.max_history:
-            # Keep system message, remove oldest non-system messages
-            system_msgs = [m for m in self.conversation_history if m.role == 'system']
-            other_msgs = [m for m in self.conversation_history if m.role != 'system']
-            self.conversation_history = system_msgs + other_msgs[-self.max_history+1:]
+        if len(self._system_msgs) + len(self._chat_msgs) > self.max_history:
+            trim = min(self.HISTORY_TRIM_BATCH, len(self._chat_msgs))
+            for _ in range(trim):
+                self._chat_msgs.popleft()
+            pinned = len(self._system_msgs)
+            del self._llm_messages[pinned:pinned + trim]
+    
+    @property
+    def conversation_history(self) -> List[ConversationMessage]:
+        """Pinned system messages followed by the most recent messages"""
+        return list(chain(self._system_msgs, self._chat_msgs))
     
     def add_system_message(self, content: str):
-        """Add system message"""
-        self.add_message('system', content)
+        """Pin a static system message at the front of the context (never trimmed)
+        
+        Anything that changes between turns should go through add_message('system', ...)
+        instead, so the pinned prefix sent to the LLM stays byte-identical.
+        """
+        self._system_msgs.append(ConversationMessage(
+            role='system',
+            content=content,
+            timestamp=time.time()
+        ))
+        self._llm_messages.insert(len(self._system_msgs) - 1, {"role": "system", "content": content})
     
     def get_conversation_context(self) -> List[Dict]:
-        """Get conversation context for LLM"""
-        return [
-            {"role": msg.role, "content": msg.content}
-            for msg in self.conversation_history
-        ]
+        """Get conversation context for LLM
+        
+        This is the live message list - it changes as messages are added, so take a
+        copy before handing it to anything that outlives the current turn.
+        """
+        return self._llm_messages
     
     def fetch_groq_models(self) -> List[str]:
         """
@@ -283,15 +444,19 @@ with natural rhythm and emphasis.""",
             return []
         
         try:
-            # PROVEN WORKING: Direct HTTP call (same as Praiser)
-            response = requests.get(
-                "https://api.groq.com/openai/v1/models",
-                headers={
+            if self._http is None:
+                # Keep-alive session - later fetches reuse the TLS connection
+                import requests
+                from requests.adapters import HTTPAdapter
+                self._http = requests.Session()
+                self._http.mount("https://api.groq.com", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+                self._http.headers.update({
                     "Authorization": f"Bearer {groq_api_key}",
                     "Content-Type": "application/json",
-                },
-                timeout=10
-            )
+                })
+            
+            # PROVEN WORKING: Direct HTTP call (same as Praiser)
+            response = self._http.get("https://api.groq.com/openai/v1/models", timeout=10)
             
             if not response.ok:
                 raise Exception(f"Groq API error: {response.status_code}")
@@ -300,33 +465,17 @@ with natural rhythm and emphasis.""",
             all_models = [model["id"] for model in data.get("data", [])]
             
             # Filter out non-conversation models (TTS, guard, whisper, compound)
-            exclude_patterns = ["tts", "whisper", "guard", "compound", "decommissioned"]
-            conversation_models = [
-                m for m in all_models
-                if not any(pattern in m.lower() for pattern in exclude_patterns)
-            ]
+            conversation_models = [m for m in all_models if not GROQ_EXCLUDE_RE.search(m)]
             
             # Smart sorting: Larger/newer models first (no hardcoded list)
-            def model_priority(model: str) -> tuple:
-                """Sort by size, version, type - dynamically"""
-                m = model.lower()
-                # Size (larger = better)
-                size = 0
-                for val in [120, 70, 32, 20, 17, 8]:
-                    if str(val) in m or f"{val}b" in m:
-                        size = val
-                        break
-                # Version (newer = better)
-                version = 3 if "3.3" in m else (2 if "3.1" in m else (1 if "3" in m else 0))
-                # Type (versatile > instant > others)
-                type_score = 2 if "versatile" in m else (1 if "instant" in m else 0)
-                return (-size, -version, -type_score)
-            
             sorted_models = sorted(conversation_models, key=model_priority)
             
-            # Cache result
+            # Cache result (in memory and on disk)
             self.groq_models_cache = sorted_models
             self.groq_models_cache_time = now
+            self.config["groq_models_cache"] = sorted_models
+            self.config["groq_models_cache_time"] = now
+            self.save_config()
             
             print(f"✅ Fetched {len(sorted_models)} Groq models dynamically")
             if sorted_models:
@@ -337,8 +486,127 @@ with natural rhythm and emphasis.""",
             print(f"⚠️  Failed to fetch Groq models: {e}")
             return []
     
-    def get_groq_response(self, messages: List[Dict]) -> str:
-        """Get response from Groq - use cached working model (re-check every hour)"""
+    def _groq_complete(self, model: str, messages: List[Dict],
+                       on_sentence: Optional[Callable[[str], None]] = None) -> str:
+        """Run one Groq chat completion (streamed sentence-by-sentence if on_sentence is given)"""
+        if on_sentence is None:
+            response = self.groq_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=500
+            )
+            return response.choices[0].message.content
+        
+        # Stream tokens and hand off each complete sentence while generation continues
+        stream = self.groq_client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=500,
+            stream=True
+        )
+        parts = []
+        buffer = ""
+        for chunk in stream:
+            if self._stream_cancelled.is_set():
+                # Nobody will hear the rest - close the connection instead of draining it
+                stream.close()
+                return "".join(parts)
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            if not delta:
+                continue
+            parts.append(delta)
+            buffer += delta
+            sentences, buffer = split_complete_sentences(buffer)
+            for sentence in sentences:
+                on_sentence(sentence)
+        # Flush whatever is left when the stream ends
+        if buffer.strip():
+            on_sentence(buffer.strip())
+        return "".join(parts)
+    
+    def _race_groq_models(self, models: List[str], messages: List[Dict],
+                          on_sentence: Optional[Callable[[str], None]] = None) -> Tuple[str, str]:
+        """Ask several Groq models at once and return (model, response) from the first to answer
+        
+        When streaming, the first model to produce a sentence wins and only its sentences
+        reach on_sentence; the others stop at their next sentence. If the winner fails
+        after it has started speaking, what it said is returned as the reply. Raises the
+        last error if every model fails.
+        """
+        winner = []
+        winner_lock = threading.Lock()
+        
+        def claim(model: str) -> bool:
+            with winner_lock:
+                if not winner:
+                    winner.append(model)
+                return winner[0] == model
+        
+        def attempt(model: str) -> Tuple[str, str]:
+            print(f"🔄 Trying Groq model: {model}")
+            spoken = []
+            
+            def forward(sentence: str):
+                if not claim(model):
+                    raise ModelRaceLost(model)
+                spoken.append(sentence)
+                on_sentence(sentence)
+            
+            # PROVEN WORKING: Use Groq SDK for chat (same as Praiser)
+            try:
+                message = self._groq_complete(model, messages, forward if on_sentence else None)
+            except ModelRaceLost:
+                raise
+            except Exception as e:
+                if not spoken:
+                    raise
+                # Already speaking as the winner - another model would start the reply over
+                print(f"⚠️  Model {model} cut off: {str(e)[:100]}")
+                self._partial_reply = True
+                return model, " ".join(spoken)
+            if not claim(model):
+                raise ModelRaceLost(model)
+            return model, message
+        
+        # Losing attempts may still be running when the reply is added to the history
+        messages = list(messages)
+        executor = ThreadPoolExecutor(max_workers=len(models), thread_name_prefix="GroqModelRace")
+        try:
+            futures = {executor.submit(attempt, model): model for model in models}
+            last_error = None
+            for future in as_completed(futures):
+                model = futures[future]
+                try:
+                    return future.result()
+                except ModelRaceLost:
+                    continue
+                except Exception as e:
+                    last_error = e
+                    error_str = str(e)
+                    # Skip model if not found or decommissioned
+                    if MODEL_GONE_RE.search(error_str):
+                        print(f"⚠️  Model {model} not available, trying next...")
+                    # Try next on rate limit
+                    elif RATE_LIMIT_RE.search(error_str):
+                        print(f"⚠️  Model {model} rate limited, trying next...")
+                    # Other errors - still try next
+                    else:
+                        print(f"⚠️  Model {model} error, trying next...")
+            raise last_error or Exception("No Groq model answered")
+        finally:
+            # Don't wait for the losers - they give up at their next sentence or when they finish
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_groq_response(self, messages: List[Dict],
+                          on_sentence: Optional[Callable[[str], None]] = None) -> str:
+        """Get response from Groq - use cached working model (re-check every hour)
+        
+        Models are only raced when there is no known working model to try first.
+        """
         if not self.groq_client:
             return "I'm sorry, Groq is not available."
         
@@ -347,49 +615,57 @@ with natural rhythm and emphasis.""",
         use_cached_model = False
         
         if self.groq_working_model:
+            # Use cached working model directly - no searching!
+            use_cached_model = True
             # Check if cache is still valid (1 hour)
             # Handle case where check_time might be 0 or None
             check_time = self.groq_model_check_time or 0
             if check_time > 0 and (now - check_time < self.GROQ_MODEL_CHECK_INTERVAL):
-                # Use cached working model directly - no searching!
-                use_cached_model = True
                 print(f"💡 Using cached Groq model: {self.groq_working_model}")
+            else:
+                # Hourly re-check - one real request is cheaper than racing the whole list
+                print(f"🔄 Re-checking cached Groq model: {self.groq_working_model}")
+            spoken = []
+            
+            def forward(sentence: str):
+                spoken.append(sentence)
+                on_sentence(sentence)
+            
+            # Try the cached model first
+            try:
+                assistant_message = self._groq_complete(self.groq_working_model, messages,
+                                                        forward if on_sentence else None)
+                # Handle None or empty response
+                if not assistant_message or assistant_message.strip() == "":
+                    assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
+                elif not isinstance(assistant_message, str):
+                    assistant_message = str(assistant_message)
                 
-                # Try the cached model first
-                try:
-                    response = self.groq_client.chat.completions.create(
-                        model=self.groq_working_model,
-                        messages=messages,
-                        temperature=0.7,
-                        max_tokens=500
-                    )
-                    
-                    assistant_message = response.choices[0].message.content
-                    # Handle None or empty response
-                    if not assistant_message or assistant_message.strip() == "":
-                        assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
-                    elif not isinstance(assistant_message, str):
-                        assistant_message = str(assistant_message)
-                    
-                    # Update cache time
-                    self.groq_model_check_time = time.time()
-                    self.config["groq_model_check_time"] = self.groq_model_check_time
-                    self.save_config()
-                    
-                    self.add_message('assistant', assistant_message)
-                    print(f"✅ Response from Groq ({self.groq_working_model})")
-                    return assistant_message
-                except Exception as e:
-                    # Cached model failed - clear cache and search for new one
-                    error_str = str(e)
-                    if any(x in error_str.lower() for x in ["404", "model_not_found", "decommissioned"]):
-                        print(f"⚠️  Cached model {self.groq_working_model} no longer available - searching for new one...")
-                    else:
-                        print(f"⚠️  Cached model {self.groq_working_model} failed - searching for new one...")
-                    self.groq_working_model = None
-                    use_cached_model = False
+                # Update cache time (same model - no need to hit the disk on every reply)
+                self.groq_model_check_time = time.time()
+                self.config["groq_model_check_time"] = self.groq_model_check_time
+                self.save_config_debounced()
+                
+                self.add_message('assistant', assistant_message)
+                print(f"✅ Response from Groq ({self.groq_working_model})")
+                return assistant_message
+            except Exception as e:
+                if spoken:
+                    # Part of the reply is already being spoken - a search would repeat it
+                    print(f"⚠️  Model {self.groq_working_model} cut off: {str(e)[:100]}")
+                    self._partial_reply = True
+                    partial = " ".join(spoken)
+                    self.add_message('assistant', partial)
+                    return partial
+                # Cached model failed - clear cache and search for new one
+                if MODEL_GONE_RE.search(str(e)):
+                    print(f"⚠️  Cached model {self.groq_working_model} no longer available - searching for new one...")
+                else:
+                    print(f"⚠️  Cached model {self.groq_working_model} failed - searching for new one...")
+                self.groq_working_model = None
+                use_cached_model = False
         
-        # No cached model or cache expired - fetch and try models
+        # No cached model or it failed - fetch and race models
         if not use_cached_model:
             # Fetch models dynamically (no hardcoding)
             models = self.fetch_groq_models()
@@ -398,52 +674,32 @@ with natural rhythm and emphasis.""",
             
             last_error = None
             
-            # Try each model until one works
-            for model in models:
+            # Race models a few at a time - an outage costs one timeout, not one per model
+            for i in range(0, len(models), self.GROQ_RACE_WIDTH):
                 try:
-                    print(f"🔄 Trying Groq model: {model}")
-                    
-                    # PROVEN WORKING: Use Groq SDK for chat (same as Praiser)
-                    response = self.groq_client.chat.completions.create(
-                        model=model,
-                        messages=messages,
-                        temperature=0.7,
-                        max_tokens=500
+                    model, assistant_message = self._race_groq_models(
+                        models[i:i + self.GROQ_RACE_WIDTH], messages, on_sentence
                     )
-                    
-                    assistant_message = response.choices[0].message.content
-                    # Handle None or empty response
-                    if not assistant_message or assistant_message.strip() == "":
-                        assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
-                    elif not isinstance(assistant_message, str):
-                        assistant_message = str(assistant_message)
-                    
-                    # Cache this working model for 1 hour (save to config)
-                    self.groq_working_model = model
-                    self.groq_model_check_time = time.time()
-                    self.config["groq_working_model"] = model
-                    self.config["groq_model_check_time"] = self.groq_model_check_time
-                    self.save_config()
-                    
-                    self.add_message('assistant', assistant_message)
-                    print(f"✅ Response from Groq ({model}) - cached for 1 hour")
-                    return assistant_message
-                        
                 except Exception as e:
                     last_error = e
-                    error_str = str(e)
-                    
-                    # Skip model if not found or decommissioned
-                    if any(x in error_str.lower() for x in ["404", "model_not_found", "decommissioned"]):
-                        print(f"⚠️  Model {model} not available, trying next...")
-                        continue
-                    # Try next on rate limit
-                    if any(x in error_str.lower() for x in ["429", "rate_limit", "503", "over capacity"]):
-                        print(f"⚠️  Model {model} rate limited, trying next...")
-                        continue
-                    # Other errors - still try next
-                    print(f"⚠️  Model {model} error, trying next...")
                     continue
+                
+                # Handle None or empty response
+                if not assistant_message or assistant_message.strip() == "":
+                    assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
+                elif not isinstance(assistant_message, str):
+                    assistant_message = str(assistant_message)
+                
+                # Cache this working model for 1 hour (save to config)
+                self.groq_working_model = model
+                self.groq_model_check_time = time.time()
+                self.config["groq_working_model"] = model
+                self.config["groq_model_check_time"] = self.groq_model_check_time
+                self.save_config()
+                
+                self.add_message('assistant', assistant_message)
+                print(f"✅ Response from Groq ({model}) - cached for 1 hour")
+                return assistant_message
             
             # All models failed - clear working model cache
             self.groq_working_model = None
@@ -458,95 +714,63 @@ with natural rhythm and emphasis.""",
             self.add_message('assistant', error_msg)
             return error_msg
     
+    def interrupt_speaking(self):
+        """User interrupt (voice, keyboard or a spoken command)
+        
+        Unlike stop_speaking this also works between the sentences of a streamed
+        reply, and stops receiving the rest of it right away.
+        """
+        if not self.is_speaking and not self._reply_speaking.is_set():
+            return
+        self._stream_cancelled.set()
+        self._halt_speech()
+    
     def stop_speaking(self):
         """Immediately stop Daisy from speaking (interrupt)"""
         if not self.is_speaking:
             return
-        
+        self._halt_speech()
+    
+    def _halt_speech(self):
+        """Flag the interrupt and kill the current player"""
         self.is_speaking = False
         self.interrupt_detected = True
         self.interrupt_event.set()  # Signal interrupt event
         print("\n🔇 [Stopping speech...]")
         
         # Kill the current audio process FIRST (most important)
-        if self.current_audio_process and self.current_audio_process.poll() is None:
-            try:
-                # Terminate the process
-                self.current_audio_process.terminate()
-                try:
-                    self.current_audio_process.wait(timeout=0.2)
-                except:
-                    pass
-            except:
-                pass
-                
-            # Force kill if still running
-            if self.current_audio_process and self.current_audio_process.poll() is None:
-                try:
-                    self.current_audio_process.kill()
-                    self.current_audio_process.wait(timeout=0.1)
-                except:
-                    pass
-        
-        # Kill ALL say processes (force kill with -9 signal) - do this multiple times
-        for _ in range(2):  # Try twice to make sure
-            try:
-                subprocess.run(["pkill", "-9", "say"], check=False,
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except:
-                pass
-            time.sleep(0.1)  # Small delay between attempts
-        
-        # Kill afplay processes too (force kill) - try multiple times
-        for _ in range(2):
-            try:
-                subprocess.run(["pkill", "-9", "afplay"], check=False, 
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except:
-                pass
-            time.sleep(0.1)
+        self._kill_audio_process(self.current_audio_process)
         
         self.current_audio_process = None
         print("✅ [Speech stopped - ready to listen]")
     
+    def _kill_audio_process(self, proc: Optional[subprocess.Popen]):
+        """SIGKILL a player's process group (players are started with start_new_session=True)"""
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            # Only our own player is signalled - no pkill of other apps' say/afplay
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.wait(timeout=0.1)  # Reap it
+        except (ProcessLookupError, PermissionError, subprocess.TimeoutExpired):
+            pass
+    
     def _check_piper_available(self) -> bool:
         """Check if Piper TTS is available"""
-        try:
-            # Try importing directly (more reliable)
-            try:
-                from piper import PiperVoice
-                print("✅ Piper TTS: Direct import successful")
-                return True
-            except ImportError as e:
-                print(f"⚠️  Piper TTS: Direct import failed: {e}")
-                pass
-            
-            # Fallback: check if piper command-line tool is available
-            result = subprocess.run(
-                ["which", "piper"],
-                capture_output=True,
-                check=False
-            )
-            if result.returncode == 0:
-                print("✅ Piper TTS: Command-line tool found")
-                return True
-            
-            # Also check if piper Python package is available via subprocess
-            result = subprocess.run(
-                ["python3", "-c", "import piper"],
-                capture_output=True,
-                check=False
-            )
-            if result.returncode == 0:
-                print("✅ Piper TTS: Subprocess import successful")
-                return True
-            else:
-                stderr = result.stderr.decode() if result.stderr else ""
-                print(f"⚠️  Piper TTS: Subprocess import failed: {stderr[:100]}")
-            return False
-        except Exception as e:
-            print(f"⚠️  Piper TTS: Check exception: {e}")
-            return False
+        # find_spec only locates the package - importing it here would load
+        # onnxruntime at startup, and probing via a python3 subprocess costs
+        # a whole interpreter start
+        if importlib.util.find_spec("piper") is not None:
+            print("✅ Piper TTS: Python package found")
+            return True
+        
+        # Fallback: check if piper command-line tool is available
+        if shutil.which("piper"):
+            print("✅ Piper TTS: Command-line tool found")
+            return True
+        
+        print("⚠️  Piper TTS: neither the Python package nor the piper command was found")
+        return False
     
     def detect_language(self, text: str) -> str:
         """Detect language from text - returns 'el' for Greek, 'en' for English, etc."""
@@ -564,58 +788,150 @@ with natural rhythm and emphasis.""",
         
         return "en"  # Default to English
     
-    def _piper_tts(self, text: str) -> Optional[str]:
+    def _cached_language(self, text: str) -> str:
+        """detect_language, memoized for text that is spoken again (repeated replies, retries)"""
+        lang = self._lang_cache.get(text)
+        if lang is None:
+            lang = self.detect_language(text)
+            self._lang_cache[text] = lang
+            if len(self._lang_cache) > self.LANG_CACHE_SIZE:
+                self._lang_cache.popitem(last=False)
+        return lang
+    
+    def _piper_model_name(self, text: str, lang: Optional[str] = None) -> str:
+        """Pick the Piper model for lang (detected from text if not given)"""
+        detected_lang = lang or self._cached_language(text)
+        if detected_lang == "el":
+            # Use Greek model
+            model_name = self.config.get("greek_piper_model", "el_GR-rapunzelina-low")
+            print(f"🇬🇷 Using Greek Piper TTS model: {model_name}")
+        else:
+            # Use English model
+            model_name = self.config.get("piper_model", "en_US-lessac-high")
+            print(f"🇺🇸 Using English Piper TTS model: {model_name}")
+        return model_name
+    
+    def _find_piper_model(self, model_name: str) -> Tuple[Optional[str], Optional[str]]:
+        """Find (model_path, config_path) for a Piper voice in common locations"""
+        paths = self._piper_paths.get(model_name)
+        if paths is None:
+            paths = self._search_piper_model(model_name)
+            if paths[0]:
+                # Only cache hits so a voice downloaded while running is picked up
+                self._piper_paths[model_name] = paths
+        return paths
+    
+    def _search_piper_model(self, model_name: str) -> Tuple[Optional[str], Optional[str]]:
+        """Search the filesystem for a Piper voice's model and config files"""
+        possible_model_paths = [
+            (Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}.onnx", 
+             Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}.onnx.json"),
+            (Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}" / "model.onnx",
+             Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}" / "config.json"),
+            (Path("/usr/local/share/piper/voices") / f"{model_name}.onnx",
+             Path("/usr/local/share/piper/voices") / f"{model_name}.onnx.json"),
+            (Path("/opt/homebrew/share/piper/voices") / f"{model_name}.onnx",
+             Path("/opt/homebrew/share/piper/voices") / f"{model_name}.onnx.json"),
+        ]
+        for model, config in possible_model_paths:
+            if model.exists():
+                if config.exists():
+                    return str(model), str(config)
+                # Config might be in same directory with .json extension
+                fallback_config = Path(str(model) + ".json")
+                return str(model), str(fallback_config) if fallback_config.exists() else None
+        return None, None
+    
+    def _load_piper_voice(self, model_name: str):
+        """Return a loaded PiperVoice for model_name, or None if the model isn't installed"""
+        voice = self._piper_voices.get(model_name)
+        if voice is None:
+            model_path, config_path = self._find_piper_model(model_name)
+            if not model_path:
+                return None
+            from piper import PiperVoice
+            voice = PiperVoice.load(model_path, config_path=config_path)
+            self._piper_voices[model_name] = voice
+        return voice
+    
+    def _piper_stream(self, text: str, lang: Optional[str] = None) -> bool:
+        """Speak text with the Piper Python package, playing each chunk as soon as it is synthesized
+        
+        Returns False (nothing played) if streaming isn't possible - no raw PCM player,
+        no Python package or no local model - so the caller can use the WAV file path.
+        """
+        if not (FFPLAY_PATH or APLAY_PATH):
+            return False
+        try:
+            import piper  # noqa: F401
+        except ImportError:
+            return False
+        
+        voice = self._load_piper_voice(self._piper_model_name(text, lang))
+        if voice is None:
+            return False
+        
+        self.is_speaking = True
+        self.interrupt_event.clear()
+        self.interrupt_detected = False
+        player = None
+        try:
+            for audio_chunk in voice.synthesize(text):
+                if self.interrupt_event.is_set():
+                    break
+                if player is None:
+                    # Start the player on the first chunk (its sample rate comes with the audio)
+                    player = subprocess.Popen(
+                        pcm_player_command(audio_chunk.sample_rate),
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        start_new_session=True  # Own process group - stop_speaking() signals the group
+                    )
+                    self.current_audio_process = player
+                try:
+                    player.stdin.write(audio_chunk.audio_int16_bytes)
+                    player.stdin.flush()
+                except (BrokenPipeError, ValueError):
+                    # Player was stopped (interrupt)
+                    break
+            
+            if player:
+                try:
+                    player.stdin.close()
+                except (BrokenPipeError, ValueError):
+                    pass
+                # Let the buffered audio finish (interruptible)
+                while player.poll() is None and self.is_speaking:
+                    time.sleep(0.1)
+        finally:
+            self.is_speaking = False
+            self.current_audio_process = None
+        return True
+    
+    def _temp_audio_file(self, suffix: str) -> Path:
+        """Create a uniquely named audio file in ~/.daisy/audio (deleted once played)"""
+        fd, path = tempfile.mkstemp(prefix="daisy_", suffix=suffix,
+                                    dir=Path.home() / ".daisy" / "audio")
+        os.close(fd)
+        return Path(path)
+    
+    def _piper_tts(self, text: str, lang: Optional[str] = None) -> Optional[str]:
         """Generate speech using Piper TTS (fast, high-quality open-source TTS)"""
+        audio_file = None
         try:
-            audio_dir = Path.home() / ".daisy" / "audio"
-            # Use thread-safe counter to ensure unique filenames even when multiple threads call simultaneously
-            with self._audio_file_lock:
-                self._audio_file_counter += 1
-                counter = self._audio_file_counter
-            audio_file = audio_dir / f"daisy_piper_{int(time.time())}_{counter}.wav"
+            audio_file = self._temp_audio_file(".wav")
             
             # Detect language and use appropriate model
-            detected_lang = self.detect_language(text)
-            if detected_lang == "el":
-                # Use Greek model
-                model_name = self.config.get("greek_piper_model", "el_GR-rapunzelina-low")
-                print(f"🇬🇷 Using Greek Piper TTS model: {model_name}")
-            else:
-                # Use English model
-                model_name = self.config.get("piper_model", "en_US-lessac-high")
-                print(f"🇺🇸 Using English Piper TTS model: {model_name}")
+            model_name = self._piper_model_name(text, lang)
             
             # Try Python piper package first (easier to use)
             try:
-                from piper import PiperVoice
-                
-                # Try to find model in common locations
-                possible_model_paths = [
-                    (Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}.onnx", 
-                     Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}.onnx.json"),
-                    (Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}" / "model.onnx",
-                     Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}" / "config.json"),
-                    (Path("/usr/local/share/piper/voices") / f"{model_name}.onnx",
-                     Path("/usr/local/share/piper/voices") / f"{model_name}.onnx.json"),
-                    (Path("/opt/homebrew/share/piper/voices") / f"{model_name}.onnx",
-                     Path("/opt/homebrew/share/piper/voices") / f"{model_name}.onnx.json"),
-                ]
-                
-                model_path = None
-                config_path = None
-                for model, config in possible_model_paths:
-                    if model.exists():
-                        model_path = str(model)
-                        if config.exists():
-                            config_path = str(config)
-                        else:
-                            # Config might be in same directory with .json extension
-                            config_path = str(model) + ".json"
-                        break
+                # Cached after the first load; None if the model isn't installed
+                voice = self._load_piper_voice(model_name)
                 
-                if model_path and Path(model_path).exists():
+                if voice is not None:
                     # Use Python package
-                    voice = PiperVoice.load(model_path, config_path=config_path if Path(config_path).exists() else None)
                     # Synthesize returns iterable of AudioChunk
                     audio_chunks = voice.synthesize(text)
                     
@@ -635,9 +951,6 @@ with natural rhythm and emphasis.""",
                         all_audio_data += audio_chunk.audio_int16_bytes
                     
                     # Write proper WAV file with headers
-                    import wave
-                    import struct
-                    
                     with wave.open(str(audio_file), 'wb') as wav_file:
                         wav_file.setnchannels(sample_channels or 1)
                         wav_file.setsampwidth(sample_width or 2)
@@ -659,23 +972,12 @@ with natural rhythm and emphasis.""",
             
             # Fallback: Try piper command-line tool
             # Try to find model in common locations
-            possible_model_paths = [
-                Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}.onnx",
-                Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}" / "model.onnx",
-                Path("/usr/local/share/piper/voices") / f"{model_name}.onnx",
-                Path("/opt/homebrew/share/piper/voices") / f"{model_name}.onnx",
-            ]
-            
-            model_path = None
-            for path in possible_model_paths:
-                if path.exists():
-                    model_path = str(path)
-                    break
+            model_path, _ = self._find_piper_model(model_name)
             
             # If no model file found, try using just the model name (piper might find it)
             if not model_path:
                 print(f"⚠️  Piper model '{model_name}' not found in standard locations.")
-                print(f"   Searched: {[str(p) for p in possible_model_paths]}")
+                print(f"   Searched: ~/.local/share/piper/voices, /usr/local/share/piper/voices, /opt/homebrew/share/piper/voices")
                 print(f"   Please download the model from: https://github.com/rhasspy/piper/releases")
                 print(f"   Or install it using: python3 -m piper.download_voices {model_name}")
                 model_path = model_name  # Try anyway - piper might find it
@@ -691,22 +993,22 @@ with natural rhythm and emphasis.""",
             
             stdout, stderr = process.communicate(input=text, timeout=30)
             
-            if process.returncode == 0 and audio_file.exists():
+            if process.returncode == 0 and audio_file.stat().st_size > 0:
                 return str(audio_file)
             else:
                 if stderr:
                     print(f"⚠️  Piper TTS error: {stderr[:200]}")
-                return None
                 
         except subprocess.TimeoutExpired:
             print("⚠️  Piper TTS timeout")
-            return None
         except FileNotFoundError:
             print("⚠️  Piper TTS not found. Install with: pip3 install piper-tts")
-            return None
         except Exception as e:
             print(f"⚠️  Piper TTS error: {e}")
-            return None
+        # Nothing to play - don't leave the empty temp file behind
+        if audio_file:
+            audio_file.unlink(missing_ok=True)
+        return None
     
     def _play_audio_file(self, audio_file: str) -> Optional[bytes]:
         """Play an audio file and return audio data (interruptible)"""
@@ -723,7 +1025,8 @@ with natural rhythm and emphasis.""",
             self.current_audio_process = subprocess.Popen(
                 ["afplay", str(audio_path)],
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE
+                stderr=subprocess.PIPE,
+                start_new_session=True
             )
             
             # Poll while playing (so we can interrupt)
@@ -737,15 +1040,15 @@ with natural rhythm and emphasis.""",
             if self.current_audio_process:
                 self.current_audio_process = None
             
-            # Clean up after a delay (optional)
-            threading.Timer(10.0, lambda: audio_path.unlink() if audio_path.exists() else None).start()
-            
             return b""  # Return empty bytes for compatibility
             
         except Exception as e:
             print(f"⚠️  Audio playback error: {e}")
             self.is_speaking = False
             return None
+        finally:
+            # afplay has finished (or was killed) - the file is never replayed
+            Path(audio_file).unlink(missing_ok=True)
     
     def _process_text_for_natural_speech(self, text: str) -> str:
         """Process text to sound more human with natural pauses and emphasis"""
@@ -794,7 +1097,15 @@ with natural rhythm and emphasis.""",
         if tts_engine == "piper":
             if self.piper_available:
                 print("🔊 Using Piper TTS...")
-                audio_file = self._piper_tts(processed_text)
+                # Detect the language once for both the streaming and WAV file paths
+                lang = self._cached_language(processed_text)
+                # Stream straight to the speakers when possible (first audio after one chunk)
+                try:
+                    if self._piper_stream(processed_text, lang):
+                        return b""
+                except Exception as e:
+                    print(f"⚠️  Piper streaming error: {e} - using WAV file")
+                audio_file = self._piper_tts(processed_text, lang)
                 if audio_file:
                     print(f"✅ Piper TTS generated audio: {audio_file}")
                     return self._play_audio_file(audio_file)
@@ -831,12 +1142,7 @@ with natural rhythm and emphasis.""",
                 )
             
                 # Save audio file
-                audio_dir = Path.home() / ".daisy" / "audio"
-                # Use thread-safe counter to ensure unique filenames
-                with self._audio_file_lock:
-                    self._audio_file_counter += 1
-                    counter = self._audio_file_counter
-                audio_file = audio_dir / f"daisy_{int(time.time())}_{counter}.mp3"
+                audio_file = self._temp_audio_file(".mp3")
             
                     # Write audio to file
                 audio_data = b""
@@ -888,7 +1194,8 @@ with natural rhythm and emphasis.""",
                 self.current_audio_process = subprocess.Popen(
                     ["say", "-v", fallback_voice, "-r", "165", processed_text],
                     stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
+                    stderr=subprocess.PIPE,
+                    start_new_session=True
                 )
             except Exception as say_error:
                 print(f"⚠️  Error with say command: {say_error}")
@@ -897,7 +1204,8 @@ with natural rhythm and emphasis.""",
                     self.current_audio_process = subprocess.Popen(
                         ["say", "-v", fallback_voice, processed_text],
                         stdout=subprocess.DEVNULL,
-                        stderr=subprocess.PIPE
+                        stderr=subprocess.PIPE,
+                        start_new_session=True
                     )
                 except Exception as say_error2:
                     print(f"❌ Cannot use macOS say command: {say_error2}")
@@ -937,7 +1245,7 @@ with natural rhythm and emphasis.""",
                                 # Key pressed - interrupt immediately
                                 char = sys.stdin.read(1)
                                 print(f"\n⌨️  [KEY PRESSED! - Stopping immediately...]")
-                                self.stop_speaking()
+                                self.interrupt_speaking()
                                 break
                     except (OSError, ValueError, KeyboardInterrupt):
                         # Terminal errors - just use flags instead
@@ -950,23 +1258,7 @@ with natural rhythm and emphasis.""",
                         # Was interrupted - stop audio process immediately
                         print("🔇 [Audio playback interrupted - stopping now]")
                         # Force kill the audio process
-                        if self.current_audio_process and self.current_audio_process.poll() is None:
-                            try:
-                                self.current_audio_process.terminate()
-                                time.sleep(0.05)  # Very short wait
-                                if self.current_audio_process.poll() is None:
-                                    self.current_audio_process.kill()
-                                    time.sleep(0.05)
-                            except:
-                                pass
-                        # Also kill all say/afplay processes immediately
-                        try:
-                            subprocess.run(["pkill", "-9", "say"], check=False,
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                            subprocess.run(["pkill", "-9", "afplay"], check=False,
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        except:
-                            pass
+                        self._kill_audio_process(self.current_audio_process)
                         break
                     
                     # Check if audio is taking too long (might be stuck)
@@ -1007,6 +1299,7 @@ with natural rhythm and emphasis.""",
         """Listen for voice input and convert to text (can interrupt while Daisy is speaking)"""
         if not self.microphone:
             return None
+        sr = _lazy_sr()
         
         # If Daisy is speaking and interrupt detected, don't listen
         if self.is_speaking and self.interrupt_detected:
@@ -1060,7 +1353,7 @@ with natural rhythm and emphasis.""",
             
             if interruptible and any(cmd in text_lower for cmd in interrupt_commands):
                 # User wants to interrupt - stop speaking immediately
-                self.stop_speaking()
+                self.interrupt_speaking()
                 print("🔇 [Interrupted]")
                 # Don't add this to conversation history, just return None to continue listening
                 return None
@@ -1082,6 +1375,7 @@ with natural rhythm and emphasis.""",
         """Listen for interruptions while Daisy is speaking"""
         if not self.microphone or not self.is_speaking:
             return None
+        sr = _lazy_sr()
         
         try:
             # Quick listen for interrupt commands while speaking
@@ -1098,7 +1392,7 @@ with natural rhythm and emphasis.""",
                         # Check for interrupt commands
                         interrupt_commands = ["stop", "stop speaking", "stop talking", "quiet", "shush", "enough"]
                         if any(cmd in text_lower for cmd in interrupt_commands):
-                            self.stop_speaking()
+                            self.interrupt_speaking()
                             print("\n🔇 [Interrupted by voice command]")
                             return None
                     except:
@@ -1113,8 +1407,45 @@ with natural rhythm and emphasis.""",
         
         return None
     
-    def get_llm_response(self, user_input: str) -> str:
-        """Get response from LLM - try OpenAI first, then Groq fallback"""
+    def get_llm_response(self, user_input: str,
+                         on_sentence: Optional[Callable[[str], None]] = None) -> str:
+        """Get response from LLM - try OpenAI first, then Groq fallback
+        
+        If on_sentence is given, Groq responses are streamed and each complete
+        sentence is passed to it while the rest is still being generated.
+        A prompt asked again within the hour in the same context gets the earlier
+        reply without an API call.
+        """
+        cache_key = None
+        if not UNCACHEABLE_PROMPT_RE.search(user_input):
+            recent = self.get_conversation_context()[-(RESPONSE_CACHE_CONTEXT_MESSAGES - 1):]
+            payload = json.dumps({
+                "system": self.system_prompt,
+                "msgs": recent + [{"role": "user", "content": user_input.strip().lower()}],
+            }, sort_keys=True)
+            cache_key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        cached = self._response_cache.get(cache_key) if cache_key else None
+        if cached and time.time() - cached[0] < self.RESPONSE_CACHE_TTL:
+            self._response_cache.move_to_end(cache_key)
+            self.add_message('user', user_input)
+            self.add_message('assistant', cached[1])
+            print("💡 Response from cache")
+            return cached[1]
+        
+        self._partial_reply = False
+        response = self._request_llm_response(user_input, on_sentence)
+        # Failure replies all start with "I'm sorry" - only cache real, complete answers
+        if (cache_key and not response.startswith("I'm sorry")
+                and not self._stream_cancelled.is_set() and not self._partial_reply):
+            self._response_cache[cache_key] = (time.time(), response)
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response
+    
+    def _request_llm_response(self, user_input: str,
+                              on_sentence: Optional[Callable[[str], None]] = None) -> str:
+        """Ask OpenAI (then Groq on failure) for a reply to user_input"""
         # Add user message
         self.add_message('user', user_input)
         messages = self.get_conversation_context()
@@ -1127,7 +1458,7 @@ with natural rhythm and emphasis.""",
                 # Use cached status - skip OpenAI, go straight to Groq
                 if self.groq_client:
                     print("💡 Using Groq (OpenAI quota exceeded - cached)")
-                    return self.get_groq_response(messages)
+                    return self.get_groq_response(messages, on_sentence)
                 else:
                     error_msg = "I'm sorry, I've exceeded my API quota. Please check your OpenAI account billing and usage limits."
                     self.add_message('assistant', error_msg)
@@ -1188,7 +1519,7 @@ with natural rhythm and emphasis.""",
                         # Still failed, try Groq if available
                         if self.groq_client:
                             print("🔄 Falling back to Groq...")
-                            return self.get_groq_response(messages)
+                            return self.get_groq_response(messages, on_sentence)
                         error_msg = "I'm sorry, I'm having trouble connecting to the AI service. Please check your API key and account status."
                 # Fallback to Groq on quota/401 errors
                 elif any(x in error_str for x in ["429", "401", "quota", "insufficient_quota"]):
@@ -1198,14 +1529,14 @@ with natural rhythm and emphasis.""",
                     
                     if self.groq_client:
                         print("🔄 Falling back to Groq (quota/API key error - cached for 1 hour)")
-                        return self.get_groq_response(messages)
+                        return self.get_groq_response(messages, on_sentence)
                     error_msg = "I'm sorry, I've exceeded my API quota. Please check your OpenAI account billing and usage limits."
                     print(f"❌ Quota exceeded - check your OpenAI account (cached for 1 hour)")
                 else:
                     # Other errors - try Groq if available
                     if self.groq_client:
                         print("🔄 Falling back to Groq...")
-                        return self.get_groq_response(messages)
+                        return self.get_groq_response(messages, on_sentence)
                     error_msg = f"I'm sorry, I encountered an error: {str(e)}"
                 
                 print(f"❌ LLM Error: {e}")
@@ -1215,7 +1546,7 @@ with natural rhythm and emphasis.""",
         # Use Groq if OpenAI not available
         if self.groq_client:
             print("🔄 Using Groq (OpenAI not available)...")
-            return self.get_groq_response(messages)
+            return self.get_groq_response(messages, on_sentence)
         
         error_msg = "I'm sorry, no AI service is available. Please check your API keys."
         self.add_message('assistant', error_msg)
@@ -1238,7 +1569,10 @@ with natural rhythm and emphasis.""",
         
         conversation_data = {
             "timestamp": timestamp,
-            "messages": [asdict(msg) for msg in self.conversation_history]
+            "messages": [
+                {**asdict(msg), "timestamp": datetime.fromtimestamp(msg.timestamp).isoformat()}
+                for msg in self.conversation_history
+            ]
         }
         
         with open(conv_file, 'w') as f:
@@ -1282,75 +1616,24 @@ with natural rhythm and emphasis.""",
                     break
                 
                 
-                # Get LLM response
-                print("\n🔄 Thinking...")
-                response = self.get_llm_response(user_input)
-                
-                # Speak response (interruptible - say "stop" to interrupt)
-                print(f"🤖 Daisy: {response}")
-                print("💡 (Say 'STOP' loudly OR press ANY KEY to interrupt)")
-                
                 # Reset interrupt flags BEFORE starting audio
                 self.interrupt_event.clear()
                 self.interrupt_detected = False
                 self.is_speaking = False  # Will be set to True in text_to_speech
                 
-                # Start listening for voice interrupt BEFORE starting to speak
-                interrupt_voice = threading.Thread(
-                    target=self._listen_for_interrupt,
-                    daemon=True,
-                    name="VoiceInterruptListener"
-                )
-                interrupt_voice.start()
-                
-                # Start keyboard interrupt listener (non-blocking backup)
-                keyboard_interrupt = threading.Thread(
-                    target=self._keyboard_interrupt_listener,
-                    daemon=True,
-                    name="KeyboardInterruptListener"
-                )
-                keyboard_interrupt.start()
-                
-                # Also set up a simple stdin monitor in main thread as backup
-                # This will work even if the thread doesn't
-                import sys
-                import select
-                
-                # Small delay to let interrupt listeners start properly
-                time.sleep(0.3)
-                
-                # Start speaking (can be interrupted by voice or keyboard)
-                # Start audio in a separate checkable way
-                self.text_to_speech(response)
+                # Get LLM response (Groq replies start speaking at the first sentence)
+                print("\n🔄 Thinking...")
+                response, sentence_speaker = self._get_streamed_response(user_input)
                 
-                # While speaking, check for keyboard input in main thread (most reliable)
-                if self.is_speaking:
-                    print("⌨️  [Press ANY KEY to interrupt while speaking...]")
-                    start_speak_time = time.time()
-                    while self.is_speaking and (time.time() - start_speak_time < 300):  # Max 5 min
-                        # Check if stdin has input (non-blocking)
-                        if sys.stdin.isatty():
-                            if select.select([sys.stdin], [], [], 0.1)[0]:
-                                # User pressed a key - interrupt immediately
-                                print(f"\n⌨️  [KEY DETECTED - Stopping immediately!]")
-                                self.stop_speaking()
-                                break
-                        
-                        # Also check interrupt flags
-                        if self.interrupt_event.is_set() or self.interrupt_detected:
-                            break
-                        
-                        # Check if audio process finished
-                        if self.current_audio_process and self.current_audio_process.poll() is not None:
-                            break
-                        
-                        time.sleep(0.05)  # Check every 50ms
+                # Speak response (interruptible - say "stop" to interrupt)
+                print(f"🤖 Daisy: {response}")
+                print("💡 (Say 'STOP' loudly OR press ANY KEY to interrupt)")
                 
-                # Wait for interrupt listeners to finish
-                if interrupt_voice.is_alive():
-                    interrupt_voice.join(timeout=0.5)
-                if keyboard_interrupt.is_alive():
-                    keyboard_interrupt.join(timeout=0.5)
+                if sentence_speaker:
+                    # Already being spoken sentence-by-sentence - wait for it to finish
+                    sentence_speaker.join()
+                else:
+                    self._speak_response(response)
                 
                 self.show_notification("Daisy", response[:100])
                 
@@ -1368,6 +1651,122 @@ with natural rhythm and emphasis.""",
                 traceback.print_exc()
                 time.sleep(1)
     
+    def _get_streamed_response(self, user_input: str) -> Tuple[str, Optional[threading.Thread]]:
+        """Get the LLM response, speaking complete sentences while it is still streaming
+        
+        Returns (response, speaker). speaker is the thread still speaking the streamed
+        sentences, or None if nothing was streamed and the caller should speak response.
+        """
+        sentence_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        streamed_sentences = []
+        self._stream_cancelled.clear()
+        sentence_speaker = threading.Thread(
+            target=self._speak_sentences,
+            args=(sentence_queue,),
+            daemon=True,
+            name="SentenceSpeaker"
+        )
+        sentence_speaker.start()
+        
+        def on_sentence(sentence: str):
+            streamed_sentences.append(sentence)
+            sentence_queue.put(sentence)
+        
+        response = self.get_llm_response(user_input, on_sentence=on_sentence)
+        sentence_queue.put(None)  # No more sentences
+        if not streamed_sentences:
+            sentence_speaker.join()
+            return response, None
+        return response, sentence_speaker
+    
+    def _speak_sentences(self, sentence_queue: "queue.Queue[Optional[str]]"):
+        """Background thread that speaks streamed sentences in order (None = end of response)
+        
+        The interrupt listeners are started once, at the first sentence, and run until
+        the whole reply has been spoken.
+        """
+        listeners = []
+        self._reply_speaking.set()
+        try:
+            while True:
+                sentence = sentence_queue.get()
+                if sentence is None:
+                    break
+                if self.interrupt_detected:
+                    # User interrupted (interrupt_speaking already cancelled the stream) - drop the rest
+                    continue
+                if not listeners:
+                    listeners = self._start_interrupt_listeners()
+                self.text_to_speech(sentence)
+        finally:
+            self._reply_speaking.clear()
+            for listener in listeners:
+                if listener.is_alive():
+                    listener.join(timeout=0.5)
+    
+    def _start_interrupt_listeners(self) -> List[threading.Thread]:
+        """Start the voice (VAD) and keyboard interrupt listener threads"""
+        # Start listening for voice interrupt BEFORE starting to speak
+        interrupt_voice = threading.Thread(
+            target=self._listen_for_interrupt,
+            daemon=True,
+            name="VoiceInterruptListener"
+        )
+        interrupt_voice.start()
+        
+        # Start keyboard interrupt listener (non-blocking backup)
+        keyboard_interrupt = threading.Thread(
+            target=self._keyboard_interrupt_listener,
+            daemon=True,
+            name="KeyboardInterruptListener"
+        )
+        keyboard_interrupt.start()
+        return [interrupt_voice, keyboard_interrupt]
+    
+    def _speak_response(self, response: str):
+        """Speak a full response with voice + keyboard interrupt monitoring"""
+        listeners = self._start_interrupt_listeners()
+        
+        # Also set up a simple stdin monitor in main thread as backup
+        # This will work even if the thread doesn't
+        import sys
+        import select
+        
+        # Small delay to let interrupt listeners start properly
+        time.sleep(0.3)
+        
+        # Start speaking (can be interrupted by voice or keyboard)
+        # Start audio in a separate checkable way
+        self.text_to_speech(response)
+        
+        # While speaking, check for keyboard input in main thread (most reliable)
+        if self.is_speaking:
+            print("⌨️  [Press ANY KEY to interrupt while speaking...]")
+            start_speak_time = time.time()
+            while self.is_speaking and (time.time() - start_speak_time < 300):  # Max 5 min
+                # Check if stdin has input (non-blocking)
+                if sys.stdin.isatty():
+                    if select.select([sys.stdin], [], [], 0.1)[0]:
+                        # User pressed a key - interrupt immediately
+                        print(f"\n⌨️  [KEY DETECTED - Stopping immediately!]")
+                        self.interrupt_speaking()
+                        break
+                
+                # Also check interrupt flags
+                if self.interrupt_event.is_set() or self.interrupt_detected:
+                    break
+                
+                # Check if audio process finished
+                if self.current_audio_process and self.current_audio_process.poll() is not None:
+                    break
+                
+                time.sleep(0.05)  # Check every 50ms
+        
+        # Wait for interrupt listeners to finish
+        for listener in listeners:
+            if listener.is_alive():
+                listener.join(timeout=0.5)
+    
     def _keyboard_interrupt_listener(self):
         """Background thread that listens for keyboard input to interrupt (Spacebar/Enter)"""
         import sys
@@ -1387,7 +1786,8 @@ with natural rhythm and emphasis.""",
             
             print("⌨️  [Keyboard listener active - press Spacebar or Enter to interrupt]")
             
-            while self.is_speaking and not self.interrupt_event.is_set():
+            while ((self.is_speaking or self._reply_speaking.is_set())
+                   and not self.interrupt_event.is_set()):
                 try:
                     # Check if there's input waiting (non-blocking with short timeout)
                     ready, _, _ = select.select([sys.stdin], [], [], 0.1)
@@ -1396,7 +1796,7 @@ with natural rhythm and emphasis.""",
                         # Spacebar (32) or Enter (10/13) triggers interrupt
                         if char in [' ', '\n', '\r', '\x03']:  # Space, Enter, or Ctrl+C
                             print(f"\n⌨️  [Keyboard interrupt detected! Stopping...]")
-                            self.stop_speaking()
+                            self.interrupt_speaking()
                             break
                 except (OSError, ValueError, KeyboardInterrupt) as e:
                     # Handle terminal errors gracefully
@@ -1418,14 +1818,13 @@ with natural rhythm and emphasis.""",
     def _listen_for_interrupt(self):
         """Background thread that uses direct pyaudio VAD to detect ANY user speech while Daisy is speaking"""
         # Use pyaudio directly for VAD - more reliable than speech_recognition during audio playback
-        if not PYAUDIO_AVAILABLE:
+        pyaudio = _lazy_pyaudio()
+        if pyaudio is None:
             print("⚠️  [VAD: pyaudio not available - use keyboard to interrupt]")
             return
         
         print("🎤 [VAD active - start speaking anytime to interrupt]")
         
-        import pyaudio
-        
         # Try to import audioop (deprecated in Python 3.13+, but still works)
         try:
             import audioop
@@ -1486,7 +1885,8 @@ with natural rhythm and emphasis.""",
                 time.sleep(0.05)
                 wait_count += 1
             
-            while self.is_speaking and not self.interrupt_event.is_set():
+            while ((self.is_speaking or self._reply_speaking.is_set())
+                   and not self.interrupt_event.is_set()):
                 try:
                     frame_count += 1
                     
@@ -1496,6 +1896,10 @@ with natural rhythm and emphasis.""",
                         time.sleep(0.05)
                         continue
                     elif self.current_audio_process.poll() is not None:
+                        if self._reply_speaking.is_set():
+                            # Between sentences of a streamed reply - wait for the next one
+                            time.sleep(0.05)
+                            continue
                         # Audio finished - exit
                         break
                     
@@ -1535,7 +1939,7 @@ with natural rhythm and emphasis.""",
                         # If multiple consecutive frames with voice, interrupt immediately
                         if consecutive_voice >= frames_needed:
                             print(f"🔇 [User speaking detected! (RMS: {rms}) - Stopping immediately...]")
-                            self.stop_speaking()
+                            self.interrupt_speaking()
                             break
                     else:
                         # Reset counter if no voice detected
@@ -1572,8 +1976,11 @@ with natural rhythm and emphasis.""",
     
     def respond_to_text(self, text: str) -> str:
         """Respond to text input (for integration with other systems)"""
-        response = self.get_llm_response(text)
-        self.text_to_speech(response)
+        response, sentence_speaker = self._get_streamed_response(text)
+        if sentence_speaker:
+            sentence_speaker.join()
+        else:
+            self.text_to_speech(response)
         return response
 
 
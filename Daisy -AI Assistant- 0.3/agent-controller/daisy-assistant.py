@@ -10,17 +10,29 @@ Features:
 
 import json
 import os
+import atexit
 import subprocess
 import time
 import re
+import struct
+import wave
 import base64
+import hashlib
 import requests
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import threading
-from dataclasses import dataclass, asdict
+import queue
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import chain
 from datetime import datetime
 import sys
+import select
+import signal
+import termios
+import tty
 
 # Core dependencies
 try:
@@ -55,7 +67,13 @@ except ImportError:
     PYAUDIO_AVAILABLE = False
     # pyaudio not required - speech_recognition can work without it
 
-import io
+
+# Optional faster JSON encoder for saved conversations
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Groq SDK import (PROVEN WORKING - matches Praiser)
 try:
@@ -65,12 +83,141 @@ except ImportError:
     GROQ_AVAILABLE = False
     Groq = None
 
-@dataclass
-class ConversationMessage:
-    """Represents a message in the conversation"""
+# Text cleaning for TTS - compiled once instead of on every utterance
+# Emojis - TTS engines try to read them as words (e.g., "smiley face")
+EMOJI_RANGES = [
+    (0x1F600, 0x1F64F),  # emoticons
+    (0x1F300, 0x1F5FF),  # symbols & pictographs
+    (0x1F680, 0x1F6FF),  # transport & map symbols
+    (0x1F1E0, 0x1F1FF),  # flags (iOS)
+    (0x2702, 0x27B0),  # dingbats
+    (0x24C2, 0x1F251),  # enclosed characters
+    (0x1F900, 0x1F9FF),  # supplemental symbols
+    (0x1FA00, 0x1FA6F),  # chess symbols
+    (0x1FA70, 0x1FAFF),  # symbols and pictographs extended-A
+    (0x2600, 0x26FF),  # miscellaneous symbols
+    (0x2700, 0x27BF),  # dingbats
+]
+
+def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge overlapping or adjacent (lo, hi) codepoint ranges"""
+    merged = []
+    for lo, hi in sorted(ranges):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+# Built from the merged ranges (0x24C2-0x1F251 already covers five of them) - the
+# regex tests every character against the class, and 4 ranges are ~3x faster than 11
+EMOJI_RE = re.compile(
+    "[" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in merge_ranges(EMOJI_RANGES)) + "]+"
+)
+# Nothing below this codepoint is an emoji (covers ASCII, Latin and Greek text)
+EMOJI_MIN_CHAR = chr(min(lo for lo, _ in EMOJI_RANGES))
+
+def strip_emojis(text: str) -> str:
+    """Remove emojis, skipping the regex for text that can't contain any"""
+    # isascii() is O(1) for ASCII strings and max() runs in C - most replies stop here
+    if text.isascii() or max(text) < EMOJI_MIN_CHAR:
+        return text
+    return EMOJI_RE.sub('', text)
+
+# Markdown table lines, with their newline: rows (two or more pipes) and
+# separators (only dashes, pipes, colons and whitespace)
+TABLE_LINE_RE = re.compile(r'^(?:[^\n]*\|[^\n]*\|[^\n]*|(?:[^\S\n]|[|:\-])+)$\n?', re.MULTILINE)
+# Markdown emphasis markers - deleting them all unwraps **bold**, *italic*, __bold__,
+# _italic_, ~~strikethrough~~ and `code` in one C-level pass instead of a regex per marker
+MARKDOWN_MARKER_TABLE = str.maketrans('', '', '*_~`')
+# Markdown headers - removed with the space after them
+MARKDOWN_HEADER_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+# Remaining special characters that TTS tries to read as words
+SPECIAL_CHAR_TABLE = str.maketrans('', '', '#|')
+# Applied in order after the markers are deleted
+MARKDOWN_SUBS = [
+    # Remove bullet points and list markers
+    (re.compile(r'^\s*[-*+]\s+', re.MULTILINE), ''),  # Remove - * + bullets
+    (re.compile(r'^\s*\d+\.\s+', re.MULTILINE), ''),  # Remove numbered lists
+    # Clean whitespace (but preserve natural spacing - don't manipulate punctuation)
+    (re.compile(r'\n\s*\n\s*\n+'), '\n\n'),  # Remove multiple blank lines
+    # Multiple spaces/tabs to single space - single spaces aren't matched, so they
+    # aren't pointlessly replaced with themselves
+    (re.compile(r' [ \t]+|\t[ \t]*'), ' '),
+]
+# Anything the passes above could change in ASCII text: markdown characters, newlines,
+# tabs, double spaces, a leading list marker or a separator-only line
+NEEDS_CLEANING_RE = re.compile(r'[*#_~`|\t\n]|  |^\s*(?:[-+]|\d+\.)\s|^[\s:\-]+$')
+
+# Language detection - Greek and Greek Extended, and all letters counted for the ratio.
+# Matched as runs (words), so findall builds one string per word rather than per letter
+GREEK_RE = re.compile(r'[\u0370-\u03FF\u1F00-\u1FFF]+')
+LETTER_RE = re.compile(r'[a-zA-Z\u0370-\u03FF\u1F00-\u1FFF]+')
+# Control characters in transcribed input come from keyboard escape sequences
+CONTROL_CHAR_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+
+# Voice commands - matched against the words of the transcript, so "stop" no longer
+# fires on "nonstop" or "ty" on "pretty". Every stop phrase ("stop speaking",
+# "stop talking") contains "stop", so single words cover them
+WORD_RE = re.compile(r"[\w']+")
+INTERRUPT_WORDS = frozenset({"stop", "quiet", "shush", "enough"})
+THANK_YOU_WORDS = frozenset({"thanks", "ty", "thx", "thnx"})
+THANK_YOU_PAIRS = frozenset({("thank", "you"), ("thank", "u")})
+# Whole utterances that end the voice conversation
+EXIT_COMMANDS = frozenset({'quit', 'exit', 'goodbye', 'bye'})
+# Substrings of a reply that already answered a "thank you"
+WELCOME_PHRASES = ('welcome', 'pleasure', 'glad to help', 'happy to help', 'anytime')
+
+def is_interrupt_command(text_lower: str) -> bool:
+    """True if a (lowercased) transcript asks Daisy to stop talking"""
+    return not INTERRUPT_WORDS.isdisjoint(WORD_RE.findall(text_lower))
+
+def is_thank_you(text_lower: str) -> bool:
+    """True if a (lowercased) transcript is some form of 'thank you'"""
+    words = WORD_RE.findall(text_lower)
+    return not THANK_YOU_WORDS.isdisjoint(words) or not THANK_YOU_PAIRS.isdisjoint(zip(words, words[1:]))
+
+# System prompt used while the user speaks Greek
+GREEK_SYSTEM_PROMPT = """Είσαι η Daisy, μια φιλική και εξυπηρετική προσωπική βοηθός AI.
+Έχεις μια ζεστή, επαγγελματική και ελαφρώς συνομιλητική προσωπικότητα.
+Βοηθάς με εργασίες, απαντάς σε ερωτήσεις και συμμετέχεις σε φυσικές συνομιλίες.
+Κρατά τις απαντήσεις σου συνοπτικές αλλά φιλικές. Χρησιμοποίησε φυσικά πρότυπα ομιλίας.
+
+🚨 ΚΡΙΣΙΜΕΣ ΟΔΗΓΙΕΣ ΓΛΩΣΣΑΣ:
+- ΠΡΕΠΕΙ να απαντάς ΟΛΟΚΛΗΡΩΤΙΚΑ στα ΕΛΛΗΝΙΚΑ - ΚΑΘΕ ΛΕΞΗ
+- Χρησιμοποίησε ΣΩΣΤΗ ΕΛΛΗΝΙΚΗ ΓΡΑΜΜΑΤΙΚΗ - σωστές κλίσεις, άρθρα, προτάσεις
+- Μίλα σαν ΕΛΛΗΝΑΣ - όχι μετάφραση, φυσική ελληνική ομιλία
+- ΜΗΝ χρησιμοποιείς Αγγλικά - ΜΟΝΟ Ελληνικά"""
+
+# Streamed LLM text is passed on in sentence-sized pieces: flushed at sentence-ending
+# punctuation or a newline, or once this many characters are pending
+SENTENCE_END_RE = re.compile(r'[.!?…\n]')
+STREAM_FLUSH_CHARS = 80
+
+# Fixed fallback replies - Piper renders them once and the audio is replayed
+CANNED_REPLIES = (
+    "I'm sorry, I couldn't generate a response.",
+    "I'm sorry, I couldn't generate a response. Please try again.",
+    "I'm sorry, I couldn't understand that.",
+)
+
+def write_wav(path: Path, pcm: bytes, sample_rate: int, channels: int = 1, sample_width: int = 2):
+    """Write PCM data as a WAV file - one 44-byte header and one write, no seeking back"""
+    byte_rate = sample_rate * channels * sample_width
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + len(pcm), b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, byte_rate, channels * sample_width, 8 * sample_width,
+        b'data', len(pcm)
+    )
+    with open(path, 'wb') as f:
+        f.write(header + pcm)
+
+class ConversationMessage(NamedTuple):
+    """Represents a message in the conversation (a plain tuple - cheap to create and copy)"""
     role: str  # 'user', 'assistant', 'system'
     content: str
-    timestamp: str
+    timestamp: float  # time.time() - formatted only when the conversation is saved
 
 class DaisyAssistant:
     """Personal AI Assistant with voice and conversation capabilities"""
@@ -111,6 +258,12 @@ class DaisyAssistant:
             self.groq_model_check_time = 0
         self.GROQ_MODEL_CHECK_INTERVAL = 3600  # Re-check working model every hour
         
+        # OpenAI fallback model that worked after the configured one 404'd - the configured
+        # model is only retried once this expires (same hourly cache as Groq)
+        self.openai_working_model = self.config.get("openai_working_model")
+        self.openai_model_check_time = self.config.get("openai_model_check_time", 0)
+        self.OPENAI_MODEL_CHECK_INTERVAL = 3600
+        
         if GROQ_AVAILABLE and groq_api_key:
             try:
                 self.groq_client = Groq(api_key=groq_api_key)
@@ -120,9 +273,13 @@ class DaisyAssistant:
         elif GROQ_AVAILABLE and not groq_api_key:
             print("⚠️  Groq API key not found (optional fallback)")
         
-        # Conversation history
-        self.conversation_history: List[ConversationMessage] = []
+        # Conversation history - system prompts are pinned at the front, the rest is a
+        # bounded deque so the oldest message drops off on its own
         self.max_history = 50  # Keep last 50 messages
+        self._system_msgs: List[ConversationMessage] = []
+        self._chat_msgs = deque(maxlen=self.max_history - 1)
+        # The same history as LLM API messages, kept in step so no turn has to rebuild it
+        self._llm_messages: List[Dict] = []
         
         # Voice recognition
         self.recognizer = sr.Recognizer()
@@ -135,14 +292,42 @@ class DaisyAssistant:
             if not PYAUDIO_AVAILABLE:
                 print("   Note: Install portaudio for full voice support: brew install portaudio")
         self.is_listening = False
+        # Ambient noise calibration is refreshed periodically, not on every turn
+        # (the recognizer's dynamic energy threshold tracks drift in between)
+        self._last_calibration = 0.0
+        self.CALIBRATION_INTERVAL = 60  # seconds
+        # Runs the Google backup transcription alongside Whisper
+        self._asr_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ASRBackup")
         
         # Audio playback control (for interruption)
         self.current_audio_process = None
         self.is_speaking = False
+        # WAV replies play through pyaudio output streams opened once per format - afplay
+        # initialises the audio device again for every clip
+        self.stream_playback = PYAUDIO_AVAILABLE and self.config.get("stream_playback", True)
+        self._pyaudio = None
+        self._output_streams: Dict[Tuple[int, int, int], "pyaudio.Stream"] = {}
+        # PIDs of the say/afplay processes we started - signalled directly on interrupt
+        self._child_pids: set = set()
+        self._child_pids_lock = threading.Lock()
         
         # Interrupt handling (event-based for better responsiveness)
         self.interrupt_event = threading.Event()
         self.interrupt_detected = False
+        # Set for a whole conversation turn - the VAD listener waits for playback until it ends
+        self._turn_active = threading.Event()
+        # Self-pipe that wakes the playback wait - written on interrupt and when the player exits
+        self._intr_r, self._intr_w = os.pipe()
+        os.set_blocking(self._intr_r, False)
+        os.set_blocking(self._intr_w, False)
+        # Terminal state is read once - every cbreak playback restores these settings
+        self._stdin_is_tty = sys.stdin.isatty()
+        self._saved_termios = None
+        if self._stdin_is_tty:
+            try:
+                self._saved_termios = termios.tcgetattr(sys.stdin)
+            except termios.error:
+                self._stdin_is_tty = False
         
         # Quota check caching (avoid checking every request)
         self.openai_quota_exceeded = False
@@ -159,6 +344,17 @@ class DaisyAssistant:
         self.tts_engine = self.config.get("tts_engine", "piper")  # piper, coqui, openai, say
         self.piper_available = self._check_piper_available()
         self.coqui_available = self._check_coqui_available()
+        # Loaded Coqui models by name - loading one takes seconds, synthesis doesn't
+        self._coqui_models = {}
+        self._coqui_lock = threading.Lock()
+        # Loaded Piper voices and resolved model paths by model name
+        self._piper_voices = {}
+        self._piper_paths = {}
+        self._piper_lock = threading.Lock()
+        # Long-lived piper CLI processes by model path, fed one JSON line per utterance
+        self._piper_procs: Dict[str, subprocess.Popen] = {}
+        self._piper_cli_lock = threading.Lock()
+        atexit.register(self._close_piper_processes)
         
         # Initialize system prompt (will be enhanced with language detection)
         self.base_system_prompt = self.config.get(
@@ -168,12 +364,34 @@ You have a warm, professional, and slightly conversational personality.
 You help with tasks, answer questions, and engage in natural conversations.
 Keep responses concise but friendly. Use natural speech patterns."""
         )
+        # System prompt per detected language (anything else gets the base prompt)
+        self._prompt_by_lang = {"el": GREEK_SYSTEM_PROMPT, "en": self.base_system_prompt}
         
         # Language detection and TTS model selection
         self.current_language = "en"  # Track current language
         self.greek_piper_model = self.config.get("greek_piper_model", "el_GR-rapunzelina-low")
-        self._audio_file_counter = 0  # Counter for unique audio filenames
-        self._audio_file_lock = threading.Lock()  # Lock for thread-safe counter
+        # Played audio files are deleted by one janitor thread: (delete_at, path)
+        self._reap_queue: "queue.PriorityQueue[Tuple[float, str]]" = queue.PriorityQueue()
+        threading.Thread(target=self._reap_audio_files, daemon=True, name="AudioFileJanitor").start()
+        
+        # Conversation files are encoded and written by a background thread: (path, data)
+        self._save_queue: "queue.Queue[Optional[Tuple[Path, Dict]]]" = queue.Queue()
+        self._save_writer = threading.Thread(target=self._write_conversations, daemon=True,
+                                             name="ConversationWriter")
+        self._save_writer.start()
+        atexit.register(self._flush_conversation_saves)
+        
+        # Piper audio for CANNED_REPLIES, by text (stable files reused across runs, never reaped)
+        self._tts_cache: Dict[str, str] = {}
+        
+        # Load the default Piper voice in the background so the first reply isn't kept waiting
+        if self.tts_engine == "piper" and self.piper_available:
+            threading.Thread(
+                target=self._warm_piper_voice,
+                args=(self.config.get("piper_model", "en_US-lessac-high"),),
+                daemon=True,
+                name="PiperWarmup"
+            ).start()
         
         # Initialize conversation (will update with language detection)
         self.system_prompt = self.base_system_prompt
@@ -265,30 +483,29 @@ with natural rhythm and emphasis.""",
     
     def add_message(self, role: str, content: str):
         """Add a message to conversation history"""
-        message = ConversationMessage(
-            role=role,
-            content=content,
-            timestamp=datetime.now().isoformat()
-        )
-        self.conversation_history.append(message)
-        
-        # Keep history within limit
-        if len(self.conversation_history) > self.max_history:
-            # Keep system message, remove oldest non-system messages
-            system_msgs = [m for m in self.conversation_history if m.role == 'system']
-            other_msgs = [m for m in self.conversation_history if m.role != 'system']
-            self.conversation_history = system_msgs + other_msgs[-self.max_history+1:]
+        # Keep history within limit - the full deque drops its oldest message on append
+        if len(self._chat_msgs) == self._chat_msgs.maxlen:
+            del self._llm_messages[len(self._system_msgs)]
+        self._chat_msgs.append(ConversationMessage(role, content, time.time()))
+        self._llm_messages.append({"role": role, "content": content})
+    
+    @property
+    def conversation_history(self) -> List[ConversationMessage]:
+        """Pinned system messages followed by the most recent messages"""
+        return list(chain(self._system_msgs, self._chat_msgs))
     
     def add_system_message(self, content: str):
-        """Add system message"""
-        self.add_message('system', content)
+        """Add system message (pinned at the front, never trimmed)"""
+        self._system_msgs.append(ConversationMessage('system', content, time.time()))
+        self._llm_messages.insert(len(self._system_msgs) - 1, {"role": "system", "content": content})
     
     def get_conversation_context(self) -> List[Dict]:
-        """Get conversation context for LLM"""
-        return [
-            {"role": msg.role, "content": msg.content}
-            for msg in self.conversation_history
-        ]
+        """Get conversation context for LLM
+        
+        This is the live message list - it changes as messages are added, so take a
+        copy before handing it to anything that outlives the current turn.
+        """
+        return self._llm_messages
     
     def fetch_groq_models(self) -> List[str]:
         """
@@ -380,19 +597,7 @@ with natural rhythm and emphasis.""",
                 
                 # Try the cached model first
                 try:
-                    response = self.groq_client.chat.completions.create(
-                        model=self.groq_working_model,
-                        messages=messages,
-                        temperature=0.7,
-                        max_tokens=500
-                    )
-                    
-                    assistant_message = response.choices[0].message.content
-                    # Handle None or empty response
-                    if not assistant_message or assistant_message.strip() == "":
-                        assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
-                    elif not isinstance(assistant_message, str):
-                        assistant_message = str(assistant_message)
+                    assistant_message = self._complete_reply(self.groq_client, self.groq_working_model, messages)
                     
                     # Update cache time
                     self.groq_model_check_time = time.time()
@@ -427,19 +632,7 @@ with natural rhythm and emphasis.""",
                     print(f"🔄 Trying Groq model: {model}")
                     
                     # PROVEN WORKING: Use Groq SDK for chat (same as Praiser)
-                    response = self.groq_client.chat.completions.create(
-                        model=model,
-                        messages=messages,
-                        temperature=0.7,
-                        max_tokens=500
-                    )
-                    
-                    assistant_message = response.choices[0].message.content
-                    # Handle None or empty response
-                    if not assistant_message or assistant_message.strip() == "":
-                        assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
-                    elif not isinstance(assistant_message, str):
-                        assistant_message = str(assistant_message)
+                    assistant_message = self._complete_reply(self.groq_client, model, messages)
                     
                     # Cache this working model for 1 hour (save to config)
                     self.groq_working_model = model
@@ -489,6 +682,7 @@ with natural rhythm and emphasis.""",
         self.is_speaking = False
         self.interrupt_detected = True
         self.interrupt_event.set()  # Signal interrupt event
+        self._wake_playback_wait()
         self.interrupt_time = time.time()  # Record interrupt time for cooldown
         print("\n🔇 [Stopping speech...]")
         
@@ -512,23 +706,8 @@ with natural rhythm and emphasis.""",
                 except:
                     pass
         
-        # Kill ALL say processes (force kill with -9 signal) - do this multiple times
-        for _ in range(2):  # Try twice to make sure
-            try:
-                subprocess.run(["pkill", "-9", "say"], check=False,
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except:
-                pass
-            time.sleep(0.1)  # Small delay between attempts
-        
-        # Kill afplay processes too (force kill) - try multiple times
-        for _ in range(2):
-            try:
-                subprocess.run(["pkill", "-9", "afplay"], check=False, 
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except:
-                pass
-            time.sleep(0.1)
+        # Force kill any other say/afplay process we started
+        self._kill_audio_processes()
         
         self.current_audio_process = None
         print("✅ [Speech stopped - ready to listen]")
@@ -584,15 +763,137 @@ with natural rhythm and emphasis.""",
         except:
             return False
     
+    def _piper_model_paths(self, model_name: str) -> Tuple[Optional[str], Optional[str]]:
+        """(model_path, config_path) for a Piper voice, searched once per model name"""
+        paths = self._piper_paths.get(model_name)
+        if paths is not None:
+            return paths
+        
+        # Try to find model in common locations
+        possible_model_paths = [
+            (Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}.onnx", 
+             Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}.onnx.json"),
+            (Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}" / "model.onnx",
+             Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}" / "config.json"),
+            (Path("/usr/local/share/piper/voices") / f"{model_name}.onnx",
+             Path("/usr/local/share/piper/voices") / f"{model_name}.onnx.json"),
+            (Path("/opt/homebrew/share/piper/voices") / f"{model_name}.onnx",
+             Path("/opt/homebrew/share/piper/voices") / f"{model_name}.onnx.json"),
+        ]
+        for model, config in possible_model_paths:
+            if model.exists():
+                if not config.exists():
+                    # Config might be in same directory with .json extension
+                    config = Path(str(model) + ".json")
+                paths = (str(model), str(config) if config.exists() else None)
+                # Only hits are remembered, so a voice downloaded while running is found
+                self._piper_paths[model_name] = paths
+                return paths
+        return None, None
+    
+    def _load_piper_voice(self, model_name: str):
+        """Loaded PiperVoice for model_name (cached), or None if the model isn't installed"""
+        from piper import PiperVoice
+        
+        with self._piper_lock:
+            voice = self._piper_voices.get(model_name)
+            if voice is None:
+                model_path, config_path = self._piper_model_paths(model_name)
+                if not model_path:
+                    return None
+                voice = PiperVoice.load(model_path, config_path=config_path)
+                self._piper_voices[model_name] = voice
+            return voice
+    
+    def _warm_piper_voice(self, model_name: str):
+        """Background thread: load a Piper voice and render CANNED_REPLIES before they are needed"""
+        try:
+            self._load_piper_voice(model_name)
+        except Exception:
+            pass  # The Python package isn't usable - the first reply uses the CLI fallback
+        for reply in CANNED_REPLIES:
+            if reply not in self._tts_cache:
+                self._render_canned_reply(reply)
+    
+    def _render_canned_reply(self, text: str) -> Optional[str]:
+        """Piper audio for a CANNED_REPLIES entry, in a file named after voice + text
+        
+        Rendered once and reused by later runs instead of a new temp file per launch.
+        """
+        if self.detect_language(text) == "el":
+            model_name = self.config.get("greek_piper_model", "el_GR-rapunzelina-low")
+        else:
+            model_name = self.config.get("piper_model", "en_US-lessac-high")
+        digest = hashlib.sha256(f"{model_name}|{text}".encode("utf-8")).hexdigest()[:16]
+        path = Path.home() / ".daisy" / "audio" / f"canned_{digest}.wav"
+        if not path.exists():
+            audio_file = self._piper_tts(text)
+            if not audio_file:
+                return None
+            try:
+                os.replace(audio_file, path)  # Atomic - a half-written clip is never reused
+            except OSError:
+                return audio_file  # Play it this once - reaped like any other reply
+        self._tts_cache[text] = str(path)
+        return str(path)
+    
+    def _piper_cli_tts(self, model_path: str, text: str, audio_file: Path) -> bool:
+        """Synthesize with a persistent `piper --json-input` process (model loaded once)
+        
+        Returns False if the process died, so the caller can fall back to a one-shot run.
+        """
+        request = (json.dumps({"text": text, "output_file": str(audio_file)}) + "\n").encode("utf-8")
+        with self._piper_cli_lock:
+            process = self._piper_procs.get(model_path)
+            if process is None or process.poll() is not None:
+                process = subprocess.Popen(
+                    ["piper", "--model", model_path, "--json-input"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=1 << 16
+                )
+                self._piper_procs[model_path] = process
+            try:
+                process.stdin.write(request)
+                process.stdin.flush()
+                # Piper prints the WAV path once the line has been synthesized
+                ready, _, _ = select.select([process.stdout], [], [], 30)
+                if not ready:
+                    process.kill()
+                    del self._piper_procs[model_path]
+                    raise subprocess.TimeoutExpired(process.args, 30)
+                line = process.stdout.readline()
+            except (BrokenPipeError, OSError):
+                line = b""
+            if not line:
+                del self._piper_procs[model_path]
+                return False
+        return audio_file.stat().st_size > 0
+    
+    def _close_piper_processes(self):
+        """Close the persistent piper processes (at exit)"""
+        with self._piper_cli_lock:
+            for process in self._piper_procs.values():
+                try:
+                    process.stdin.close()
+                    process.wait(timeout=2)
+                except Exception:
+                    process.kill()
+            self._piper_procs.clear()
+    
+    def _temp_audio_file(self, prefix: str, suffix: str) -> Path:
+        """Create a uniquely named audio file in ~/.daisy/audio (atomic, no lock needed)"""
+        fd, path = tempfile.mkstemp(prefix=prefix, suffix=suffix,
+                                    dir=Path.home() / ".daisy" / "audio")
+        os.close(fd)
+        return Path(path)
+    
     def _piper_tts(self, text: str) -> Optional[str]:
         """Generate speech using Piper TTS (fast, high-quality open-source TTS)"""
+        audio_file = None
         try:
-            audio_dir = Path.home() / ".daisy" / "audio"
-            # Use thread-safe counter to ensure unique filenames even when multiple threads call simultaneously
-            with self._audio_file_lock:
-                self._audio_file_counter += 1
-                counter = self._audio_file_counter
-            audio_file = audio_dir / f"daisy_piper_{int(time.time())}_{counter}.wav"
+            audio_file = self._temp_audio_file("daisy_piper_", ".wav")
             
             # Detect language and use appropriate model
             detected_lang = self.detect_language(text)
@@ -607,40 +908,15 @@ with natural rhythm and emphasis.""",
             
             # Try Python piper package first (easier to use)
             try:
-                from piper import PiperVoice
-                
-                # Try to find model in common locations
-                possible_model_paths = [
-                    (Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}.onnx", 
-                     Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}.onnx.json"),
-                    (Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}" / "model.onnx",
-                     Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}" / "config.json"),
-                    (Path("/usr/local/share/piper/voices") / f"{model_name}.onnx",
-                     Path("/usr/local/share/piper/voices") / f"{model_name}.onnx.json"),
-                    (Path("/opt/homebrew/share/piper/voices") / f"{model_name}.onnx",
-                     Path("/opt/homebrew/share/piper/voices") / f"{model_name}.onnx.json"),
-                ]
-                
-                model_path = None
-                config_path = None
-                for model, config in possible_model_paths:
-                    if model.exists():
-                        model_path = str(model)
-                        if config.exists():
-                            config_path = str(config)
-                        else:
-                            # Config might be in same directory with .json extension
-                            config_path = str(model) + ".json"
-                        break
+                # Loaded once per model, then reused for every utterance
+                voice = self._load_piper_voice(model_name)
                 
-                if model_path and Path(model_path).exists():
-                    # Use Python package
-                    voice = PiperVoice.load(model_path, config_path=config_path if Path(config_path).exists() else None)
+                if voice is not None:
                     # Synthesize returns iterable of AudioChunk
                     audio_chunks = voice.synthesize(text)
                     
-                    # Collect all audio data first
-                    all_audio_data = b""
+                    # Collect all audio data first (joined once - bytes += would copy every chunk again)
+                    audio_parts = []
                     sample_rate = None
                     sample_width = None
                     sample_channels = None
@@ -652,17 +928,12 @@ with natural rhythm and emphasis.""",
                             sample_width = audio_chunk.sample_width
                             sample_channels = audio_chunk.sample_channels
                         # AudioChunk has audio_int16_bytes attribute (not audio_bytes)
-                        all_audio_data += audio_chunk.audio_int16_bytes
+                        audio_parts.append(audio_chunk.audio_int16_bytes)
+                    all_audio_data = b"".join(audio_parts)
                     
                     # Write proper WAV file with headers
-                    import wave
-                    import struct
-                    
-                    with wave.open(str(audio_file), 'wb') as wav_file:
-                        wav_file.setnchannels(sample_channels or 1)
-                        wav_file.setsampwidth(sample_width or 2)
-                        wav_file.setframerate(sample_rate or 22050)
-                        wav_file.writeframes(all_audio_data)
+                    write_wav(audio_file, all_audio_data, sample_rate or 22050,
+                              sample_channels or 1, sample_width or 2)
                     
                     if audio_file.exists():
                         return str(audio_file)
@@ -678,82 +949,77 @@ with natural rhythm and emphasis.""",
                 traceback.print_exc()
             
             # Fallback: Try piper command-line tool
-            # Try to find model in common locations
-            possible_model_paths = [
-                Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}.onnx",
-                Path.home() / ".local" / "share" / "piper" / "voices" / f"{model_name}" / "model.onnx",
-                Path("/usr/local/share/piper/voices") / f"{model_name}.onnx",
-                Path("/opt/homebrew/share/piper/voices") / f"{model_name}.onnx",
-            ]
-            
-            model_path = None
-            for path in possible_model_paths:
-                if path.exists():
-                    model_path = str(path)
-                    break
+            model_path, _ = self._piper_model_paths(model_name)
             
             # If no model file found, try using just the model name (piper might find it)
             if not model_path:
                 print(f"⚠️  Piper model '{model_name}' not found in standard locations.")
-                print(f"   Searched: {[str(p) for p in possible_model_paths]}")
+                print(f"   Searched: ~/.local/share/piper/voices, /usr/local/share/piper/voices, /opt/homebrew/share/piper/voices")
                 print(f"   Please download the model from: https://github.com/rhasspy/piper/releases")
                 print(f"   Or install it using: python3 -m piper.download_voices {model_name}")
                 model_path = model_name  # Try anyway - piper might find it
             
+            if self._piper_cli_tts(model_path, text, audio_file):
+                return str(audio_file)
+            
+            # Persistent process failed - one-shot run to surface piper's error
             # Try piper command with stdin
+            # Bytes in, audio to the file - stdout isn't used and there's no decoding overhead
             process = subprocess.Popen(
                 ["piper", "--model", model_path, "--output_file", str(audio_file)],
                 stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True
+                bufsize=1 << 16
             )
             
-            stdout, stderr = process.communicate(input=text, timeout=30)
+            _, stderr = process.communicate(input=text.encode("utf-8"), timeout=30)
             
-            if process.returncode == 0 and audio_file.exists():
+            if process.returncode == 0 and audio_file.stat().st_size > 0:
                 return str(audio_file)
             else:
                 if stderr:
-                    print(f"⚠️  Piper TTS error: {stderr[:200]}")
-                return None
+                    print(f"⚠️  Piper TTS error: {stderr.decode('utf-8', 'replace')[:200]}")
                 
         except subprocess.TimeoutExpired:
             print("⚠️  Piper TTS timeout")
-            return None
         except FileNotFoundError:
             print("⚠️  Piper TTS not found. Install with: pip3 install piper-tts")
-            return None
         except Exception as e:
             print(f"⚠️  Piper TTS error: {e}")
-            return None
+        # Nothing to play - don't leave the empty temp file behind
+        if audio_file:
+            audio_file.unlink(missing_ok=True)
+        return None
     
     def _coqui_tts(self, text: str) -> Optional[str]:
         """Generate speech using Coqui TTS (high-quality neural TTS)"""
+        audio_file = None
         try:
             from TTS.api import TTS
             
-            audio_dir = Path.home() / ".daisy" / "audio"
-            # Use thread-safe counter to ensure unique filenames
-            with self._audio_file_lock:
-                self._audio_file_counter += 1
-                counter = self._audio_file_counter
-            audio_file = audio_dir / f"daisy_coqui_{int(time.time())}_{counter}.wav"
+            audio_file = self._temp_audio_file("daisy_coqui_", ".wav")
             
             # Use a good quality female voice
             # tts_models/en/ljspeech/tacotron2-DDC is a good option
             model_name = self.config.get("coqui_model", "tts_models/en/ljspeech/tacotron2-DDC")
             
-            tts = TTS(model_name=model_name)
+            with self._coqui_lock:
+                tts = self._coqui_models.get(model_name)
+                if tts is None:
+                    tts = TTS(model_name=model_name)
+                    self._coqui_models[model_name] = tts
             tts.tts_to_file(text=text, file_path=str(audio_file))
             
-            if audio_file.exists():
+            if audio_file.stat().st_size > 0:
                 return str(audio_file)
-            return None
             
         except Exception as e:
             print(f"⚠️  Coqui TTS error: {e}")
-            return None
+        # Nothing to play - don't leave the empty temp file behind
+        if audio_file:
+            audio_file.unlink(missing_ok=True)
+        return None
     
     def _process_text_for_natural_speech(self, text: str) -> str:
         """Minimal text cleaning - let TTS handle prosody naturally (like ChatGPT Voice)"""
@@ -765,58 +1031,22 @@ with natural rhythm and emphasis.""",
         if not text.strip():
             return "I'm sorry, I couldn't understand that."
         
+        # Short plain replies - the common case - need none of the passes below
+        if text.isascii() and not NEEDS_CLEANING_RE.search(text):
+            return text.strip()
+        
         # Remove emojis - TTS engines try to read them as words (e.g., "smiley face")
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U00002702-\U000027B0"  # dingbats
-            "\U000024C2-\U0001F251"  # enclosed characters
-            "\U0001F900-\U0001F9FF"  # supplemental symbols
-            "\U0001FA00-\U0001FA6F"  # chess symbols
-            "\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-A
-            "\U00002600-\U000026FF"  # miscellaneous symbols
-            "\U00002700-\U000027BF"  # dingbats
-            "]+",
-            flags=re.UNICODE
-        )
-        text = emoji_pattern.sub('', text)  # Remove all emojis
+        text = strip_emojis(text)  # Remove all emojis
         
         # Remove markdown tables (lines with pipes)
-        lines = text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            # Skip markdown table rows (lines with multiple pipes)
-            if line.count('|') >= 2:
-                continue
-            # Skip markdown table separators (lines with dashes and pipes)
-            if re.match(r'^[\s\|:\-]+$', line):
-                continue
-            cleaned_lines.append(line)
-        text = '\n'.join(cleaned_lines)
-        
-        # Remove markdown formatting
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Remove **bold**
-        text = re.sub(r'\*(.*?)\*', r'\1', text)  # Remove *italic*
-        text = re.sub(r'__(.*?)__', r'\1', text)  # Remove __bold__
-        text = re.sub(r'_(.*?)_', r'\1', text)  # Remove _italic_
-        text = re.sub(r'~~(.*?)~~', r'\1', text)  # Remove ~~strikethrough~~
-        text = re.sub(r'`(.*?)`', r'\1', text)  # Remove `code`
-        text = re.sub(r'```[\s\S]*?```', '', text)  # Remove code blocks
-        text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)  # Remove # headers
-        
-        # Remove special characters that TTS tries to read as words
-        text = re.sub(r'[*#_~`|]', '', text)  # Remove *, #, _, ~, `, |
-        
-        # Remove bullet points and list markers
-        text = re.sub(r'^\s*[-*+]\s+', '', text, flags=re.MULTILINE)  # Remove - * + bullets
-        text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)  # Remove numbered lists
-        
-        # Clean whitespace (but preserve natural spacing - don't manipulate punctuation)
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Remove multiple blank lines
-        text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces/tabs to single space
+        text = TABLE_LINE_RE.sub('', text)
+        
+        # Remove markdown formatting, list markers and extra whitespace
+        text = text.translate(MARKDOWN_MARKER_TABLE)
+        text = MARKDOWN_HEADER_RE.sub('', text)
+        text = text.translate(SPECIAL_CHAR_TABLE)
+        for pattern, replacement in MARKDOWN_SUBS:
+            text = pattern.sub(replacement, text)
         
         # DON'T add pauses or manipulate punctuation - let TTS handle prosody naturally!
         # Modern TTS models (Piper, OpenAI TTS) handle prosody much better than regex manipulation
@@ -830,6 +1060,8 @@ with natural rhythm and emphasis.""",
         
         # Process text for more natural speech patterns
         processed_text = self._process_text_for_natural_speech(text)
+        if not processed_text:
+            return None  # Nothing left to say (e.g. the reply was only emojis or a table)
         
         # Determine which TTS engine to use
         tts_engine = self.config.get("tts_engine", "piper")
@@ -838,11 +1070,19 @@ with natural rhythm and emphasis.""",
         # Try Piper TTS first (fast, high-quality, open-source)
         if tts_engine == "piper":
             if self.piper_available:
+                cached_file = self._tts_cache.get(processed_text)
+                if cached_file and Path(cached_file).exists():
+                    return self._play_audio_file(cached_file, keep=True)
                 print("🔊 Using Piper TTS...")
-                audio_file = self._piper_tts(processed_text)
+                if processed_text in CANNED_REPLIES:
+                    audio_file = self._render_canned_reply(processed_text)
+                else:
+                    audio_file = self._piper_tts(processed_text)
                 if audio_file:
                     print(f"✅ Piper TTS generated audio: {audio_file}")
-                    return self._play_audio_file(audio_file)
+                    # Canned clips are kept for the next run - everything else is reaped
+                    keep = self._tts_cache.get(processed_text) == audio_file
+                    return self._play_audio_file(audio_file, keep=keep)
                 else:
                     print("⚠️  Piper TTS failed, trying fallback...")
             else:
@@ -884,20 +1124,12 @@ with natural rhythm and emphasis.""",
                 )
             
                 # Save audio file
-                audio_dir = Path.home() / ".daisy" / "audio"
-                # Use thread-safe counter to ensure unique filenames
-                with self._audio_file_lock:
-                    self._audio_file_counter += 1
-                    counter = self._audio_file_counter
-                audio_file = audio_dir / f"daisy_{int(time.time())}_{counter}.mp3"
+                audio_file = self._temp_audio_file("daisy_", ".mp3")
             
-                    # Write audio to file
-                audio_data = b""
-                for chunk in response.iter_bytes():
-                    audio_data += chunk
-                
-                with open(audio_file, 'wb') as f:
-                    f.write(audio_data)
+                # Write audio to file as it arrives (no in-memory copy of the whole clip)
+                with open(audio_file, 'wb', buffering=1 << 16) as f:
+                    for chunk in response.iter_bytes():
+                        f.write(chunk)
                 
                 return self._play_audio_file(str(audio_file))
                 
@@ -914,8 +1146,8 @@ with natural rhythm and emphasis.""",
         # Final fallback: macOS say command (but with better voice options)
         return self._say_tts_fallback(processed_text)
     
-    def _play_audio_file(self, audio_file: str) -> Optional[bytes]:
-        """Play an audio file and return audio data (interruptible)"""
+    def _play_audio_file(self, audio_file: str, keep: bool = False) -> Optional[bytes]:
+        """Play an audio file and return audio data (interruptible) - deleted afterwards unless keep"""
         try:
             audio_path = Path(audio_file)
             if not audio_path.exists():
@@ -926,105 +1158,20 @@ with natural rhythm and emphasis.""",
             # Reset interrupt flags before starting
             self.interrupt_event.clear()
             self.interrupt_detected = False
-            self.current_audio_process = subprocess.Popen(
-                ["afplay", str(audio_path)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE
-            )
-            
-            # Set up keyboard interrupt detection (like 0.2.copy)
-            import sys
-            import select
-            import termios
-            import tty
-            
-            old_settings = None
-            try:
-                if sys.stdin.isatty():
-                    old_settings = termios.tcgetattr(sys.stdin)
-                    # Set to non-blocking raw mode for single character input
-                    tty.setcbreak(sys.stdin.fileno())
-            except:
-                old_settings = None
-            
-            # Poll while playing (so we can interrupt) - check more frequently like 0.2.copy
-            start_time = time.time()
-            max_duration = 300  # Max 5 minutes per response
-            
-            try:
-                # Always enter the loop - check process inside
-                while self.current_audio_process and self.current_audio_process.poll() is None:
-                    # Check for keyboard interrupt FIRST (works while audio is playing)
-                    try:
-                        if sys.stdin.isatty() and old_settings is not None:
-                            # Check if any key was pressed (non-blocking, 50ms timeout)
-                            ready, _, _ = select.select([sys.stdin], [], [], 0.05)
-                            if ready:
-                                # Key pressed - interrupt immediately
-                                char = sys.stdin.read(1)
-                                print(f"\n⌨️  [KEY PRESSED! - Stopping immediately...]")
-                                self.stop_speaking()
-                                break
-                    except (OSError, ValueError, KeyboardInterrupt):
-                        # Terminal errors - just use flags instead
-                        pass
-                    except Exception:
-                        pass  # Ignore other errors
-                    
-                    # Check for interrupt event or flags - MUST check is_speaking flag
-                    if not self.is_speaking or self.interrupt_event.is_set() or self.interrupt_detected:
-                        # Was interrupted - stop audio process immediately
-                        print("🔇 [Audio playback interrupted - stopping now]")
-                        # Force kill the audio process
-                        if self.current_audio_process and self.current_audio_process.poll() is None:
-                            try:
-                                self.current_audio_process.terminate()
-                                time.sleep(0.05)  # Very short wait
-                                if self.current_audio_process.poll() is None:
-                                    self.current_audio_process.kill()
-                                    time.sleep(0.05)
-                            except:
-                                pass
-                        # Also kill all say/afplay processes immediately
-                        try:
-                            subprocess.run(["pkill", "-9", "say"], check=False,
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                            subprocess.run(["pkill", "-9", "afplay"], check=False,
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        except:
-                            pass
-                        break
-                    
-                    # Check if audio is taking too long (might be stuck)
-                    if time.time() - start_time > max_duration:
-                        print("⚠️  [Audio playback taking too long - stopping]")
-                        self.stop_speaking()
-                        break
-                    
-                    time.sleep(0.05)  # Check every 50ms (more frequent like 0.2.copy)
-            finally:
-                # Restore terminal settings
-                if old_settings:
-                    try:
-                        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-                    except:
-                        pass
+            if not (audio_path.suffix == ".wav" and self.stream_playback and self._play_wav_stream(audio_path)):
+                self.current_audio_process = self._start_audio_process(["afplay", str(audio_path)])
+                self._wait_for_playback()
             
             self.is_speaking = False
             self.interrupt_event.clear()  # Reset interrupt event for next time
             if self.current_audio_process:
                 self.current_audio_process = None
             
-            # Read audio data if it's an MP3 (for potential future use)
-            audio_data = b""
-            if audio_path.suffix == ".mp3":
-                with open(audio_path, 'rb') as f:
-                    audio_data = f.read()
-            
             # Clean up audio file after a delay (optional)
-            threading.Timer(10.0, lambda: audio_path.unlink() if audio_path.exists() else None).start()
+            if not keep:
+                self._reap_queue.put((time.time() + 10.0, str(audio_path)))
             
-            return audio_data
+            return b""  # Callers don't use the audio bytes - don't read the file back
             
         except Exception as e:
             print(f"⚠️  Error playing audio file: {e}")
@@ -1039,6 +1186,204 @@ with natural rhythm and emphasis.""",
                 self.current_audio_process = None
             return None
     
+    def _output_stream(self, rate: int, channels: int, sample_width: int):
+        """pyaudio output stream for a WAV format, opened on first use and kept open"""
+        key = (rate, channels, sample_width)
+        stream = self._output_streams.get(key)
+        if stream is None:
+            if self._pyaudio is None:
+                self._pyaudio = pyaudio.PyAudio()
+            stream = self._pyaudio.open(
+                format=self._pyaudio.get_format_from_width(sample_width),
+                channels=channels,
+                rate=rate,
+                output=True,
+                frames_per_buffer=1024
+            )
+            self._output_streams[key] = stream
+        return stream
+    
+    def _play_wav_stream(self, audio_path: Path) -> bool:
+        """Play a WAV file through a persistent output stream (interruptible)
+        
+        Returns False if the stream can't be used, so the caller falls back to afplay.
+        """
+        try:
+            with wave.open(str(audio_path), 'rb') as wav:
+                rate, channels, sample_width = wav.getframerate(), wav.getnchannels(), wav.getsampwidth()
+                pcm = wav.readframes(wav.getnframes())
+            stream = self._output_stream(rate, channels, sample_width)
+            if stream.is_stopped():
+                stream.start_stream()
+        except Exception as e:
+            print(f"⚠️  Audio stream unavailable ({e}) - using afplay")
+            self.stream_playback = False
+            return False
+        
+        # Set up keyboard interrupt detection (same as _wait_for_playback)
+        cbreak = False
+        if self._stdin_is_tty:
+            try:
+                tty.setcbreak(sys.stdin.fileno())
+                cbreak = True
+            except (termios.error, OSError, ValueError):
+                pass
+        
+        # Written ~1024 frames at a time, so an interrupt is noticed within one chunk
+        chunk_size = 1024 * channels * sample_width
+        interrupted = False
+        try:
+            for start in range(0, len(pcm), chunk_size):
+                if not self.is_speaking or self.interrupt_event.is_set() or self.interrupt_detected:
+                    print("🔇 [Audio playback interrupted - stopping now]")
+                    interrupted = True
+                    break
+                if cbreak and select.select([sys.stdin], [], [], 0)[0]:
+                    sys.stdin.read(1)
+                    print(f"\n⌨️  [KEY PRESSED! - Stopping immediately...]")
+                    self.stop_speaking()
+                    interrupted = True
+                    break
+                stream.write(pcm[start:start + chunk_size])
+            if interrupted:
+                # Closing discards the audio already buffered in the device (stop_stream
+                # would play it out first) - _output_stream reopens it on next use
+                del self._output_streams[(rate, channels, sample_width)]
+                stream.close()
+        except OSError as e:
+            print(f"⚠️  Audio stream error: {e}")
+        finally:
+            if cbreak:
+                try:
+                    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._saved_termios)
+                except:
+                    pass
+        return True
+    
+    def _reap_audio_files(self):
+        """Janitor thread: delete played audio files once their delay has passed"""
+        while True:
+            delete_at, path = self._reap_queue.get()
+            wait = delete_at - time.time()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                Path(path).unlink(missing_ok=True)
+            except OSError:
+                pass
+    
+    def _start_audio_process(self, cmd: List[str]) -> subprocess.Popen:
+        """Start a say/afplay process and track its PID for _kill_audio_processes"""
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        with self._child_pids_lock:
+            self._child_pids.add(process.pid)
+        return process
+    
+    def _kill_audio_processes(self):
+        """SIGKILL the say/afplay processes we started (never other users' processes)"""
+        with self._child_pids_lock:
+            pids = list(self._child_pids)
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+    
+    def _wake_playback_wait(self):
+        """Wake _wait_for_playback so it re-checks the player and interrupt flags"""
+        try:
+            os.write(self._intr_w, b'x')
+        except BlockingIOError:
+            pass  # Pipe already full - a wake-up is pending anyway
+    
+    def _wait_for_playback(self):
+        """Block until the current audio process exits, a key is pressed or speech is interrupted
+        
+        Sleeps in select() on stdin and the interrupt pipe instead of polling, so it
+        uses no CPU while audio plays and reacts to an interrupt immediately.
+        """
+        process = self.current_audio_process
+        if process is None:
+            return
+        
+        # Drop wake-ups left over from earlier playback
+        try:
+            while os.read(self._intr_r, 512):
+                pass
+        except BlockingIOError:
+            pass
+        
+        def reap():
+            process.wait()
+            with self._child_pids_lock:
+                self._child_pids.discard(process.pid)
+            self._wake_playback_wait()
+        threading.Thread(target=reap, daemon=True, name="PlaybackReaper").start()
+        
+        # Set up keyboard interrupt detection (like 0.2.copy)
+        cbreak = False
+        if self._stdin_is_tty:
+            try:
+                # Set to non-blocking raw mode for single character input
+                tty.setcbreak(sys.stdin.fileno())
+                cbreak = True
+            except (termios.error, OSError, ValueError):
+                pass
+        watched = [self._intr_r] + ([sys.stdin] if cbreak else [])
+        
+        deadline = time.time() + 300  # Max 5 minutes per response
+        try:
+            while process.poll() is None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    print("⚠️  [Audio playback taking too long - stopping]")
+                    self.stop_speaking()
+                    break
+                
+                try:
+                    ready, _, _ = select.select(watched, [], [], remaining)
+                except (OSError, ValueError):
+                    # Terminal errors - fall back to waiting on the pipe only
+                    watched = [self._intr_r]
+                    continue
+                
+                # Check for keyboard interrupt FIRST (works while audio is playing)
+                if sys.stdin in ready:
+                    # Key pressed - interrupt immediately
+                    sys.stdin.read(1)
+                    print(f"\n⌨️  [KEY PRESSED! - Stopping immediately...]")
+                    self.stop_speaking()
+                    break
+                
+                if self._intr_r in ready:
+                    try:
+                        while os.read(self._intr_r, 512):
+                            pass
+                    except BlockingIOError:
+                        pass
+                
+                # Check for interrupt event or flags - MUST check is_speaking flag
+                if not self.is_speaking or self.interrupt_event.is_set() or self.interrupt_detected:
+                    # Was interrupted - stop audio process immediately
+                    print("🔇 [Audio playback interrupted - stopping now]")
+                    # Force kill the audio process
+                    if process.poll() is None:
+                        try:
+                            process.terminate()
+                            process.wait(timeout=0.05)  # Very short wait
+                        except subprocess.TimeoutExpired:
+                            process.kill()
+                    # Also kill every other say/afplay process we started
+                    self._kill_audio_processes()
+                    break
+        finally:
+            # Restore terminal settings
+            if cbreak:
+                try:
+                    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._saved_termios)
+                except:
+                    pass
+    
     def _say_tts_fallback(self, text: str) -> Optional[bytes]:
         """Fallback to macOS say command with better voice options"""
         # Always fallback to macOS say with female voice (interruptible)
@@ -1059,19 +1404,15 @@ with natural rhythm and emphasis.""",
         # These settings create a more human-like, conversational tone
         # IMPORTANT: Don't redirect stderr - let errors show, and don't use DEVNULL for say command
         try:
-            self.current_audio_process = subprocess.Popen(
-                ["say", "-v", fallback_voice, "-r", "165", text],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE
+            self.current_audio_process = self._start_audio_process(
+                ["say", "-v", fallback_voice, "-r", "165", text]
             )
         except Exception as say_error:
             print(f"⚠️  Error with say command: {say_error}")
             # Try without rate parameter as fallback
             try:
-                self.current_audio_process = subprocess.Popen(
-                    ["say", "-v", fallback_voice, text],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE
+                self.current_audio_process = self._start_audio_process(
+                    ["say", "-v", fallback_voice, text]
                 )
             except Exception as say_error2:
                 print(f"❌ Cannot use macOS say command: {say_error2}")
@@ -1080,84 +1421,7 @@ with natural rhythm and emphasis.""",
                 return None
         
         # Wait for audio to finish playing (interruptible)
-        # Poll instead of blocking wait, so we can check for interrupts
-        start_time = time.time()
-        max_duration = 300  # Max 5 minutes per response
-        
-        # Also check for keyboard input in this loop (most reliable place)
-        import sys
-        import select
-        
-        # Set stdin to non-blocking mode for keyboard detection
-        old_settings = None
-        import termios
-        import tty
-        try:
-            if sys.stdin.isatty():
-                old_settings = termios.tcgetattr(sys.stdin)
-                # Set to non-blocking raw mode for single character input
-                tty.setcbreak(sys.stdin.fileno())
-        except:
-            old_settings = None
-        
-        try:
-            # Always enter the loop - check process inside
-            while self.current_audio_process and self.current_audio_process.poll() is None:
-                # Check for keyboard interrupt FIRST (works while audio is playing)
-                try:
-                    if sys.stdin.isatty() and old_settings is not None:
-                        # Check if any key was pressed (non-blocking, 50ms timeout)
-                        ready, _, _ = select.select([sys.stdin], [], [], 0.05)
-                        if ready:
-                            # Key pressed - interrupt immediately
-                            char = sys.stdin.read(1)
-                            print(f"\n⌨️  [KEY PRESSED! - Stopping immediately...]")
-                            self.stop_speaking()
-                            break
-                except (OSError, ValueError, KeyboardInterrupt):
-                    # Terminal errors - just use flags instead
-                    pass
-                except Exception:
-                    pass  # Ignore other errors
-                
-                # Check for interrupt event or flags - MUST check is_speaking flag first
-                if not self.is_speaking or self.interrupt_event.is_set() or self.interrupt_detected:
-                    # Was interrupted - stop audio process immediately
-                    print("🔇 [Audio playback interrupted - stopping now]")
-                    # Force kill the audio process
-                    if self.current_audio_process and self.current_audio_process.poll() is None:
-                        try:
-                            self.current_audio_process.terminate()
-                            time.sleep(0.05)  # Very short wait
-                            if self.current_audio_process.poll() is None:
-                                self.current_audio_process.kill()
-                                time.sleep(0.05)
-                        except:
-                            pass
-                    # Also kill all say/afplay processes immediately
-                    try:
-                        subprocess.run(["pkill", "-9", "say"], check=False,
-                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        subprocess.run(["pkill", "-9", "afplay"], check=False,
-                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    except:
-                        pass
-                    break
-                
-                # Check if audio is taking too long (might be stuck)
-                if time.time() - start_time > max_duration:
-                    print("⚠️  [Audio playback taking too long - stopping]")
-                    self.stop_speaking()
-                    break
-                
-                time.sleep(0.05)  # Check every 50ms (more frequent like 0.2.copy)
-        finally:
-            # Restore terminal settings
-            if old_settings:
-                try:
-                    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-                except:
-                    pass
+        self._wait_for_playback()
         
         # Check if process completed successfully
         if self.current_audio_process and self.current_audio_process.returncode != 0:
@@ -1195,34 +1459,39 @@ with natural rhythm and emphasis.""",
         try:
             with self.microphone as source:
                 print("🎤 Listening...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                if time.time() - self._last_calibration > self.CALIBRATION_INTERVAL:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                    self._last_calibration = time.time()
                 audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=10)
             
             print("🔄 Processing speech with Groq Whisper...")
+            # Encode once at 16kHz/16-bit - Whisper's native rate - and upload the bytes
+            # directly as a (filename, content, type) tuple, without a BytesIO copy
+            wav_file = ("audio.wav", audio.get_wav_data(convert_rate=16000, convert_width=2), "audio/wav")
             
             # Use Groq Whisper (PROVEN WORKING - same as Praiser)
             # Groq Whisper is much better at understanding whispers and quiet speech
             if self.groq_client:
+                # Start Google as a backup at the same time, so a Groq failure doesn't
+                # add a second full round-trip (Groq's result is preferred when it works)
+                google_backup = self._asr_pool.submit(self.recognizer.recognize_google, audio)
                 try:
-                    # Convert audio to format Groq expects
-                    audio_data = io.BytesIO(audio.get_wav_data())
-                    audio_data.name = "audio.wav"
-                    
                     # Use whisper-large-v3-turbo (same model as Praiser uses)
                     transcript = self.groq_client.audio.transcriptions.create(
-                        file=audio_data,
+                        file=wav_file,
                         model="whisper-large-v3-turbo",
                         response_format="json",
                         temperature=0.2,  # Lower temperature for more accurate transcription
                     )
                     text = transcript.text
                     print(f"✅ Groq Whisper transcription successful")
+                    google_backup.cancel()
                 except Exception as e:
                     error_str = str(e)
                     print(f"⚠️  Groq Whisper failed: {error_str[:100]}")
-                    # Fallback to Google Speech Recognition
+                    # Fallback to Google Speech Recognition (already in flight)
                     try:
-                        text = self.recognizer.recognize_google(audio)
+                        text = google_backup.result()
                         print("💡 Using Google Speech (Groq fallback)")
                     except Exception as google_error:
                         print(f"❌ Google Speech also failed: {google_error}")
@@ -1231,11 +1500,9 @@ with natural rhythm and emphasis.""",
                 # No Groq client - try OpenAI Whisper as fallback
                 if self.client:
                     try:
-                        audio_data = io.BytesIO(audio.get_wav_data())
-                        audio_data.name = "audio.wav"
                         transcript = self.client.audio.transcriptions.create(
                             model="whisper-1",
-                            file=audio_data,
+                            file=wav_file,
                             language="en"
                         )
                         text = transcript.text
@@ -1261,9 +1528,8 @@ with natural rhythm and emphasis.""",
             
             # Check if user wants to interrupt/stop Daisy
             text_lower = text.lower().strip()
-            interrupt_commands = ["stop", "stop speaking", "stop talking", "quiet", "shush", "enough"]
             
-            if interruptible and any(cmd in text_lower for cmd in interrupt_commands):
+            if interruptible and is_interrupt_command(text_lower):
                 # User wants to interrupt - stop speaking immediately
                 self.stop_speaking()
                 print("🔇 [Interrupted]")
@@ -1287,34 +1553,34 @@ with natural rhythm and emphasis.""",
             return None
     
     def listen_while_speaking(self) -> Optional[str]:
-        """Listen for interruptions while Daisy is speaking"""
+        """Listen for interruptions for as long as Daisy is speaking"""
         if not self.microphone or not self.is_speaking:
             return None
         
         try:
-            # Quick listen for interrupt commands while speaking
+            # Open the microphone once for the whole utterance - entering the source
+            # opens and closes the audio stream, which costs more than a short listen
             with self.microphone as source:
-                try:
-                    # Short timeout, just checking for "stop"
-                    audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=2)
+                while self.is_speaking:
+                    try:
+                        # Short timeout, just checking for "stop"
+                        audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=2)
+                    except sr.WaitTimeoutError:
+                        # No voice detected, that's ok
+                        continue
                     
                     # Try to recognize quickly
                     try:
                         text = self.recognizer.recognize_google(audio)
-                        text_lower = text.lower().strip()
-                        
-                        # Check for interrupt commands
-                        interrupt_commands = ["stop", "stop speaking", "stop talking", "quiet", "shush", "enough"]
-                        if any(cmd in text_lower for cmd in interrupt_commands):
-                            self.stop_speaking()
-                            print("\n🔇 [Interrupted by voice command]")
-                            return None
                     except:
                         # Didn't understand, that's ok
-                        pass
-                except sr.WaitTimeoutError:
-                    # No voice detected, that's ok
-                    pass
+                        continue
+                    
+                    # Check for interrupt commands
+                    if is_interrupt_command(text.lower().strip()):
+                        self.stop_speaking()
+                        print("\n🔇 [Interrupted by voice command]")
+                        return None
         except:
             # Error listening, that's ok - Daisy keeps speaking
             pass
@@ -1325,11 +1591,14 @@ with natural rhythm and emphasis.""",
         """Detect language from text - returns 'el' for Greek, 'en' for English, etc."""
         if not text:
             return "en"
+        if text.isascii():
+            return "en"  # No Greek possible - skips both scans for most English input
         
         # Check for Greek characters (Greek Unicode ranges)
-        greek_pattern = re.compile(r'[\u0370-\u03FF\u1F00-\u1FFF]')
-        greek_char_count = len(greek_pattern.findall(text))
-        total_chars = len(re.findall(r'[a-zA-Z\u0370-\u03FF\u1F00-\u1FFF]', text))
+        greek_char_count = sum(map(len, GREEK_RE.findall(text)))
+        if not greek_char_count:
+            return "en"  # No Greek at all - no need to count the other letters
+        total_chars = sum(map(len, LETTER_RE.findall(text)))
         
         # If significant Greek characters, it's Greek
         if total_chars > 0 and (greek_char_count / total_chars) > 0.3:
@@ -1339,30 +1608,87 @@ with natural rhythm and emphasis.""",
     
     def update_system_prompt_for_language(self, language: str):
         """Update system prompt to match user's language"""
-        if language == "el":
-            # Greek system prompt
-            self.system_prompt = """Είσαι η Daisy, μια φιλική και εξυπηρετική προσωπική βοηθός AI.
-Έχεις μια ζεστή, επαγγελματική και ελαφρώς συνομιλητική προσωπικότητα.
-Βοηθάς με εργασίες, απαντάς σε ερωτήσεις και συμμετέχεις σε φυσικές συνομιλίες.
-Κρατά τις απαντήσεις σου συνοπτικές αλλά φιλικές. Χρησιμοποίησε φυσικά πρότυπα ομιλίας.
-
-🚨 ΚΡΙΣΙΜΕΣ ΟΔΗΓΙΕΣ ΓΛΩΣΣΑΣ:
-- ΠΡΕΠΕΙ να απαντάς ΟΛΟΚΛΗΡΩΤΙΚΑ στα ΕΛΛΗΝΙΚΑ - ΚΑΘΕ ΛΕΞΗ
-- Χρησιμοποίησε ΣΩΣΤΗ ΕΛΛΗΝΙΚΗ ΓΡΑΜΜΑΤΙΚΗ - σωστές κλίσεις, άρθρα, προτάσεις
-- Μίλα σαν ΕΛΛΗΝΑΣ - όχι μετάφραση, φυσική ελληνική ομιλία
-- ΜΗΝ χρησιμοποιείς Αγγλικά - ΜΟΝΟ Ελληνικά"""
-        else:
-            # English system prompt
-            self.system_prompt = self.base_system_prompt
+        self.system_prompt = self._prompt_by_lang.get(language, self.base_system_prompt)
         
         # Update system message in conversation
-        if self.conversation_history and self.conversation_history[0].role == 'system':
-            self.conversation_history[0].content = self.system_prompt
+        if self._system_msgs:
+            self._system_msgs[0] = self._system_msgs[0]._replace(content=self.system_prompt)
+            self._llm_messages[0] = {"role": "system", "content": self.system_prompt}
         else:
-            # Remove old system message and add new one
-            self.conversation_history = [msg for msg in self.conversation_history if msg.role != 'system']
             self.add_system_message(self.system_prompt)
     
+    def _stream_reply(self, client, model: str, messages: List[Dict], **kwargs):
+        """Stream one chat completion, yielding text a sentence at a time - returns the full reply
+        
+        An empty reply is replaced by the "couldn't generate" message, which is yielded too.
+        """
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=500,
+            stream=True,
+            **kwargs
+        )
+        
+        # Collected in a list and joined once - += on a string that is also being
+        # yielded can't reliably be done in place and may copy the reply every token
+        parts = []
+        # Tokens arrive a few characters at a time - coalesce them so consumers resume
+        # once per sentence instead of once per token
+        flushed = 0  # parts before this index have been yielded
+        pending_len = 0
+        for chunk in stream:
+            content = chunk.choices[0].delta.content
+            if content:
+                parts.append(content)
+                pending_len += len(content)
+                if pending_len >= STREAM_FLUSH_CHARS or SENTENCE_END_RE.search(content):
+                    yield "".join(parts[flushed:])
+                    flushed = len(parts)
+                    pending_len = 0
+        if flushed < len(parts):
+            yield "".join(parts[flushed:])
+        
+        full_response = "".join(parts)
+        if not full_response.strip():
+            full_response = "I'm sorry, I couldn't generate a response. Please try again."
+            yield full_response
+        return full_response
+    
+    def _complete_reply(self, client, model: str, messages: List[Dict], **kwargs) -> str:
+        """Get one (non-streamed) chat completion, replacing an empty reply"""
+        response = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=500,
+            **kwargs
+        )
+        assistant_message = response.choices[0].message.content
+        if not assistant_message or not str(assistant_message).strip():
+            return "I'm sorry, I couldn't generate a response. Please try again."
+        return assistant_message if isinstance(assistant_message, str) else str(assistant_message)
+    
+    def _openai_model(self) -> str:
+        """OpenAI model to use - the cached working fallback while fresh, else the configured one"""
+        if self.openai_working_model and \
+                time.time() - self.openai_model_check_time < self.OPENAI_MODEL_CHECK_INTERVAL:
+            return self.openai_working_model
+        return self.config.get("llm_model", "gpt-3.5-turbo")
+    
+    def _cache_openai_model(self, model: str):
+        """Remember a working fallback model for an hour (saved to config, llm_model is kept)"""
+        self.openai_working_model = model
+        self.openai_model_check_time = time.time()
+        self.config["openai_working_model"] = model
+        self.config["openai_model_check_time"] = self.openai_model_check_time
+        self.save_config()
+    
+    def _prompt_cache_key(self) -> str:
+        """OpenAI prompt cache key - requests with the same system prompt share cached prefill"""
+        return f"daisy-sys-{self.current_language}"
+    
     def stream_llm_response(self, user_input: str):
         """Stream LLM response chunk by chunk (for real-time TTS like ChatGPT Voice)"""
         # Detect language from user input
@@ -1399,30 +1725,12 @@ with natural rhythm and emphasis.""",
         # Try OpenAI streaming first
         if self.client:
             try:
-                model = self.config.get("llm_model", "gpt-3.5-turbo")
-                stream = self.client.chat.completions.create(
-                    model=model,
-                    messages=messages,
-                    temperature=0.7,
-                    max_tokens=500,
-                    stream=True  # Enable streaming
+                model = self._openai_model()
+                full_response = yield from self._stream_reply(
+                    self.client, model, messages,
+                    extra_body={"prompt_cache_key": self._prompt_cache_key()}
                 )
                 
-                full_response = ""
-                for chunk in stream:
-                    if chunk.choices[0].delta.content:
-                        content = chunk.choices[0].delta.content
-                        full_response += content
-                        yield content
-                
-                # Handle None or empty response
-                if not full_response or full_response.strip() == "":
-                    full_response = "I'm sorry, I couldn't generate a response. Please try again."
-                    yield full_response
-                elif not isinstance(full_response, str):
-                    full_response = str(full_response)
-                    yield full_response
-                
                 self.add_message('assistant', full_response)
                 print(f"✅ Response from OpenAI ({model})")
                 return
@@ -1436,31 +1744,13 @@ with natural rhythm and emphasis.""",
                     print(f"❌ Model not found: {model}")
                     print(f"💡 Trying fallback model: gpt-3.5-turbo")
                     try:
-                        stream = self.client.chat.completions.create(
-                            model="gpt-3.5-turbo",
-                            messages=messages,
-                            temperature=0.7,
-                            max_tokens=500,
-                            stream=True
+                        full_response = yield from self._stream_reply(
+                            self.client, "gpt-3.5-turbo", messages,
+                            extra_body={"prompt_cache_key": self._prompt_cache_key()}
                         )
                         
-                        full_response = ""
-                        for chunk in stream:
-                            if chunk.choices[0].delta.content:
-                                content = chunk.choices[0].delta.content
-                                full_response += content
-                                yield content
-                        
-                        if not full_response or full_response.strip() == "":
-                            full_response = "I'm sorry, I couldn't generate a response. Please try again."
-                            yield full_response
-                        elif not isinstance(full_response, str):
-                            full_response = str(full_response)
-                            yield full_response
-                        
                         self.add_message('assistant', full_response)
-                        self.config['llm_model'] = 'gpt-3.5-turbo'
-                        self.save_config()
+                        self._cache_openai_model("gpt-3.5-turbo")
                         print(f"✅ Response from OpenAI (gpt-3.5-turbo fallback)")
                         return
                     except Exception as e2:
@@ -1527,27 +1817,7 @@ with natural rhythm and emphasis.""",
                 print(f"💡 Using cached Groq model: {self.groq_working_model}")
                 
                 try:
-                    stream = self.groq_client.chat.completions.create(
-                        model=self.groq_working_model,
-                        messages=messages,
-                        temperature=0.7,
-                        max_tokens=500,
-                        stream=True  # Enable streaming
-                    )
-                    
-                    full_response = ""
-                    for chunk in stream:
-                        if chunk.choices[0].delta.content:
-                            content = chunk.choices[0].delta.content
-                            full_response += content
-                            yield content
-                    
-                    if not full_response or full_response.strip() == "":
-                        full_response = "I'm sorry, I couldn't generate a response. Please try again."
-                        yield full_response
-                    elif not isinstance(full_response, str):
-                        full_response = str(full_response)
-                        yield full_response
+                    full_response = yield from self._stream_reply(self.groq_client, self.groq_working_model, messages)
                     
                     self.groq_model_check_time = time.time()
                     self.config["groq_model_check_time"] = self.groq_model_check_time
@@ -1581,27 +1851,7 @@ with natural rhythm and emphasis.""",
                 try:
                     print(f"🔄 Trying Groq model: {model}")
                     
-                    stream = self.groq_client.chat.completions.create(
-                        model=model,
-                        messages=messages,
-                        temperature=0.7,
-                        max_tokens=500,
-                        stream=True  # Enable streaming
-                    )
-                    
-                    full_response = ""
-                    for chunk in stream:
-                        if chunk.choices[0].delta.content:
-                            content = chunk.choices[0].delta.content
-                            full_response += content
-                            yield content
-                    
-                    if not full_response or full_response.strip() == "":
-                        full_response = "I'm sorry, I couldn't generate a response. Please try again."
-                        yield full_response
-                    elif not isinstance(full_response, str):
-                        full_response = str(full_response)
-                        yield full_response
+                    full_response = yield from self._stream_reply(self.groq_client, model, messages)
                     
                     # Cache this working model for 1 hour
                     self.groq_working_model = model
@@ -1669,17 +1919,11 @@ with natural rhythm and emphasis.""",
         # Try OpenAI first
         if self.client:
             try:
-                model = self.config.get("llm_model", "gpt-3.5-turbo")
-                response = self.client.chat.completions.create(
-                    model=model, messages=messages, temperature=0.7, max_tokens=500
+                model = self._openai_model()
+                assistant_message = self._complete_reply(
+                    self.client, model, messages,
+                    extra_body={"prompt_cache_key": self._prompt_cache_key()}
                 )
-                assistant_message = response.choices[0].message.content
-                
-                # Handle None or empty response
-                if not assistant_message or assistant_message.strip() == "":
-                    assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
-                elif not isinstance(assistant_message, str):
-                    assistant_message = str(assistant_message)
                 
                 self.add_message('assistant', assistant_message)
                 print(f"✅ Response from OpenAI ({model})")
@@ -1695,22 +1939,13 @@ with natural rhythm and emphasis.""",
                     print(f"💡 Trying fallback model: gpt-3.5-turbo")
                     # Try with gpt-3.5-turbo as fallback
                     try:
-                        response = self.client.chat.completions.create(
-                            model="gpt-3.5-turbo",
-                            messages=messages,
-                            temperature=0.7,
-                            max_tokens=500
+                        assistant_message = self._complete_reply(
+                            self.client, "gpt-3.5-turbo", messages,
+                            extra_body={"prompt_cache_key": self._prompt_cache_key()}
                         )
-                        assistant_message = response.choices[0].message.content
-                        # Handle None or empty response
-                        if not assistant_message or assistant_message.strip() == "":
-                            assistant_message = "I'm sorry, I couldn't generate a response. Please try again."
-                        elif not isinstance(assistant_message, str):
-                            assistant_message = str(assistant_message)
                         
                         self.add_message('assistant', assistant_message)
-                        self.config['llm_model'] = 'gpt-3.5-turbo'
-                        self.save_config()
+                        self._cache_openai_model("gpt-3.5-turbo")
                         print(f"✅ Response from OpenAI (gpt-3.5-turbo fallback)")
                         return assistant_message
                     except Exception as e2:
@@ -1767,11 +2002,36 @@ with natural rhythm and emphasis.""",
         
         conversation_data = {
             "timestamp": timestamp,
-            "messages": [asdict(msg) for msg in self.conversation_history]
+            "messages": [
+                {"role": msg.role, "content": msg.content,
+                 "timestamp": datetime.fromtimestamp(msg.timestamp).isoformat()}
+                for msg in self.conversation_history
+            ]
         }
         
-        with open(conv_file, 'w') as f:
-            json.dump(conversation_data, f, indent=2)
+        # Encoding and file I/O happen on the writer thread - the voice loop doesn't wait
+        self._save_queue.put((conv_file, conversation_data))
+    
+    def _write_conversations(self):
+        """Writer thread: encode and write queued conversation snapshots (None stops it)"""
+        while True:
+            item = self._save_queue.get()
+            if item is None:
+                return
+            conv_file, conversation_data = item
+            try:
+                if ORJSON_AVAILABLE:
+                    conv_file.write_bytes(orjson.dumps(conversation_data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(conv_file, 'w') as f:
+                        json.dump(conversation_data, f, indent=2)
+            except Exception as e:
+                print(f"⚠️  Could not save conversation: {e}")
+    
+    def _flush_conversation_saves(self):
+        """Finish pending conversation writes before the process exits"""
+        self._save_queue.put(None)
+        self._save_writer.join(timeout=5)
     
     def speak_and_listen_loop(self):
         """Main conversation loop: speak, listen, respond"""
@@ -1808,7 +2068,7 @@ with natural rhythm and emphasis.""",
                     continue
                 
                 # Ignore inputs that look like keyboard escape sequences or control characters
-                if re.search(r'[\x00-\x1f\x7f-\x9f]', user_input) or user_input.startswith('^'):
+                if CONTROL_CHAR_RE.search(user_input) or user_input.startswith('^'):
                     print(f"⏭️  [Ignoring keyboard control sequence: '{user_input[:20]}']")
                     continue
                 
@@ -1818,18 +2078,11 @@ with natural rhythm and emphasis.""",
                 time_since_response = now - self.last_response_time if self.last_response_time > 0 else 999
                 
                 # Check if this is a "thank you" variant
-                thank_you_variants = [
-                    'thank you', 'thanks', 'thank you.', 'thanks.', 'thank you!', 'thanks!',
-                    'thank you very much', 'thanks a lot', 'thank you so much', 'thanks so much',
-                    'ty', 'thx', 'thank u', 'thnx'
-                ]
-                
                 user_input_lower = user_input.lower().strip()
-                is_thank_you = any(variant in user_input_lower for variant in thank_you_variants)
                 
                 # Filter "thank you" only if we JUST responded (to prevent immediate loops)
                 # But be less aggressive - only skip if it's within 5 seconds AND we already responded to thank you
-                if is_thank_you:
+                if is_thank_you(user_input_lower):
                     # Only skip if we responded very recently (5 seconds) AND already responded to thank you
                     if time_since_response < 5.0:
                         # Check if we already responded to "thank you" in the last response
@@ -1838,8 +2091,7 @@ with natural rhythm and emphasis.""",
                             if last_assistant_msg.role == 'assistant':
                                 last_content = last_assistant_msg.content.lower()
                                 # Only skip if the last response was clearly a "you're welcome" type response
-                                welcome_phrases = ['welcome', 'pleasure', 'glad to help', 'happy to help', 'anytime']
-                                if any(phrase in last_content for phrase in welcome_phrases):
+                                if any(phrase in last_content for phrase in WELCOME_PHRASES):
                                     print(f"⏭️  [Skipping 'thank you' - just said welcome {time_since_response:.1f}s ago]")
                                     continue
                     # Skip if we interrupted very recently (3 seconds)
@@ -1853,7 +2105,7 @@ with natural rhythm and emphasis.""",
                         continue
                 
                 # Check for exit commands
-                if user_input.lower() in ['quit', 'exit', 'goodbye', 'bye']:
+                if user_input.lower() in EXIT_COMMANDS:
                     farewell = "Goodbye! It was nice talking with you."
                     print(f"🤖 Daisy: {farewell}")
                     self.text_to_speech(farewell)
@@ -1869,6 +2121,7 @@ with natural rhythm and emphasis.""",
                 self.interrupt_event.clear()
                 self.interrupt_detected = False
                 self.is_speaking = False
+                self._turn_active.set()
                 
                 # Start listening for voice interrupt BEFORE starting to speak
                 interrupt_voice = threading.Thread(
@@ -1890,8 +2143,8 @@ with natural rhythm and emphasis.""",
                 time.sleep(0.3)
                 
                 # Stream LLM response for display, then speak the ENTIRE response as ONE unit
-                buffer = ""
                 full_response = ""
+                response_parts = []
                 
                 print("🤖 Daisy: ", end="", flush=True)
                 
@@ -1902,10 +2155,9 @@ with natural rhythm and emphasis.""",
                             print("\n🔇 [Interrupted]")
                             break
                         
-                        # Add chunk to buffer
-                        buffer += chunk
-                        full_response += chunk
+                        response_parts.append(chunk)
                         print(chunk, end="", flush=True)
+                    full_response = "".join(response_parts)
                     
                     print()  # New line after streaming
                     
@@ -1923,6 +2175,7 @@ with natural rhythm and emphasis.""",
                 
                 # Record response time to prevent immediate loops
                 self.last_response_time = time.time()
+                self._turn_active.clear()  # Lets the VAD listener exit if speech never started
                 
                 # Note: Since we're speaking sequentially, text_to_speech() is blocking
                 # and will wait for each sentence to finish. The interrupt listeners
@@ -1947,6 +2200,7 @@ with natural rhythm and emphasis.""",
                 self.save_conversation()
                 break
             except Exception as e:
+                self._turn_active.clear()
                 print(f"❌ Error in conversation loop: {e}")
                 import traceback
                 traceback.print_exc()
@@ -1954,20 +2208,15 @@ with natural rhythm and emphasis.""",
     
     def _keyboard_interrupt_listener(self):
         """Background thread that listens for keyboard input to interrupt (Spacebar/Enter)"""
-        import sys
-        import select
-        import tty
-        import termios
-        
-        if not sys.stdin.isatty():
+        if not self._stdin_is_tty:
             # Not a terminal - can't listen for keyboard
             return
         
         # Try to monitor stdin for spacebar or Enter key presses
-        old_settings = None
+        cbreak = False
         try:
-            old_settings = termios.tcgetattr(sys.stdin)
             tty.setcbreak(sys.stdin.fileno())
+            cbreak = True
             
             print("⌨️  [Keyboard listener active - press Spacebar or Enter to interrupt]")
             
@@ -1993,9 +2242,9 @@ with natural rhythm and emphasis.""",
             print(f"⚠️  [Keyboard interrupt unavailable: {str(e)[:50]}]")
             pass
         finally:
-            if old_settings:
+            if cbreak:
                 try:
-                    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._saved_termios)
                 except:
                     pass
     
@@ -2064,22 +2313,23 @@ with natural rhythm and emphasis.""",
             frames_needed = 3  # Need 3 consecutive frames (~96ms) to confirm voice
             
             # Main VAD loop - keep reading while Daisy is speaking
-            # Wait a moment for is_speaking to be set
-            wait_count = 0
-            while wait_count < 10 and not self.is_speaking:
-                time.sleep(0.05)
-                wait_count += 1
+            # The reply is generated before it is spoken - wait for playback for the whole
+            # turn, reading (and dropping) frames so the input buffer stays current
+            while (self._turn_active.is_set() and not self.is_speaking
+                   and not self.interrupt_event.is_set()):
+                try:
+                    stream.read(CHUNK, exception_on_overflow=False)
+                except Exception:
+                    time.sleep(0.05)
             
             while self.is_speaking and not self.interrupt_event.is_set():
                 try:
                     frame_count += 1
                     
-                    # Check if audio process finished (only if it exists)
-                    if self.current_audio_process is None:
-                        # No audio process yet - wait a bit
-                        time.sleep(0.05)
-                        continue
-                    elif self.current_audio_process.poll() is not None:
+                    # Check if an afplay/say process finished - stream playback has none,
+                    # and clears is_speaking itself when it ends
+                    process = self.current_audio_process
+                    if process is not None and process.poll() is not None:
                         # Audio finished - exit
                         break
                     
@@ -2126,8 +2376,7 @@ with natural rhythm and emphasis.""",
                         if consecutive_voice > 0:
                             consecutive_voice = 0
                     
-                    # Small delay to avoid CPU spinning (VAD is fast enough)
-                    time.sleep(0.01)  # 10ms = ~100 checks per second
+                    # No sleep needed - stream.read() blocks until the next 32ms chunk arrives
                     
                 except Exception as e:
                     # Error in VAD loop - log and continue